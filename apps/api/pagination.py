@@ -0,0 +1,23 @@
+# apps/api/pagination.py
+from rest_framework.pagination import CursorPagination
+
+
+class ApiCursorPagination(CursorPagination):
+    """
+    Cursor pagination for every list endpoint: page N costs the same as page 1,
+    and rows inserted while a client pages are neither skipped nor repeated.
+    Viewsets set `ordering` to a column their filters can walk by index.
+    """
+
+    page_size = 25
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = "-id"
+
+
+class RemarkCursorPagination(ApiCursorPagination):
+    """
+    Remarks newest first, walking remark_timeline_idx when filtered by minute.
+    """
+
+    ordering = "-timestamp"
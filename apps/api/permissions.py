@@ -0,0 +1,20 @@
+# apps/api/permissions.py
+from rest_framework.permissions import SAFE_METHODS, BasePermission
+
+
+class IsOwnerOrReadOnly(BasePermission):
+    """
+    Anyone who can see an object may read it; only its owner (or a superuser) may change it.
+    Views name the owner with `owner_field`, a dotted path from the object to a user ID.
+    """
+
+    message = "Only the creator can change this."
+
+    def has_object_permission(self, request, view, obj):
+        if request.method in SAFE_METHODS or request.user.is_superuser:
+            return True
+
+        owner = obj
+        for attr in view.owner_field.split("."):
+            owner = getattr(owner, attr)
+        return owner == request.user.pk
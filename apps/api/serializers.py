@@ -0,0 +1,148 @@
+# apps/api/serializers.py
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import transaction
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+from apps.approval_chain.models import ApprovalChain, Approver
+from apps.minute.models import Minute
+from apps.remarks.models import Remark
+
+User = get_user_model()
+
+
+class SparseFieldsetMixin:
+    """
+    Lets clients ask for a subset of fields with `?fields=a,b,c` on read requests.
+    Applies to the top-level serializer only; unknown names are a 400.
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+        request = self.context.get("request")
+        is_top_level = self.parent is None or (
+            isinstance(self.parent, serializers.ListSerializer) and self.parent.parent is None
+        )
+        if request is None or not is_top_level or request.method not in ("GET", "HEAD"):
+            return fields
+
+        requested = [name for name in request.query_params.get("fields", "").split(",") if name]
+        if not requested:
+            return fields
+
+        unknown = sorted(set(requested) - set(fields))
+        if unknown:
+            raise ValidationError({"fields": f"Unknown field(s): {', '.join(unknown)}."})
+        return {name: field for name, field in fields.items() if name in requested}
+
+
+class MinuteSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    """
+    Minutes with their department, creator and current approver flattened in.
+    `approvers` (user IDs, in order) is only accepted on create; later changes go through /approvers/.
+    """
+
+    department_name = serializers.CharField(source="department.name", read_only=True)
+    created_by_name = serializers.CharField(source="created_by.get_full_name", read_only=True)
+    current_user = serializers.IntegerField(source="approval_chain.current_user_id", read_only=True, allow_null=True)
+    approvers = serializers.PrimaryKeyRelatedField(queryset=User.objects.all(), many=True, write_only=True)
+
+    class Meta:
+        model = Minute
+        fields = [
+            "id", "unique_id", "sheet_no", "subject", "description", "status", "department", "department_name",
+            "created_by", "created_by_name", "created_at", "approval_chain", "current_user", "approvers",
+        ]
+        read_only_fields = [
+            "unique_id", "sheet_no", "status", "department", "created_by", "created_at", "approval_chain",
+        ]
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if self.instance is not None and "approvers" in fields:
+            fields["approvers"].required = False  # ✅ Only taken on create, so a PUT leaves it out
+        return fields
+
+    def validate_approvers(self, approvers):
+        if not approvers:
+            raise ValidationError("At least one approver is required.")
+        if len({user.pk for user in approvers}) != len(approvers):
+            raise ValidationError("Each approver may appear only once.")
+        return approvers
+
+    def validate(self, attrs):
+        if self.instance is not None:
+            if "approvers" in attrs:
+                raise ValidationError({"approvers": "Change approvers through the approvers endpoint."})
+            if self.instance.status != "Pending":
+                raise ValidationError("Only pending minutes can be edited.")
+        return attrs
+
+    def create(self, validated_data):
+        user = self.context["request"].user
+        if user.department_id is None:
+            raise ValidationError("You must belong to a department to create a Minute.")
+        return Minute.objects.create_minute(created_by=user, **validated_data)
+
+
+class ApproverSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    """
+    One approver in a chain. New approvers go at the 1-based `position` (default: last).
+    """
+
+    user_name = serializers.CharField(source="user.get_full_name", read_only=True)
+    position = serializers.IntegerField(write_only=True, required=False, min_value=1)
+
+    class Meta:
+        model = Approver
+        fields = ["id", "approval_chain", "user", "user_name", "order", "status", "is_current", "position"]
+        read_only_fields = ["order", "status", "is_current"]
+
+    def validate_approval_chain(self, approval_chain):
+        request = self.context["request"]
+        if approval_chain.created_by_id != request.user.pk and not request.user.is_superuser:
+            raise ValidationError("Only the chain's creator can add approvers.")
+        if approval_chain.status == "Completed":
+            raise ValidationError("This approval chain is already completed.")
+        return approval_chain
+
+    def create(self, validated_data):
+        with transaction.atomic():
+            # ✅ Same lock as the transition engine, so ranks and the current pointer cannot race an approval
+            approval_chain = ApprovalChain.objects.select_for_update(of=("self",)).get(
+                pk=validated_data["approval_chain"].pk
+            )
+            try:
+                return approval_chain.add_approver(validated_data["user"], order=validated_data.get("position"))
+            except DjangoValidationError as e:
+                raise ValidationError({"user": e.messages})
+
+
+class ApprovalChainSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    """
+    An approval chain with its approvers in order. Only the name is writable;
+    approvers change through /approvers/ and statuses through transitions.
+    """
+
+    approvers = ApproverSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = ApprovalChain
+        fields = [
+            "id", "name", "status", "minute", "created_by", "created_at", "current_approver", "current_user",
+            "approvers",
+        ]
+        read_only_fields = ["status", "minute", "created_by", "created_at", "current_approver", "current_user"]
+
+
+class RemarkSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    """
+    A remark left with an approval action.
+    """
+
+    user_name = serializers.CharField(source="user.get_full_name", read_only=True)
+
+    class Meta:
+        model = Remark
+        fields = ["id", "minute", "approver", "user", "user_name", "action", "text", "timestamp"]
@@ -0,0 +1,169 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.approval_chain.models import Approver
+from apps.departments.models import Department
+from apps.minute.models import InboxEntry, Minute
+from apps.remarks.models import Remark
+
+User = get_user_model()
+
+
+class ApiTests(TestCase):
+    """
+    The REST API pages with cursors, trims fields on request and costs the same queries on every page.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.department = Department.objects.create(name="Computer Science", code="cs")
+        self.author = self.make_user("author")
+        self.first = self.make_user("first")
+        self.second = self.make_user("second")
+        self.outsider = self.make_user("outsider")
+        self.minutes = [
+            Minute.objects.create_minute(
+                subject=f"Minute {index}", description="Text", created_by=self.author, approvers=[self.first, self.second]
+            )
+            for index in range(3)
+        ]
+        for minute in self.minutes:
+            minute.approve(self.first, remark_text="Looks fine")
+
+        self.client = APIClient()
+        self.client.force_authenticate(self.author)
+
+    def make_user(self, username):
+        return User.objects.create_user(
+            username=username, email=f"{username}@example.com", password="password", department=self.department
+        )
+
+    def test_list_queries_do_not_grow_with_page_size(self):
+        budgets = {"api:minute-list": 1, "api:approval-chain-list": 2, "api:approver-list": 1, "api:remark-list": 1}
+        for name, budget in budgets.items():
+            with self.subTest(name), self.assertNumQueries(budget):
+                response = self.client.get(reverse(name))
+            self.assertEqual(response.status_code, 200)
+            self.assertTrue(response.json()["results"])
+
+    def test_cursor_pages(self):
+        response = self.client.get(reverse("api:minute-list"), {"page_size": 2})
+        page = response.json()
+        self.assertEqual([row["subject"] for row in page["results"]], ["Minute 2", "Minute 1"])
+
+        with self.assertNumQueries(1):
+            page = self.client.get(page["next"]).json()
+        self.assertEqual([row["subject"] for row in page["results"]], ["Minute 0"])
+        self.assertIsNone(page["next"])
+
+    def test_sparse_fields(self):
+        response = self.client.get(reverse("api:minute-list"), {"fields": "id,subject"})
+        self.assertEqual(set(response.json()["results"][0]), {"id", "subject"})
+
+        response = self.client.get(reverse("api:minute-list"), {"fields": "subject,secret"})
+        self.assertEqual(response.status_code, 400)
+
+        chain = self.minutes[0].approval_chain
+        response = self.client.get(reverse("api:approval-chain-detail", args=[chain.pk]), {"fields": "approvers"})
+        self.assertEqual(set(response.json()), {"approvers"})
+        self.assertIn("user_name", response.json()["approvers"][0])
+
+    def test_visibility(self):
+        self.client.force_authenticate(self.outsider)
+        for name in ("api:minute-list", "api:approval-chain-list", "api:approver-list", "api:remark-list"):
+            self.assertEqual(self.client.get(reverse(name)).json()["results"], [])
+        response = self.client.get(reverse("api:minute-detail", args=[self.minutes[0].pk]))
+        self.assertEqual(response.status_code, 404)
+
+        self.client.force_authenticate(self.second)
+        response = self.client.get(reverse("api:remark-list"), {"minute": self.minutes[0].pk})
+        self.assertEqual([row["text"] for row in response.json()["results"]], ["Looks fine"])
+
+    def test_filters(self):
+        response = self.client.get(reverse("api:approver-list"), {"approval_chain": self.minutes[0].approval_chain_id})
+        self.assertEqual([row["user"] for row in response.json()["results"]], [self.second.pk, self.first.pk])
+
+        response = self.client.get(reverse("api:approver-list"), {"approval_chain": "x"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_create_and_edit_minute(self):
+        response = self.client.post(
+            reverse("api:minute-list"),
+            {"subject": "New", "description": "Body", "approvers": [self.first.pk]},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 201, response.content)
+        minute = Minute.objects.get(pk=response.json()["id"])
+        self.assertEqual((minute.department, minute.approval_chain.current_user), (self.department, self.first))
+
+        url = reverse("api:minute-detail", args=[minute.pk])
+        response = self.client.patch(url, {"subject": "Renamed"}, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(InboxEntry.objects.get(minute=minute).subject, "Renamed")
+
+        self.assertEqual(self.client.patch(url, {"approvers": [self.second.pk]}, format="json").status_code, 400)
+
+        response = self.client.put(url, {"subject": "Replaced", "description": "New body"}, format="json")
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual((response.json()["subject"], response.json()["description"]), ("Replaced", "New body"))
+
+        self.client.force_authenticate(self.first)
+        self.assertEqual(self.client.patch(url, {"subject": "Hijacked"}, format="json").status_code, 403)
+
+    def test_create_minute_without_department(self):
+        User.objects.filter(pk=self.author.pk).update(department=None)
+        self.author.refresh_from_db()
+
+        response = self.client.post(
+            reverse("api:minute-list"),
+            {"subject": "New", "description": "Body", "approvers": [self.first.pk]},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), ["You must belong to a department to create a Minute."])
+
+    def test_manage_approvers(self):
+        chain = self.minutes[0].approval_chain
+        response = self.client.post(
+            reverse("api:approver-list"),
+            {"approval_chain": chain.pk, "user": self.outsider.pk, "position": 2},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 201, response.content)
+        self.assertEqual(
+            list(chain.approvers.values_list("user__username", flat=True)), ["first", "outsider", "second"]
+        )
+
+        # ✅ Removing the current approver hands the minute to the first one still pending
+        second = chain.approvers.get(user=self.second)
+        self.assertEqual(self.client.delete(reverse("api:approver-detail", args=[second.pk])).status_code, 204)
+        chain.refresh_from_db()
+        self.assertEqual(chain.current_user, self.outsider)
+        self.assertEqual(InboxEntry.objects.get(minute=self.minutes[0]).user, self.outsider)
+
+        acted = chain.approvers.get(user=self.first)
+        self.assertEqual(self.client.delete(reverse("api:approver-detail", args=[acted.pk])).status_code, 400)
+
+        self.client.force_authenticate(self.first)
+        response = self.client.post(
+            reverse("api:approver-list"), {"approval_chain": chain.pk, "user": self.second.pk}, format="json"
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_remarks_are_read_only(self):
+        response = self.client.post(reverse("api:remark-list"), {"text": "Hi"}, format="json")
+        self.assertEqual(response.status_code, 405)
+        self.assertEqual(Remark.objects.count(), 3)
+        self.assertEqual(Approver.objects.filter(is_current=True).count(), 3)
+
+    def test_token_login(self):
+        response = APIClient().post(
+            reverse("api:token_obtain_pair"), {"username": "author", "password": "password"}, format="json"
+        )
+        self.assertEqual(response.status_code, 200)
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {response.json()['access']}")
+        self.assertEqual(client.get(reverse("api:minute-list")).status_code, 200)
@@ -0,0 +1,23 @@
+# apps/api/urls.py
+from django.urls import include, path
+from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
+from rest_framework.routers import DefaultRouter
+from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
+
+from apps.api import views
+
+app_name = "api"
+
+router = DefaultRouter()
+router.register("minutes", views.MinuteViewSet, basename="minute")
+router.register("approval-chains", views.ApprovalChainViewSet, basename="approval-chain")
+router.register("approvers", views.ApproverViewSet, basename="approver")
+router.register("remarks", views.RemarkViewSet, basename="remark")
+
+urlpatterns = [
+    path("", include(router.urls)),
+    path("token/", TokenObtainPairView.as_view(), name="token_obtain_pair"),
+    path("token/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
+    path("schema/", SpectacularAPIView.as_view(), name="schema"),
+    path("docs/", SpectacularSwaggerView.as_view(url_name="api:schema"), name="docs"),
+]
@@ -0,0 +1,167 @@
+# apps/api/views.py
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import models
+from rest_framework import mixins, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from apps.api.pagination import ApiCursorPagination, RemarkCursorPagination
+from apps.api.permissions import IsOwnerOrReadOnly
+from apps.api.serializers import ApprovalChainSerializer, ApproverSerializer, MinuteSerializer, RemarkSerializer
+from apps.approval_chain.models import ApprovalChain, Approver
+from apps.minute.models import SEARCH_MAX_PAGE, Minute, MinuteSearchDocument
+from apps.remarks.models import Remark
+
+
+def visible_chains(user):
+    """
+    Approval chains the user may read: their own, those they approve on and those of their minutes.
+    """
+    if user.is_superuser:
+        return ApprovalChain.objects.all()
+    return ApprovalChain.objects.filter(
+        models.Q(created_by=user)
+        | models.Q(minute__created_by=user)
+        | models.Exists(Approver.objects.filter(approval_chain=models.OuterRef("pk"), user=user))
+    )
+
+
+class FilteredViewSetMixin:
+    """
+    Applies `?<param>=<id>` filters listed in `filter_fields` ({param: lookup}) to the queryset.
+    """
+
+    filter_fields = {}
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        for param, lookup in self.filter_fields.items():
+            value = self.request.query_params.get(param)
+            if value is None:
+                continue
+            if lookup.endswith("_id") and not value.isdigit():
+                raise ValidationError({param: "Must be an ID."})
+            queryset = queryset.filter(**{lookup: value})
+        return queryset
+
+
+class MinuteViewSet(
+    FilteredViewSetMixin,
+    mixins.ListModelMixin,
+    mixins.RetrieveModelMixin,
+    mixins.CreateModelMixin,
+    mixins.UpdateModelMixin,
+    viewsets.GenericViewSet,
+):
+    """
+    Minutes visible to the caller. Creating a minute also creates its approval chain;
+    only the creator may edit the subject and description, and only while it is pending.
+    """
+
+    serializer_class = MinuteSerializer
+    pagination_class = ApiCursorPagination
+    permission_classes = [IsAuthenticated, IsOwnerOrReadOnly]
+    owner_field = "created_by_id"
+    filter_fields = {"status": "status", "department": "department_id", "approval_chain": "approval_chain_id"}
+
+    def get_queryset(self):
+        return (
+            Minute.objects.visible_to(self.request.user)
+            .select_related("department", "created_by", "approval_chain")
+            .defer("description_page_offsets")
+        )
+
+    @action(detail=False)
+    def search(self, request):
+        """
+        Ranked full-text search (`?q=`), best match first, paged with `?page=`.
+        Each result carries its `search_rank`; `?fields=` applies as on the list.
+        """
+        query = request.query_params.get("q", "").strip()
+        page = request.query_params.get("page", "1")
+        if not query:
+            raise ValidationError({"q": "Enter something to search for."})
+        if not page.isdigit() or not 1 <= int(page) <= SEARCH_MAX_PAGE:
+            raise ValidationError({"page": f"Must be a positive integer no greater than {SEARCH_MAX_PAGE}."})
+
+        page = int(page)
+        minutes, has_next = MinuteSearchDocument.objects.search(request.user, query, page=page)
+        results = self.get_serializer(minutes, many=True).data
+        for row, minute in zip(results, minutes):
+            row["search_rank"] = minute.search_rank
+        return Response({
+            "next": replace_query_param(request.build_absolute_uri(), "page", page + 1) if has_next else None,
+            "results": results,
+        })
+
+
+class ApprovalChainViewSet(
+    FilteredViewSetMixin,
+    mixins.ListModelMixin,
+    mixins.RetrieveModelMixin,
+    mixins.UpdateModelMixin,
+    viewsets.GenericViewSet,
+):
+    """
+    Approval chains visible to the caller, each with its approvers in order.
+    Only the name can be changed here.
+    """
+
+    serializer_class = ApprovalChainSerializer
+    pagination_class = ApiCursorPagination
+    permission_classes = [IsAuthenticated, IsOwnerOrReadOnly]
+    owner_field = "created_by_id"
+    filter_fields = {"status": "status", "minute": "minute_id"}
+
+    def get_queryset(self):
+        return visible_chains(self.request.user).prefetch_related(
+            models.Prefetch("approvers", queryset=Approver.objects.select_related("user").order_by("order"))
+        )
+
+
+class ApproverViewSet(
+    FilteredViewSetMixin,
+    mixins.ListModelMixin,
+    mixins.RetrieveModelMixin,
+    mixins.CreateModelMixin,
+    mixins.DestroyModelMixin,
+    viewsets.GenericViewSet,
+):
+    """
+    Approvers of the chains visible to the caller. The chain's creator may add approvers
+    at a position and remove those who have not acted yet.
+    """
+
+    serializer_class = ApproverSerializer
+    pagination_class = ApiCursorPagination
+    permission_classes = [IsAuthenticated, IsOwnerOrReadOnly]
+    owner_field = "approval_chain.created_by_id"
+    filter_fields = {"approval_chain": "approval_chain_id", "user": "user_id"}
+
+    def get_queryset(self):
+        return Approver.objects.filter(approval_chain__in=visible_chains(self.request.user)).select_related(
+            "user", "approval_chain"
+        )
+
+    def perform_destroy(self, instance):
+        try:
+            instance.approval_chain.remove_approver(instance)
+        except DjangoValidationError as e:
+            raise ValidationError(e.messages)
+
+
+class RemarkViewSet(FilteredViewSetMixin, viewsets.ReadOnlyModelViewSet):
+    """
+    Remarks on the minutes visible to the caller, newest first.
+    Remarks are written by approval actions, never directly.
+    """
+
+    serializer_class = RemarkSerializer
+    pagination_class = RemarkCursorPagination
+    filter_fields = {"minute": "minute_id", "action": "action"}
+
+    def get_queryset(self):
+        return Remark.objects.filter(minute__in=Minute.objects.visible_to(self.request.user)).select_related("user")
@@ -26,12 +26,12 @@ class ApprovalChainAdmin(admin.ModelAdmin):
     Admin panel for Approval Chain.
     Shows status of the chain and allows searching/filtering.
     """
-    list_display = ("name", "get_linked_minute", "status", "created_by", "created_at")  # ✅ Added Linked Minute
+    list_display = ("name", "get_linked_minute", "status", "current_user", "created_by", "created_at")  # ✅ Added Linked Minute
     search_fields = ("name", "created_by__username", "minute__unique_id")
     list_filter = ("status", "created_by", "created_at")
     ordering = ("-created_at",)
 
-    readonly_fields = ("name", "get_linked_minute", "status")  # ✅ Added Linked Minute as readonly
+    readonly_fields = ("name", "get_linked_minute", "status", "current_approver", "current_user")  # ✅ Added Linked Minute as readonly
 
     inlines = [ApproverInline]  # ✅ Show Approvers inside Approval Chain admin
 
@@ -2,7 +2,6 @@ from django import forms
 from django.core.exceptions import ValidationError
 from apps.approval_chain.models import ApprovalChain, Approver
 from django.contrib.auth import get_user_model
-from django.db.models import Max
 User = get_user_model()
 
 
@@ -49,8 +48,6 @@ class ApprovalChainForm(forms.ModelForm):
 
 
 # ✅ Form to Add a Single Approver
-from django.db.models import F
-
 class ApproverForm(forms.ModelForm):
     """
     Form to add a single approver to an Approval Chain (Supports Mark-To Functionality).
@@ -80,9 +77,8 @@ class ApproverForm(forms.ModelForm):
         super().__init__(*args, **kwargs)
 
         if self.approval_chain:
-            existing_orders = self.approval_chain.approvers.values_list("order", flat=True)
-            suggested_order = max(existing_orders, default=0) + 1
-            self.fields["order"].initial = suggested_order
+            # ✅ `order` is a 1-based position; the stored rank is derived from it on save
+            self.fields["order"].initial = self.approval_chain.approvers.count() + 1
 
         # ✅ Exclude: Minute Creator, Existing Approvers, & Already Approved Users
         if self.approval_chain:
@@ -105,28 +101,20 @@ class ApproverForm(forms.ModelForm):
             raise ValidationError("Please select a valid user.")
 
         # ✅ Ensure target_order is valid
-        max_existing_order = self.approval_chain.approvers.aggregate(Max("order"))["order__max"] or 0
-        if target_order > max_existing_order + 1:
-            raise ValidationError(f"Invalid order. Maximum order allowed is {max_existing_order + 1}.")
+        approver_count = self.approval_chain.approvers.count()
+        if target_order > approver_count + 1:
+            raise ValidationError(f"Invalid order. Maximum order allowed is {approver_count + 1}.")
 
         return cleaned_data
 
-    def save(self, commit=True):
+    def save(self, approval_chain=None):
         """
-        Saves the Mark-To action by inserting a new approver.
+        Saves the Mark-To action by inserting a new approver at the chosen position
+        through `ApprovalChain.add_approver()`. Pass the chain locked with select_for_update
+        when other requests may be changing it.
         """
-        instance = super().save(commit=False)
-
-        if self.approval_chain:
-            instance.approval_chain = self.approval_chain
-
-            # ✅ Shift existing approvers down when inserting a new approver
-            if self.approval_chain.approvers.filter(order=instance.order).exists():
-                self.approval_chain.approvers.filter(order__gte=instance.order).update(order=F("order") + 1)
-
-        if commit:
-            instance.save()
-        return instance
+        approval_chain = approval_chain or self.approval_chain
+        return approval_chain.add_approver(self.cleaned_data["user"], order=self.cleaned_data["order"])
 
 
 # ✅ Form to Add Multiple Approvers at Once
@@ -153,32 +141,3 @@ class BulkApproverForm(forms.Form):
             self.fields["users"].queryset = available_users
             if not available_users.exists():
                 self.fields["users"].help_text = "No available users to add."
-
-    def save(self):
-        """
-        Bulk save selected approvers in FIFO order.
-        """
-        if not self.approval_chain:
-            raise ValidationError("Approval chain not found.")
-
-        selected_users = self.cleaned_data["users"]
-        selection_order = self.cleaned_data["order"]
-
-        # ✅ Convert order string to a list of IDs
-        selection_order_list = list(map(int, selection_order.split(","))) if selection_order else []
-
-        # ✅ Assign order based on selection sequence
-        new_approvers = []
-        for idx, user in enumerate(selected_users):
-            order_number = selection_order_list[idx] if idx < len(selection_order_list) else idx + 1
-            new_approvers.append(
-                Approver(
-                    approval_chain=self.approval_chain,
-                    user=user,
-                    order=order_number,
-                    status="Pending",
-                    is_current=(order_number == 1)
-                )
-            )
-
-        Approver.objects.bulk_create(new_approvers)
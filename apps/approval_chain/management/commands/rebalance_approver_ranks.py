@@ -0,0 +1,47 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.approval_chain.models import ORDER_GAP, ApprovalChain, Approver
+
+
+class Command(BaseCommand):
+    """
+    Background maintenance for sparse approver ranks.
+    Inserts halve the gap between neighbours; once a chain's smallest gap drops below
+    `--min-gap`, its ranks are spread back out to multiples of ORDER_GAP.
+    """
+
+    help = "Rebalances approver ranks in chains whose gaps are running out."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--min-gap",
+            type=int,
+            default=ORDER_GAP // 64,
+            help="Rebalance chains with any two neighbouring ranks closer than this.",
+        )
+        parser.add_argument("--dry-run", action="store_true", help="Only report the chains that need it.")
+
+    def handle(self, *args, **options):
+        crowded = set()
+        previous_chain, previous_rank = None, 0
+
+        ranks = Approver.objects.order_by("approval_chain_id", "order").values_list("approval_chain_id", "order")
+        for chain_id, rank in ranks.iterator():
+            if chain_id != previous_chain:
+                previous_chain, previous_rank = chain_id, 0
+            if rank - previous_rank < options["min_gap"]:
+                crowded.add(chain_id)
+            previous_rank = rank
+
+        if not options["dry_run"]:
+            for chain_id in sorted(crowded):
+                with transaction.atomic():
+                    # ✅ Same lock as the transition engine, so no approval interleaves with the renumbering
+                    approval_chain = ApprovalChain.objects.select_for_update(of=("self",)).get(pk=chain_id)
+                    approval_chain.rebalance_ranks()
+
+        if options["dry_run"]:
+            self.stdout.write(f"{len(crowded)} chain(s) need rebalancing.")
+        else:
+            self.stdout.write(self.style.SUCCESS(f"Rebalanced {len(crowded)} chain(s)."))
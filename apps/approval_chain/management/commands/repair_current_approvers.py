@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import OuterRef, Subquery
+
+from apps.approval_chain.models import ApprovalChain, Approver
+
+
+class Command(BaseCommand):
+    """
+    Rebuilds `ApprovalChain.current_approver` / `current_user` from the Approver rows.
+    The transition engine keeps them in sync; this repairs chains edited by hand
+    (admin, shell, raw SQL) or restored from an older backup.
+    """
+
+    help = "Repairs the denormalized current-approver pointer on approval chains."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true", help="Only report the chains that are out of sync.")
+
+    def handle(self, *args, **options):
+        current = Approver.objects.filter(approval_chain=OuterRef("pk"), is_current=True).order_by("order")
+        chains = ApprovalChain.objects.annotate(
+            expected_approver=Subquery(current.values("pk")[:1]),
+            expected_user=Subquery(current.values("user_id")[:1]),
+        )
+        stale_ids = [
+            chain_id
+            for chain_id, approver_id, user_id, expected_approver, expected_user in chains.values_list(
+                "pk", "current_approver_id", "current_user_id", "expected_approver", "expected_user"
+            ).iterator()
+            if (approver_id, user_id) != (expected_approver, expected_user)
+        ]
+
+        if not options["dry_run"]:
+            for chain_id in stale_ids:
+                with transaction.atomic():
+                    # ✅ Same lock as the transition engine, so the pointer cannot race an approval
+                    ApprovalChain.objects.select_for_update(of=("self",)).get(pk=chain_id).sync_current_approver()
+
+        if options["dry_run"]:
+            self.stdout.write(f"{len(stale_ids)} chain(s) out of sync.")
+        else:
+            self.stdout.write(self.style.SUCCESS(f"Repaired {len(stale_ids)} chain(s)."))
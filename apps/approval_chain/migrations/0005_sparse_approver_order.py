@@ -0,0 +1,62 @@
+# Generated by Django 5.1.4 on 2026-10-18 13:55
+
+from django.conf import settings
+from django.db import migrations, models
+
+ORDER_GAP = 1024
+
+
+def spread_orders(apps, schema_editor):
+    """
+    Renumbers every chain's approvers to multiples of ORDER_GAP, keeping their sequence.
+    Also resolves duplicate orders left by earlier bulk inserts.
+    """
+    Approver = apps.get_model("approval_chain", "Approver")
+
+    chain_ids = Approver.objects.values_list("approval_chain_id", flat=True).distinct()
+    for chain_id in chain_ids:
+        approvers = list(
+            Approver.objects.filter(approval_chain_id=chain_id).order_by("order", "id")
+        )
+        for index, approver in enumerate(approvers, start=1):
+            approver.order = index * ORDER_GAP
+        Approver.objects.bulk_update(approvers, ["order"])
+
+
+def compact_orders(apps, schema_editor):
+    Approver = apps.get_model("approval_chain", "Approver")
+
+    chain_ids = Approver.objects.values_list("approval_chain_id", flat=True).distinct()
+    for chain_id in chain_ids:
+        approvers = list(
+            Approver.objects.filter(approval_chain_id=chain_id).order_by("order", "id")
+        )
+        for index, approver in enumerate(approvers, start=1):
+            approver.order = index
+        Approver.objects.bulk_update(approvers, ["order"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("approval_chain", "0004_alter_approvalchain_minute"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(spread_orders, compact_orders),
+        migrations.AlterField(
+            model_name="approver",
+            name="order",
+            field=models.PositiveIntegerField(
+                help_text="Sparse rank of this approver in the chain (multiples of ORDER_GAP, with room for inserts)."
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="approver",
+            constraint=models.UniqueConstraint(
+                fields=("approval_chain", "order"),
+                name="approver_unique_order_per_chain",
+            ),
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.1.4 on 2026-10-18 13:59
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def fill_current_approver(apps, schema_editor):
+    """
+    Points every chain at its `is_current` approver.
+    """
+    ApprovalChain = apps.get_model("approval_chain", "ApprovalChain")
+    Approver = apps.get_model("approval_chain", "Approver")
+
+    current = Approver.objects.filter(
+        approval_chain=models.OuterRef("pk"), is_current=True
+    ).order_by("order")
+    ApprovalChain.objects.update(
+        current_approver=models.Subquery(current.values("pk")[:1]),
+        current_user=models.Subquery(current.values("user_id")[:1]),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("approval_chain", "0005_sparse_approver_order"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="approvalchain",
+            name="current_approver",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="Approver the minute is currently waiting on (empty once the chain is finished).",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="approval_chain.approver",
+            ),
+        ),
+        migrations.AddField(
+            model_name="approvalchain",
+            name="current_user",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="User of the current approver, for single-lookup inbox and permission checks.",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="current_approval_chains",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.RunPython(fill_current_approver, migrations.RunPython.noop),
+    ]
@@ -3,9 +3,11 @@ from django.db import models, transaction
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
 from django.apps import apps  # ✅ Prevents circular imports
-from django.db.models import F
 User = get_user_model()
 
+# ✅ Distance between neighbouring approver ranks, leaving room to insert without renumbering
+ORDER_GAP = 1024
+
 
 class ApprovalChain(models.Model):
     """
@@ -51,34 +53,148 @@ class ApprovalChain(models.Model):
         blank=True
     )
 
+    # ✅ Denormalized pointer to the active approver, kept in sync by every transition
+    current_approver = models.ForeignKey(
+        "Approver",
+        on_delete=models.SET_NULL,
+        related_name="+",
+        null=True,
+        blank=True,
+        help_text="Approver the minute is currently waiting on (empty once the chain is finished)."
+    )
+
+    current_user = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        related_name="current_approval_chains",
+        null=True,
+        blank=True,
+        help_text="User of the current approver, for single-lookup inbox and permission checks."
+    )
+
     def __str__(self):
         return f"{self.name} - {self.status}"
 
+    def set_current_approver(self, approver):
+        """
+        Points `current_approver` / `current_user` at `approver` (or clears them) without saving.
+        """
+        self.current_approver = approver
+        self.current_user_id = approver.user_id if approver else None
+
+    def sync_current_approver(self):
+        """
+        Rebuilds the current-approver pointer from the Approver rows and saves it.
+        Used after edits that bypass the transition engine and by `repair_current_approvers`.
+        """
+        self.set_current_approver(self.approvers.filter(is_current=True).order_by("order").first())
+        self.save_current_approver()
+
+    def save_current_approver(self):
+        """
+        Saves the current-approver pointer and moves the minute's inbox row along with it.
+        """
+        self.save(update_fields=["current_approver", "current_user"])
+
+        Minute = apps.get_model("minute", "Minute")
+        InboxEntry = apps.get_model("minute", "InboxEntry")
+        InboxEntry.objects.sync(Minute.objects.filter(approval_chain=self).values_list("pk", flat=True))
+
     @transaction.atomic
     def add_approver(self, user, order=None):
         """
-        Adds an approver to the chain in a specific order.
-        If no order is given, it auto-assigns the next available order.
+        Adds an approver to the chain at a 1-based position (`order`).
+        If no order is given, the approver is appended at the end.
         Ensures the first approver is always set as `is_current=True`.
         """
-        if self.approvers.filter(user=user).exists():
-            raise ValidationError(f"{user.get_full_name()} is already an approver.")
+        approvers = list(self.approvers.order_by("order"))
 
-        max_order = self.approvers.aggregate(models.Max("order"))["order__max"] or 0
-        order = order or max_order + 1
+        if any(approver.user_id == user.pk for approver in approvers):
+            raise ValidationError(f"{user.get_full_name()} is already an approver.")
 
-        # ✅ Ensure First Approver is Always is_current=True
-        is_first = order == 1 and not self.approvers.exists()
+        position = order or len(approvers) + 1
 
         approver = Approver.objects.create(
             approval_chain=self,
             user=user,
-            order=order,
-            is_current=is_first  # ✅ First approver should always be active
+            order=self.rank_for_position(position, approvers),
+            is_current=not approvers  # ✅ First approver should always be active
         )
 
+        if approver.is_current:
+            self.set_current_approver(approver)
+            self.save_current_approver()
+
         return approver
 
+    @transaction.atomic
+    def remove_approver(self, approver):
+        """
+        Removes an approver who has not acted yet. Ranks are sparse, so the remaining
+        approvers keep theirs; if the removed approver held the minute, it passes to the
+        first approver still pending. Locks the chain like the transition engine does.
+        """
+        self.refresh_from_db(from_queryset=ApprovalChain.objects.select_for_update(of=("self",)))
+        approver = self.approvers.get(pk=approver.pk)
+
+        if approver.status != "Pending" or self.status == "Completed":
+            raise ValidationError("Only approvers who have not acted yet can be removed.")
+
+        was_current = approver.is_current or self.current_approver_id == approver.pk
+        approver.delete()
+        if was_current:
+            # ✅ Hand the minute to the first approver still pending instead of leaving it with no one
+            next_approver = self.approvers.filter(status="Pending").order_by("order").first()
+            if next_approver:
+                next_approver.is_current = True
+                next_approver.save(update_fields=["is_current"])
+            self.set_current_approver(next_approver)
+            self.save_current_approver()
+
+    def rank_for_position(self, position, approvers=None):
+        """
+        Returns the `order` rank that places a new approver at the 1-based `position`.
+        The rank sits halfway between its neighbours, so no other approver is touched;
+        only when the gap is used up are the chain's ranks rebalanced.
+        `approvers` is the chain's approvers sorted by order (fetched when omitted).
+        """
+        if approvers is None:
+            approvers = list(self.approvers.order_by("order"))
+
+        position = max(1, min(position, len(approvers) + 1))
+        before = approvers[position - 2].order if position > 1 else 0
+
+        if position > len(approvers):
+            return before + ORDER_GAP
+
+        after = approvers[position - 1].order
+        if after - before > 1:
+            return (before + after) // 2
+
+        self.rebalance_ranks(approvers)
+        return self.rank_for_position(position, approvers)
+
+    @transaction.atomic
+    def rebalance_ranks(self, approvers=None):
+        """
+        Spreads the chain's ranks back out to multiples of ORDER_GAP.
+        Ranks first move above every old and new value, so the per-chain unique
+        constraint holds after each of the two UPDATE statements.
+        """
+        if approvers is None:
+            approvers = list(self.approvers.order_by("order"))
+        if not approvers:
+            return
+
+        ceiling = max(approvers[-1].order, len(approvers) * ORDER_GAP)
+        for index, approver in enumerate(approvers, start=1):
+            approver.order = ceiling + index
+        Approver.objects.bulk_update(approvers, ["order"])
+
+        for index, approver in enumerate(approvers, start=1):
+            approver.order = index * ORDER_GAP
+        Approver.objects.bulk_update(approvers, ["order"])
+
     def get_next_approver(self, current_order):
         """
         Retrieves the next approver in the chain.
@@ -127,7 +243,9 @@ class Approver(models.Model):
         help_text="The user responsible for approving the minute."
     )
 
-    order = models.PositiveIntegerField(help_text="The order of this approver in the chain.")
+    order = models.PositiveIntegerField(
+        help_text="Sparse rank of this approver in the chain (multiples of ORDER_GAP, with room for inserts)."
+    )
     status = models.CharField(
         max_length=20,
         choices=STATUS_CHOICES,
@@ -143,116 +261,52 @@ class Approver(models.Model):
     class Meta:
         unique_together = ("approval_chain", "user")
         ordering = ["order"]
+        constraints = [
+            # ✅ Also the (approval_chain, order) index behind every ordered approver list
+            models.UniqueConstraint(fields=["approval_chain", "order"], name="approver_unique_order_per_chain"),
+        ]
+        indexes = [
+            # ✅ Partial: only the (few) active approvers, for "what is waiting on me" lookups
+            models.Index(
+                fields=["user", "status"], condition=models.Q(is_current=True), name="approver_current_user_idx"
+            ),
+        ]
 
     def __str__(self):
-        return f"{self.user.get_full_name()} - {self.status} (Order {self.order})"
+        return f"{self.user.get_full_name()} - {self.status} (Rank {self.order})"
 
-    @transaction.atomic
-    def approve(self):
+    def approve(self, remark_text=None):
         """
         Approves the minute and moves it to the next approver.
         If this is the last approver, it finalizes the minute.
         """
-        if not self.is_current:
-            raise ValidationError("You are not the current approver for this minute.")
+        from apps.approval_chain.transitions import APPROVE, apply_transition
 
-        self.status = "Approved"
-        self.is_current = False
-        self.save()
+        return apply_transition(self.approval_chain.minute, self.user, APPROVE, remark_text=remark_text)
 
-        next_approver = self.approval_chain.get_next_approver(self.order)
-
-        if next_approver:
-            next_approver.is_current = True
-            next_approver.save()
-        else:
-            # ✅ If this is the last approver, finalize the minute
-            self.approval_chain.minute.finalize_minute("Approved")
-
-    @transaction.atomic
-    def reject(self):
+    def reject(self, remark_text=None):
         """
         Rejects the minute and stops the approval chain.
         """
-        if not self.is_current:
-            raise ValidationError("You are not the current approver for this minute.")
-
-        self.status = "Rejected"
-        self.is_current = False
-        self.save()
+        from apps.approval_chain.transitions import REJECT, apply_transition
 
-        # ✅ Mark the Approval Chain & Minute as Rejected and archive it
-        self.approval_chain.status = "Completed"
-        self.approval_chain.save()
-        self.approval_chain.minute.finalize_minute("Rejected")
+        return apply_transition(self.approval_chain.minute, self.user, REJECT, remark_text=remark_text)
 
-    @transaction.atomic
-    def mark_to(self, target_user, target_order=None):
+    def mark_to(self, target_user, target_order=None, remark_text=None):
         """
-        Inserts a new approver at the specified order in the chain.
-        - If an approver already exists at that order, shifts all subsequent approvers down.
-        - Ensures the approval chain remains valid.
-        - Only one approver remains active (`is_current=True`).
+        Inserts a new approver at the specified order in the chain and hands the minute to them.
         """
-        if not self.is_current:
-            raise ValidationError("You are not the current approver for this minute.")
-
-        if self.approval_chain.approvers.filter(user=target_user).exists():
-            raise ValidationError(f"{target_user.get_full_name()} is already in the approval chain.")
-
-        max_order = self.approval_chain.approvers.aggregate(models.Max("order"))["order__max"] or 0
-        target_order = target_order or max_order + 1  # Default to the next available order
-
-        # ✅ If inserting at the last position, just append without shifting others
-        if target_order <= max_order:
-            # Shift all affected approvers down by 1 position
-            self.approval_chain.approvers.filter(order__gte=target_order).update(order=F("order") + 1)
-
-        # ✅ Add new approver at the target order
-        new_approver = Approver.objects.create(
-            approval_chain=self.approval_chain,
-            user=target_user,
-            order=target_order,
-            status="Pending",
-            is_current=False  # Initially inactive
-        )
-
-        # ✅ Update current approver status to "Marked" and deactivate
-        self.status = "Marked"
-        self.is_current = False
-        self.save()
+        from apps.approval_chain.transitions import MARK_TO, apply_transition
 
-        # ✅ Ensure only one approver remains active
-        next_approver = self.approval_chain.approvers.filter(order__gt=self.order, status="Pending").order_by(
-            "order").first()
-
-        if next_approver:
-            next_approver.is_current = True
-            next_approver.save()
-        else:
-            new_approver.is_current = True  # If no next approver, activate the new one
-            new_approver.save()
+        return apply_transition(
+            self.approval_chain.minute, self.user, MARK_TO,
+            target_user=target_user, target_order=target_order, remark_text=remark_text,
+        )
 
-    @transaction.atomic
-    def return_to(self, target_user):
+    def return_to(self, target_user, remark_text=None):
         """
         Sends the minute back to a previous approver.
         """
-        if not self.is_current:
-            raise ValidationError("You are not the current approver for this minute.")
-
-        previous_approver = self.approval_chain.approvers.filter(user=target_user, order__lt=self.order).first()
-
-        if not previous_approver:
-            raise ValidationError("The selected user is not a previous approver.")
-
-        # ✅ Deactivate current approver
-        self.is_current = False
-        self.status = "Returned"
-        self.save()
+        from apps.approval_chain.transitions import RETURN_TO, apply_transition
 
-        # ✅ Reactivate previous approver
-        previous_approver.is_current = True
-        if previous_approver.status != "Pending":
-            previous_approver.status = "Pending"
-        previous_approver.save()
+        return apply_transition(self.approval_chain.minute, self.user, RETURN_TO, target_user=target_user, remark_text=remark_text)
@@ -0,0 +1,328 @@
+import io
+import threading
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.db import DatabaseError, IntegrityError, connection, transaction
+from django.test import TestCase, TransactionTestCase
+from django.urls import reverse
+
+from apps.approval_chain.models import ORDER_GAP, ApprovalChain, Approver
+from apps.approval_chain.transitions import APPROVE, apply_transition
+from apps.departments.models import Department
+from apps.minute.models import InboxEntry, Minute
+from apps.remarks.models import Remark
+
+User = get_user_model()
+
+
+def make_department(code="CS"):
+    return Department.objects.create(name=f"Department {code}", code=code)
+
+
+def make_user(username, department=None, role="Faculty"):
+    return User.objects.create_user(
+        username=username,
+        email=f"{username}@example.com",
+        password="password",
+        role=role,
+        department=department,
+        first_name=username.title(),
+    )
+
+
+class TransitionEngineTests(TestCase):
+    """
+    Approve / reject / mark-to / return-to through the shared transition engine.
+    """
+
+    def setUp(self):
+        self.department = make_department()
+        self.creator = make_user("creator", self.department)
+        self.approvers = [make_user(f"approver{i}", self.department) for i in range(3)]
+        self.outsider = make_user("outsider", self.department)
+        self.minute = Minute.objects.create_minute(
+            subject="Subject", description="Text", created_by=self.creator, approvers=self.approvers
+        )
+
+    def chain_state(self):
+        return list(self.minute.approval_chain.approvers.values_list("user__username", "status", "is_current"))
+
+    def test_approve_moves_to_next_approver_and_records_remark(self):
+        transition = apply_transition(self.minute, self.approvers[0], APPROVE, remark_text="  Looks good  ")
+
+        self.assertEqual(transition.next_approver.user, self.approvers[1])
+        self.assertEqual(self.chain_state(), [
+            ("approver0", "Approved", False), ("approver1", "Pending", True), ("approver2", "Pending", False),
+        ])
+        remark = Remark.objects.get(minute=self.minute)
+        self.assertEqual((remark.action, remark.text, remark.user), ("Approve", "Looks good", self.approvers[0]))
+
+    def test_last_approval_finalizes_minute(self):
+        for approver in self.approvers:
+            self.minute.approve(approver)
+
+        self.minute.refresh_from_db()
+        self.assertEqual(self.minute.status, "Approved")
+        self.assertEqual(self.minute.approval_chain.status, "Completed")
+        self.assertEqual(Remark.objects.filter(minute=self.minute).count(), 3)
+
+    def test_reject_archives_minute(self):
+        self.minute.reject(self.approvers[0])
+
+        self.minute.refresh_from_db()
+        self.assertEqual(self.minute.status, "Archived")
+        self.assertEqual(self.chain_state()[0], ("approver0", "Rejected", False))
+
+        with self.assertRaises(ValidationError):
+            self.minute.approve(self.approvers[1])
+
+    def test_mark_to_inserts_and_activates_target(self):
+        transition = self.minute.mark_to(self.approvers[0], self.outsider, target_order=2)
+
+        self.assertEqual(transition.position, 2)
+        self.assertEqual(self.chain_state(), [
+            ("approver0", "Marked", False), ("outsider", "Pending", True),
+            ("approver1", "Pending", False), ("approver2", "Pending", False),
+        ])
+
+    def test_mark_to_rejects_existing_approver(self):
+        with self.assertRaises(ValidationError):
+            self.minute.mark_to(self.approvers[0], self.approvers[2])
+
+    def test_return_to_reactivates_previous_and_comes_back(self):
+        self.minute.approve(self.approvers[0])
+        self.minute.return_to(self.approvers[1], self.approvers[0])
+
+        self.assertEqual(self.chain_state()[:2], [("approver0", "Pending", True), ("approver1", "Returned", False)])
+
+        self.minute.approve(self.approvers[0])
+        self.assertEqual(self.chain_state()[1], ("approver1", "Pending", True))
+
+    def test_only_current_approver_can_act(self):
+        with self.assertRaises(ValidationError):
+            apply_transition(self.minute, self.approvers[1], APPROVE)
+
+        self.assertFalse(Remark.objects.exists())
+
+    def test_approve_statement_budget(self):
+        # Lock + approvers SELECT + approvers UPDATE + chain pointer UPDATE + remark INSERT
+        # + inbox stale SELECT/DELETE/SELECT/INSERT, inside three SAVEPOINT/RELEASE pairs.
+        with self.assertNumQueries(15):
+            apply_transition(self.minute, self.approvers[0], APPROVE)
+
+    def test_action_view_applies_transition(self):
+        self.client.force_login(self.approvers[0])
+        response = self.client.post(
+            reverse("minute:action", args=[self.minute.pk]), {"action": "approve", "remark_text": "Fine"}
+        )
+
+        self.assertRedirects(response, reverse("minute:tracking", args=[self.minute.pk]), fetch_redirect_response=False)
+        self.assertEqual(self.chain_state()[1], ("approver1", "Pending", True))
+        self.assertEqual(Remark.objects.get().text, "Fine")
+
+
+class ApprovalConcurrencyTests(TransactionTestCase):
+    """
+    Two simultaneous approvals of the same step must not both succeed.
+    """
+
+    def test_simultaneous_approvals(self):
+        if connection.vendor == "sqlite" and connection.is_in_memory_db():
+            self.skipTest("In-memory SQLite cannot serialize writers across threads.")
+
+        department = make_department()
+        creator = make_user("creator", department)
+        approvers = [make_user(f"approver{i}", department) for i in range(2)]
+        minute = Minute.objects.create_minute(
+            subject="Subject", description="Text", created_by=creator, approvers=approvers
+        )
+
+        barrier = threading.Barrier(2)
+        outcomes = []
+
+        def approve():
+            try:
+                barrier.wait()
+                apply_transition(Minute.objects.get(pk=minute.pk), approvers[0], APPROVE)
+                outcomes.append("approved")
+            except (ValidationError, DatabaseError):
+                outcomes.append("refused")
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=approve) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(outcomes), ["approved", "refused"])
+        self.assertEqual(Remark.objects.filter(minute=minute).count(), 1)
+        self.assertEqual(
+            list(minute.approval_chain.approvers.values_list("status", "is_current")),
+            [("Approved", False), ("Pending", True)],
+        )
+
+
+class SparseApproverOrderTests(TestCase):
+    """
+    Gap-based approver ranks: inserts and removals touch only the affected row.
+    """
+
+    def setUp(self):
+        self.department = make_department()
+        self.creator = make_user("creator", self.department)
+        self.approvers = [make_user(f"approver{i}", self.department) for i in range(3)]
+        self.outsider = make_user("outsider", self.department)
+        self.minute = Minute.objects.create_minute(
+            subject="Subject", description="Text", created_by=self.creator, approvers=self.approvers
+        )
+        self.chain = self.minute.approval_chain
+
+    def ranks(self):
+        return list(self.chain.approvers.values_list("user__username", "order"))
+
+    def test_mark_to_leaves_other_ranks_untouched(self):
+        before = dict(self.ranks())
+        self.minute.mark_to(self.approvers[0], self.outsider, target_order=2)
+
+        after = dict(self.ranks())
+        self.assertEqual({name: after[name] for name in before}, before)
+        self.assertEqual(
+            [name for name, _ in self.ranks()], ["approver0", "outsider", "approver1", "approver2"]
+        )
+
+    def test_remove_approver_does_not_renumber(self):
+        self.client.force_login(self.creator)
+        removed = self.chain.approvers.get(user=self.approvers[1])
+        self.client.get(reverse("approval_chain:remove_approver", args=[self.chain.pk, removed.pk]))
+
+        self.assertEqual(self.ranks(), [("approver0", ORDER_GAP), ("approver2", 3 * ORDER_GAP)])
+
+    def test_removing_current_approver_hands_minute_on(self):
+        self.client.force_login(self.creator)
+        current = self.chain.approvers.get(user=self.approvers[0])
+        self.client.get(reverse("approval_chain:remove_approver", args=[self.chain.pk, current.pk]))
+
+        self.chain.refresh_from_db()
+        self.assertEqual(self.chain.current_user, self.approvers[1])
+        self.assertTrue(self.chain.approvers.get(user=self.approvers[1]).is_current)
+        self.assertEqual(InboxEntry.objects.get(minute__approval_chain=self.chain).user, self.approvers[1])
+
+    def test_exhausted_gap_rebalances_chain(self):
+        Approver.objects.filter(approval_chain=self.chain, user=self.approvers[1]).update(order=ORDER_GAP + 1)
+
+        rank = self.chain.rank_for_position(2)
+
+        self.assertEqual(
+            self.ranks(), [("approver0", ORDER_GAP), ("approver1", 2 * ORDER_GAP), ("approver2", 3 * ORDER_GAP)]
+        )
+        self.assertEqual(rank, ORDER_GAP + ORDER_GAP // 2)
+
+    def test_ranks_are_unique_per_chain(self):
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Approver.objects.create(approval_chain=self.chain, user=self.outsider, order=ORDER_GAP)
+
+    def test_rebalance_command_spreads_crowded_chains(self):
+        Approver.objects.filter(approval_chain=self.chain, user=self.approvers[1]).update(order=ORDER_GAP + 3)
+
+        out = io.StringIO()
+        call_command("rebalance_approver_ranks", stdout=out)
+
+        self.assertIn("Rebalanced 1 chain(s).", out.getvalue())
+        self.assertEqual([rank for _, rank in self.ranks()], [ORDER_GAP, 2 * ORDER_GAP, 3 * ORDER_GAP])
+
+
+class CurrentApproverPointerTests(TestCase):
+    """
+    ApprovalChain.current_approver / current_user follow every transition.
+    """
+
+    def setUp(self):
+        self.department = make_department()
+        self.creator = make_user("creator", self.department)
+        self.approvers = [make_user(f"approver{i}", self.department) for i in range(2)]
+        self.outsider = make_user("outsider", self.department)
+        self.minute = Minute.objects.create_minute(
+            subject="Subject", description="Text", created_by=self.creator, approvers=self.approvers
+        )
+
+    def pointer(self):
+        chain = ApprovalChain.objects.get(pk=self.minute.approval_chain_id)
+        return chain.current_approver_id, chain.current_user_id
+
+    def current_row(self):
+        approver = Approver.objects.filter(approval_chain_id=self.minute.approval_chain_id, is_current=True).first()
+        return (approver.pk, approver.user_id) if approver else (None, None)
+
+    def test_pointer_follows_transitions(self):
+        self.assertEqual(self.pointer(), self.current_row())
+        self.assertEqual(self.pointer()[1], self.approvers[0].pk)
+
+        self.minute.mark_to(self.approvers[0], self.outsider)
+        self.assertEqual(self.pointer(), self.current_row())
+        self.assertEqual(self.pointer()[1], self.outsider.pk)
+
+        self.minute.return_to(self.outsider, self.approvers[0])
+        self.assertEqual(self.pointer()[1], self.approvers[0].pk)
+
+        self.minute.approve(self.approvers[0])
+        self.minute.approve(self.outsider)
+        self.minute.approve(self.approvers[1])
+        self.assertEqual(self.pointer(), (None, None))
+
+    def test_pending_approvals_uses_pointer(self):
+        other = Minute.objects.create_minute(
+            subject="Other", description="Text", created_by=self.creator, approvers=[self.approvers[1]]
+        )
+        self.client.force_login(self.approvers[1])
+
+        response = self.client.get(reverse("minute:pending_approvals"))
+
+        self.assertEqual([entry.minute_id for entry in response.context["pending_approvals"]], [other.pk])
+
+    def test_bulk_added_approvers_activate_the_first(self):
+        minute = Minute.objects.create_minute(subject="Empty", description="Text", created_by=self.creator)
+        self.client.force_login(self.creator)
+
+        self.client.post(
+            reverse("approval_chain:add_bulk_approvers", args=[minute.approval_chain_id]),
+            {"order": f"{self.approvers[1].pk}:2,{self.approvers[0].pk}:1"},
+        )
+
+        chain = ApprovalChain.objects.get(pk=minute.approval_chain_id)
+        self.assertEqual(chain.current_user_id, self.approvers[0].pk)
+        self.assertEqual(
+            list(chain.approvers.values_list("user_id", "is_current")),
+            [(self.approvers[0].pk, True), (self.approvers[1].pk, False)],
+        )
+        self.assertTrue(InboxEntry.objects.filter(minute=minute, user=self.approvers[0]).exists())
+
+    def test_single_added_approvers_take_their_position(self):
+        minute = Minute.objects.create_minute(subject="Empty", description="Text", created_by=self.creator)
+        url = reverse("approval_chain:add_approver", args=[minute.approval_chain_id])
+        self.client.force_login(self.creator)
+
+        self.client.post(url, {"user": self.approvers[1].pk, "order": 1})
+        self.client.post(url, {"user": self.approvers[0].pk, "order": 1})
+
+        chain = ApprovalChain.objects.get(pk=minute.approval_chain_id)
+        self.assertEqual(chain.current_user_id, self.approvers[1].pk)
+        self.assertEqual(
+            list(chain.approvers.order_by("order").values_list("user_id", "is_current")),
+            [(self.approvers[0].pk, False), (self.approvers[1].pk, True)],
+        )
+        self.assertTrue(InboxEntry.objects.filter(minute=minute, user=self.approvers[1]).exists())
+
+    def test_repair_command_rebuilds_stale_pointer(self):
+        ApprovalChain.objects.filter(pk=self.minute.approval_chain_id).update(
+            current_approver=None, current_user=self.outsider
+        )
+
+        out = io.StringIO()
+        call_command("repair_current_approvers", stdout=out)
+
+        self.assertIn("Repaired 1 chain(s).", out.getvalue())
+        self.assertEqual(self.pointer(), self.current_row())
@@ -0,0 +1,285 @@
+# apps/approval_chain/transitions.py
+"""
+Approval state machine shared by the models, forms and views.
+
+Every approve / reject / mark-to / return-to goes through `apply_transition()`:
+- The approval chain row is locked once (SELECT ... FOR UPDATE).
+- Its approvers are loaded in one query and the transition is planned in memory.
+- Changes are written back with a fixed number of statements, together with the remark.
+`apply_transitions()` does the same for an approve or reject across many minutes at once.
+"""
+from dataclasses import dataclass, field
+
+from django.apps import apps
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.dispatch import Signal
+
+from apps.approval_chain.models import ApprovalChain, Approver
+
+APPROVE = "approve"
+REJECT = "reject"
+MARK_TO = "mark_to"
+RETURN_TO = "return_to"
+
+# ✅ Remark.action label for each transition
+REMARK_ACTIONS = {
+    APPROVE: "Approve",
+    REJECT: "Reject",
+    MARK_TO: "Mark-To",
+    RETURN_TO: "Return-To",
+}
+
+# ✅ Actions that need nothing beyond an optional remark, so one request can apply them to many minutes
+BATCH_ACTIONS = (APPROVE, REJECT)
+BATCH_SIZE_LIMIT = 100
+
+# Sent inside the transaction once transitions are written: transitions=[Transition, ...]
+transitions_applied = Signal()
+
+
+@dataclass
+class Transition:
+    """
+    One planned (and, after `apply_transition()`, applied) state change of an approval chain.
+    """
+    minute: object
+    approval_chain: ApprovalChain
+    action: str
+    actor: object
+    acting_approver: Approver
+    target_user: object = None
+    next_approver: Approver = None  # The approver who is current afterwards (None once finalized)
+    new_approver: Approver = None  # Inserted by Mark-To
+    position: int = None  # 1-based position of the Mark-To approver in the chain
+    final_status: str = None  # Minute status when the chain completes
+    changed: list = field(default_factory=list)  # Approvers whose status/is_current changed
+    remark: object = None
+
+    @property
+    def message(self):
+        """
+        Human-readable summary for flash messages.
+        """
+        if self.action == APPROVE:
+            if self.next_approver:
+                return f"You approved the minute. Next Approver: {self.next_approver.user.get_full_name()}."
+            return "Minute has been fully approved and archived."
+        if self.action == REJECT:
+            return "Minute has been rejected and archived."
+        if self.action == MARK_TO:
+            return f"Minute assigned to {self.target_user.get_full_name()} at position {self.position}."
+        return f"Minute returned to {self.target_user.get_full_name()}."
+
+
+def apply_transition(minute, actor, action, target_user=None, target_order=None, remark_text=None):
+    """
+    Applies one transition to the minute's approval chain and records the remark.
+    - `actor` must be the current approver.
+    - Mark-To needs `target_user` (and optionally a 1-based `target_order` position).
+    - Return-To needs `target_user`, who must be an earlier approver.
+    Raises ValidationError if the transition is not allowed.
+    """
+    if not minute.approval_chain_id:
+        raise ValidationError("This minute has no approval chain linked.")
+
+    with transaction.atomic():
+        approval_chain = ApprovalChain.objects.select_for_update(of=("self",)).get(pk=minute.approval_chain_id)
+        approvers = list(approval_chain.approvers.select_related("user").order_by("order"))
+
+        transition = plan_transition(minute, approval_chain, approvers, actor, action, target_user, target_order)
+        write_transitions([transition], remark_text)
+
+    return transition
+
+
+def apply_transitions(minute_ids, actor, action, remark_text=None):
+    """
+    Applies one approve or reject to many minutes with the same number of queries as a single one:
+    - Every chain is locked in one SELECT ... FOR UPDATE, in primary-key order so batches cannot deadlock.
+    - All their approvers are loaded in one query and each transition is planned in memory.
+    - The transitions that can go ahead are written together, with the remarks bulk-inserted.
+    Returns (transitions, errors), `errors` mapping each minute ID that could not move to the reason.
+    """
+    Minute = apps.get_model("minute", "Minute")
+
+    if action not in BATCH_ACTIONS:
+        raise ValidationError("Only approve and reject can be applied to several minutes at once.")
+    minute_ids = list(dict.fromkeys(minute_ids))
+    if len(minute_ids) > BATCH_SIZE_LIMIT:
+        raise ValidationError(f"At most {BATCH_SIZE_LIMIT} minutes can be processed at once.")
+
+    with transaction.atomic():
+        minutes = Minute.objects.in_bulk(minute_ids)
+        chains = {
+            chain.pk: chain
+            for chain in ApprovalChain.objects.select_for_update(of=("self",))
+            .filter(pk__in=[minute.approval_chain_id for minute in minutes.values() if minute.approval_chain_id])
+            .order_by("pk")
+        }
+        approvers = {chain_id: [] for chain_id in chains}
+        for approver in Approver.objects.filter(approval_chain__in=list(chains)).select_related("user").order_by("order"):
+            approvers[approver.approval_chain_id].append(approver)
+
+        transitions, errors = [], {}
+        for minute_id in minute_ids:
+            minute = minutes.get(minute_id)
+            approval_chain = chains.get(minute.approval_chain_id) if minute else None
+            if not minute:
+                errors[minute_id] = "Minute not found."
+                continue
+            if not approval_chain:
+                errors[minute_id] = "This minute has no approval chain linked."
+                continue
+
+            minute.approval_chain = approval_chain
+            try:
+                transitions.append(
+                    plan_transition(minute, approval_chain, approvers[approval_chain.pk], actor, action)
+                )
+            except ValidationError as e:
+                errors[minute_id] = " ".join(e.messages)
+
+        if transitions:
+            write_transitions(transitions, remark_text)
+
+    return transitions, errors
+
+
+def plan_transition(minute, approval_chain, approvers, actor, action, target_user=None, target_order=None):
+    """
+    Works out a transition against an already locked chain and its ordered approvers,
+    updating the in-memory objects. Nothing is written, except when a Mark-To finds no
+    free rank at its position and the chain's ranks have to be rebalanced first.
+    """
+    if action not in REMARK_ACTIONS:
+        raise ValidationError("Invalid action selected.")
+
+    if minute.status != "Pending" or approval_chain.status == "Completed":
+        raise ValidationError("This minute has already been finalized.")
+
+    # ✅ Authorized through the chain's current-approver pointer
+    current = next((a for a in approvers if a.pk == approval_chain.current_approver_id), None)
+    if not current or current.user_id != actor.pk:
+        raise ValidationError("You are not the current approver for this minute.")
+
+    transition = Transition(
+        minute=minute,
+        approval_chain=approval_chain,
+        action=action,
+        actor=actor,
+        acting_approver=current,
+        target_user=target_user,
+    )
+
+    if action == APPROVE:
+        current.status, current.is_current = "Approved", False
+        transition.changed.append(current)
+        _activate_next(transition, approvers, current.order)
+
+    elif action == REJECT:
+        current.status, current.is_current = "Rejected", False
+        transition.changed.append(current)
+        transition.final_status = "Rejected"
+
+    elif action == MARK_TO:
+        if not target_user:
+            raise ValidationError("Please select a valid user.")
+        if any(a.user_id == target_user.pk for a in approvers):
+            raise ValidationError(f"{target_user.get_full_name()} is already an approver.")
+
+        position = target_order or approvers.index(current) + 2  # Default: right after the current approver
+        if not 1 <= position <= len(approvers) + 1:
+            raise ValidationError(f"Invalid order. Maximum order allowed is {len(approvers) + 1}.")
+
+        current.status, current.is_current = "Marked", False
+        transition.changed.append(current)
+        transition.position = position
+        transition.new_approver = transition.next_approver = Approver(
+            approval_chain=approval_chain,
+            user=target_user,
+            order=approval_chain.rank_for_position(position, approvers),  # ✅ No other approver moves
+            status="Pending",
+            is_current=True,
+        )
+
+    elif action == RETURN_TO:
+        previous = next(
+            (a for a in approvers if target_user and a.user_id == target_user.pk and a.order < current.order), None
+        )
+        if not previous:
+            raise ValidationError("The selected user is not a previous approver.")
+
+        current.status, current.is_current = "Returned", False
+        previous.status, previous.is_current = "Pending", True
+        transition.changed += [current, previous]
+        transition.next_approver = previous
+
+    return transition
+
+
+def _activate_next(transition, approvers, after_order):
+    """
+    Hands the minute to the next approver still waiting (Pending, or Returned after
+    sending it back), or marks it for approval when nobody is left.
+    """
+    next_approver = next((a for a in approvers if a.order > after_order and a.status in ("Pending", "Returned")), None)
+
+    if next_approver:
+        next_approver.status, next_approver.is_current = "Pending", True
+        transition.changed.append(next_approver)
+        transition.next_approver = next_approver
+    else:
+        transition.final_status = "Approved"
+
+
+def write_transitions(transitions, remark_text=None):
+    """
+    Persists planned transitions with a fixed number of statements regardless of how many
+    approvers, chains or minutes they touch, then sends `transitions_applied`.
+    `remark_text` may be a single string for all transitions or one per transition.
+    """
+    Minute = apps.get_model("minute", "Minute")
+    Remark = apps.get_model("remarks", "Remark")
+
+    with transaction.atomic():
+        new_approvers = [t.new_approver for t in transitions if t.new_approver]
+        if new_approvers:
+            Approver.objects.bulk_create(new_approvers)
+
+        changed = {a.pk: a for t in transitions for a in t.changed}
+        if changed:
+            Approver.objects.bulk_update(changed.values(), ["status", "is_current"])
+
+        # ✅ Chain status and current-approver pointer move together, in one statement
+        for t in transitions:
+            t.approval_chain.set_current_approver(t.next_approver)
+            if t.final_status:
+                t.approval_chain.status = "Completed"
+        ApprovalChain.objects.bulk_update(
+            {t.approval_chain.pk: t.approval_chain for t in transitions}.values(),
+            ["status", "current_approver", "current_user"],
+        )
+
+        finalized = [t for t in transitions if t.final_status]
+        for final_status in {t.final_status for t in finalized}:
+            minutes = [t.minute for t in finalized if t.final_status == final_status]
+            Minute.objects.filter(pk__in=[m.pk for m in minutes]).update(status=Minute.final_status_for(final_status))
+            for minute in minutes:
+                minute.status = Minute.final_status_for(final_status)
+
+        texts = remark_text if isinstance(remark_text, (list, tuple)) else [remark_text] * len(transitions)
+        remarks = Remark.objects.bulk_create([
+            Remark(
+                minute=t.minute,
+                approver=t.acting_approver,
+                user=t.actor,
+                action=REMARK_ACTIONS[t.action],
+                text=text.strip() if text and text.strip() else None,
+            )
+            for t, text in zip(transitions, texts)
+        ])
+        for t, remark in zip(transitions, remarks):
+            t.remark = remark
+
+        transitions_applied.send(sender=ApprovalChain, transitions=transitions)
@@ -8,7 +8,6 @@ from django.core.exceptions import ValidationError
 from django.contrib.auth.decorators import login_required
 from django.utils.decorators import method_decorator
 from django.contrib.auth import get_user_model
-from django.db.models import Max
 from apps.approval_chain import models
 from apps.approval_chain.models import ApprovalChain, Approver
 from apps.approval_chain.forms import ApprovalChainForm, ApproverForm, BulkApproverForm
@@ -126,14 +125,9 @@ def add_approver(request, chain_id):
         if form.is_valid():
             try:
                 with transaction.atomic():
-                    approver = form.save()
-
-                    # ✅ Ensure First Approver is Always Active
-                    if not approval_chain.approvers.filter(is_current=True).exists():
-                        first_approver = approval_chain.approvers.order_by("order").first()
-                        if first_approver:
-                            first_approver.is_current = True
-                            first_approver.save()
+                    # ✅ Lock the chain like the bulk view and the API, so concurrent adds cannot pick the same rank
+                    locked_chain = ApprovalChain.objects.select_for_update().get(pk=chain_id)
+                    form.save(approval_chain=locked_chain)  # ✅ Activates the first approver of an empty chain
 
                     messages.success(request, "Approver added successfully.")
                     return redirect("approval_chain:detail", pk=chain_id)
@@ -180,17 +174,12 @@ def add_bulk_approvers(request, chain_id):
 
         try:
             with transaction.atomic():
-                # ✅ Get the last order number (FIFO synchronization)
-                last_order = approval_chain.approvers.aggregate(Max("order"))["order__max"] or 0
-
-                for user_id, order in ordered_users:
-                    user = get_object_or_404(User, pk=user_id)
-                    Approver.objects.create(
-                        approval_chain=approval_chain,
-                        user=user,
-                        order=last_order + order,  # ✅ Ensuring the FIFO sequence is correct
-                        status="Pending"
-                    )
+                # ✅ Locked, so concurrent adds cannot pick the same rank
+                approval_chain = ApprovalChain.objects.select_for_update().get(pk=chain_id)
+
+                # ✅ Appended in the submitted order; the first one on an empty chain becomes current
+                for user_id, order in sorted(ordered_users, key=lambda pair: pair[1]):
+                    approval_chain.add_approver(get_object_or_404(User, pk=user_id))
 
                 messages.success(request, "Approvers added successfully.")
                 return redirect("approval_chain:detail", pk=chain_id)
@@ -260,16 +249,11 @@ def remove_approver(request, chain_id, approver_id):
     approver = get_object_or_404(Approver, pk=approver_id, approval_chain=approval_chain)
 
     try:
-        with transaction.atomic():
-            approver.delete()
-            messages.success(request, f"Approver {approver.user.get_full_name()} removed successfully.")
-
-            # ✅ Reorder remaining approvers in FIFO order
-            remaining_approvers = approval_chain.approvers.order_by("order")
-            for index, approver in enumerate(remaining_approvers, start=1):
-                approver.order = index
-                approver.save()
+        approval_chain.remove_approver(approver)  # ✅ Locks the chain and hands the minute on if needed
+        messages.success(request, f"Approver {approver.user.get_full_name()} removed successfully.")
 
+    except ValidationError as e:
+        messages.error(request, e.messages[0])
     except Exception as e:
         messages.error(request, f"Error removing approver: {str(e)}")
 
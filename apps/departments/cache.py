@@ -0,0 +1,53 @@
+# apps/departments/cache.py
+"""
+Cached department statistics.
+The statistics are stored together with a version counter that Department, User and
+minute-rollup writes bump, so a stale entry is never served and ETags come for free.
+"""
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+STATS_VERSION_KEY = "departments:stats:version"
+STATS_KEY = "departments:stats"
+
+
+def stats_version():
+    """
+    Returns the current statistics version, creating the counter if needed.
+    """
+    version = cache.get(STATS_VERSION_KEY)
+    if version is None:
+        cache.add(STATS_VERSION_KEY, time.time_ns(), timeout=None)  # ✅ Never restarts at a value clients have seen
+        version = cache.get(STATS_VERSION_KEY)
+    return version
+
+
+def bump_stats_version_on_commit():
+    """
+    Invalidates the cached statistics once the current transaction commits.
+    """
+    def bump():
+        try:
+            cache.incr(STATS_VERSION_KEY)
+        except ValueError:  # Not in the cache; the next read starts a new counter
+            pass
+
+    transaction.on_commit(bump)
+
+
+def cached_department_stats(build):
+    """
+    Returns (version, `build()`), rebuilding only when the version has moved on.
+    """
+    cached = cache.get_many([STATS_VERSION_KEY, STATS_KEY])
+    version = cached.get(STATS_VERSION_KEY)
+    if version is None:
+        version = stats_version()
+    elif STATS_KEY in cached and cached[STATS_KEY][0] == version:
+        return version, cached[STATS_KEY][1]
+
+    value = build()
+    cache.set(STATS_KEY, (version, value), timeout=60 * 60)
+    return version, value
@@ -1,7 +1,64 @@
+from django.apps import apps
 from django.db import models
+from django.db.models.functions import Coalesce
 from django.conf import settings  # Use AUTH_USER_MODEL for CustomUser reference
 
 
+# ✅ Fields `Department.objects.with_stats()` returns for each department (and the API may select from)
+DEPARTMENT_STATS_FIELDS = (
+    "id", "name", "code", "description", "head_of_department__username", "dean__username", "created_at",
+    "user_count", "minutes_pending", "minutes_approved", "minutes_rejected", "minutes_archived",
+)
+
+
+class DepartmentManager(models.Manager):
+    """
+    Manager for Department with the statistics behind the departments dashboard and API.
+    """
+
+    def with_stats(self):
+        """
+        Returns every department as a dict of DEPARTMENT_STATS_FIELDS in a single query:
+        user counts come from a correlated COUNT, minute counts by status from the minute rollups.
+        """
+        User = apps.get_model(settings.AUTH_USER_MODEL)
+        MinuteRollup = apps.get_model("minute", "MinuteRollup")
+
+        users = (
+            User.objects.filter(department=models.OuterRef("pk"))
+            .order_by()
+            .values("department")
+            .annotate(count=models.Count("pk"))
+            .values("count")
+        )
+        rollup = MinuteRollup.objects.filter(scope=MinuteRollup.DEPARTMENT, scope_id=models.OuterRef("pk"))
+
+        def count(subquery):
+            return Coalesce(models.Subquery(subquery[:1]), 0)
+
+        return list(
+            self.annotate(
+                user_count=count(users),
+                minutes_pending=count(rollup.values("pending")),
+                minutes_approved=count(rollup.values("approved")),
+                minutes_rejected=count(rollup.values("rejected")),
+                minutes_archived=count(rollup.values("archived")),
+            ).values(*DEPARTMENT_STATS_FIELDS)
+        )
+
+    @staticmethod
+    def summarize(departments):
+        """
+        Totals for the dashboard cards, counted over the rows `with_stats()` returned.
+        """
+        return {
+            "total_departments": len(departments),
+            "department_heads": sum(1 for d in departments if d["head_of_department__username"] is not None),
+            "departments_without_heads": sum(1 for d in departments if d["head_of_department__username"] is None),
+            "departments_without_deans": sum(1 for d in departments if d["dean__username"] is None),
+        }
+
+
 class Department(models.Model):
     """
     Represents a University Department managed within Minute Sheet 2.0.
@@ -52,6 +109,8 @@ class Department(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = DepartmentManager()
+
     class Meta:
         verbose_name = "Department"
         verbose_name_plural = "Departments"
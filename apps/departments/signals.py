@@ -0,0 +1,34 @@
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.departments.cache import bump_stats_version_on_commit
+from apps.departments.models import Department
+from apps.minute.models import rollups_recorded
+
+
+@receiver([post_save, post_delete], sender=Department)
+def invalidate_stats_on_department_change(sender, **kwargs):
+    """
+    Department edits change names, heads and deans on the dashboard.
+    """
+    bump_stats_version_on_commit()
+
+
+@receiver([post_save, post_delete], sender=settings.AUTH_USER_MODEL)
+def invalidate_stats_on_user_change(sender, update_fields=None, **kwargs):
+    """
+    Users joining, leaving or moving department change the user counts.
+    """
+    if update_fields and set(update_fields) <= {"last_login"}:
+        return  # ✅ Every login saves last_login; it changes nothing shown here
+    bump_stats_version_on_commit()
+
+
+@receiver(rollups_recorded)
+def invalidate_stats_on_minute_change(sender, department_ids, **kwargs):
+    """
+    Minutes created, completed or deleted change the per-status minute counts.
+    """
+    if department_ids:
+        bump_stats_version_on_commit()
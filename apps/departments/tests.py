@@ -1,3 +1,94 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.test import TestCase
+from django.urls import reverse
 
-# Create your tests here.
+from apps.departments.models import Department
+from apps.minute.models import Minute
+
+User = get_user_model()
+
+
+class DepartmentStatsTests(TestCase):
+    """
+    Department statistics come from one cached query that writes invalidate.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.cs = Department.objects.create(name="Computer Science", code="cs")
+        self.ee = Department.objects.create(name="Electrical", code="ee")
+        self.head = self.make_user("head", self.cs)
+        self.cs.head_of_department = self.head
+        self.cs.save()
+        self.approver = self.make_user("approver", self.cs)
+        for subject in ("One", "Two"):
+            Minute.objects.create_minute(
+                subject=subject, description="Text", created_by=self.head, approvers=[self.approver]
+            )
+        self.root = User.objects.create_superuser("root", "root@example.com", "password")
+        self.client.force_login(self.root)
+        self.url = reverse("departments:department_list_api")
+
+    @staticmethod
+    def make_user(username, department):
+        return User.objects.create_user(
+            username=username, email=f"{username}@example.com", password="password", department=department
+        )
+
+    def test_stats_in_one_query(self):
+        with self.assertNumQueries(1):
+            departments = Department.objects.with_stats()
+
+        cs = next(department for department in departments if department["code"] == "CS")
+        self.assertEqual((cs["user_count"], cs["minutes_pending"], cs["head_of_department__username"]), (2, 2, "head"))
+        self.assertEqual(
+            Department.objects.summarize(departments),
+            {
+                "total_departments": 2,
+                "department_heads": 1,
+                "departments_without_heads": 1,
+                "departments_without_deans": 2,
+            },
+        )
+
+    def test_dashboard_and_api_share_cached_stats(self):
+        self.client.get(reverse("departments:dashboard"))
+
+        with self.assertNumQueries(2):  # Session and user only
+            response = self.client.get(self.url)
+        self.assertEqual(response.json()["total_departments"], 2)
+
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse("departments:dashboard"))
+        self.assertContains(response, "Computer Science")
+
+    def test_writes_invalidate(self):
+        self.client.get(self.url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.make_user("newcomer", self.ee)
+        ee = next(d for d in self.client.get(self.url).json()["departments"] if d["code"] == "EE")
+        self.assertEqual(ee["user_count"], 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Minute.objects.filter(subject="One").get().approve(self.approver)
+        cs = next(d for d in self.client.get(self.url).json()["departments"] if d["code"] == "CS")
+        self.assertEqual((cs["minutes_pending"], cs["minutes_approved"]), (1, 1))
+
+    def test_field_selection_and_etags(self):
+        response = self.client.get(self.url, {"fields": "code,user_count"})
+        self.assertEqual(response.json()["departments"][0].keys(), {"code", "user_count"})
+
+        etag = response["ETag"]
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url, {"fields": "code,user_count"}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.ee.save()
+        response = self.client.get(self.url, {"fields": "code,user_count"}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+        self.assertEqual(self.client.get(self.url, {"fields": "code,password"}).status_code, 400)
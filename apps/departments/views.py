@@ -1,8 +1,10 @@
 from django.shortcuts import render, redirect
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.contrib import messages
-from django.http import JsonResponse
-from .models import Department
+from django.http import HttpResponseNotModified, JsonResponse
+from django.utils.http import parse_etags
+from .cache import cached_department_stats, stats_version
+from .models import DEPARTMENT_STATS_FIELDS, Department
 
 
 def is_superuser(user):
@@ -12,6 +14,17 @@ def is_superuser(user):
     return user.is_authenticated and user.is_superuser
 
 
+def department_stats():
+    """
+    Returns (version, {"departments", **summary}) from the cache, rebuilt in one query when stale.
+    """
+    def build():
+        departments = Department.objects.with_stats()
+        return {"departments": departments, **Department.objects.summarize(departments)}
+
+    return cached_department_stats(build)
+
+
 @login_required
 @user_passes_test(is_superuser)
 def department_dashboard(request):
@@ -19,37 +32,40 @@ def department_dashboard(request):
     Dashboard to view all departments and their details.
     Accessible only to superusers.
     """
-    # Fetch departments with optimized queries
-    departments = Department.objects.select_related("head_of_department", "dean").all()
-
-    context = {
-        "departments": departments,
-        "total_departments": departments.count(),
-        "department_heads": departments.filter(head_of_department__isnull=False).count(),
-        "departments_without_heads": departments.filter(head_of_department__isnull=True).count(),
-        "departments_without_deans": departments.filter(dean__isnull=True).count(),
-    }
+    # ✅ One cached query for the table and all the counters
+    _, stats = department_stats()
 
-    return render(request, "departments/dashboard.html", context)
+    return render(request, "departments/dashboard.html", stats)
 
 
 @login_required
 @user_passes_test(is_superuser)
 def department_list_api(request):
     """
-    API Endpoint: Returns a list of departments.
+    API Endpoint: Returns a list of departments with user and minute counts.
     Accessible only to superusers.
+    - `?fields=id,name,...` limits each department to the listed fields.
+    - Responses carry a version ETag; a matching If-None-Match gets 304 without touching the database.
     """
-    departments = Department.objects.all().values(
-        "id", "name", "code", "description", "head_of_department__username", "dean__username"
-    )
+    fields = [field for field in request.GET.get("fields", "").split(",") if field]
+    unknown = sorted(set(fields) - set(DEPARTMENT_STATS_FIELDS))
+    if unknown:
+        return JsonResponse(
+            {"error": f"Unknown field(s): {', '.join(unknown)}.", "fields": DEPARTMENT_STATS_FIELDS}, status=400
+        )
 
-    response_data = {
-        "departments": list(departments),
-        "total_departments": departments.count(),
-        "department_heads": Department.objects.filter(head_of_department__isnull=False).count(),
-        "departments_without_heads": Department.objects.filter(head_of_department__isnull=True).count(),
-        "departments_without_deans": Department.objects.filter(dean__isnull=True).count(),
-    }
+    etag = f'"departments-{stats_version()}"'
+    if etag in parse_etags(request.headers.get("If-None-Match", "")):
+        response = HttpResponseNotModified()
+    else:
+        version, stats = department_stats()
+        etag = f'"departments-{version}"'
+        departments = stats["departments"]
+        if fields:
+            departments = [{field: department[field] for field in fields} for department in departments]
+        response = JsonResponse({**stats, "departments": departments})
 
-    return JsonResponse(response_data, safe=False)
+    response["ETag"] = etag
+    response["Cache-Control"] = "private, no-cache"
+    response["Vary"] = "Cookie"
+    return response
@@ -1,6 +1,6 @@
 # apps/minute/admin.py
 from django.contrib import admin
-from apps.minute.models import Minute
+from apps.minute.models import InboxEntry, Minute, MinuteRollup, MinuteSequence
 from apps.approval_chain.models import ApprovalChain
 
 
@@ -42,4 +42,37 @@ class MinuteAdmin(admin.ModelAdmin):
         """
         if not obj.pk:  # Only set for new objects
             obj.created_by = request.user
+            Minute.objects.create_minute(instance=obj)  # ✅ Creates the approval chain alongside
+            return
         super().save_model(request, obj, form, change)
+
+
+@admin.register(MinuteSequence)
+class MinuteSequenceAdmin(admin.ModelAdmin):
+    """
+    Read-only view of the per-department unique ID and sheet number counters.
+    """
+    list_display = ("department", "period", "last_value")
+    list_filter = ("department",)
+    readonly_fields = ("department", "period", "last_value")
+
+
+@admin.register(InboxEntry)
+class InboxEntryAdmin(admin.ModelAdmin):
+    """
+    Read-only view of the materialized approval inbox (rebuild with `manage.py rebuild_inbox`).
+    """
+    list_display = ("unique_id", "subject", "user", "department_name", "waiting_since")
+    list_filter = ("department",)
+    search_fields = ("unique_id", "subject", "user__username")
+    readonly_fields = [field.name for field in InboxEntry._meta.fields]
+
+
+@admin.register(MinuteRollup)
+class MinuteRollupAdmin(admin.ModelAdmin):
+    """
+    Read-only view of the dashboard rollups (rebuild with `manage.py rebuild_minute_rollups`).
+    """
+    list_display = ("scope", "scope_id", "pending", "approved", "archived", "completed")
+    list_filter = ("scope",)
+    readonly_fields = [field.name for field in MinuteRollup._meta.fields]
@@ -0,0 +1,107 @@
+# apps/minute/attachments.py
+"""
+Attachment ingestion: every uploaded attachment is converted once, when it arrives.
+
+Images and Excel sheets become PDF pages (the slow part of building a minute sheet),
+stored next to the originals under a name derived from their SHA-256, so identical
+uploads share one rendition. The page count and an HTML preview are kept with it in
+`AttachmentRendition`. Sheet PDFs then only append precomputed pages; see
+`apps.minute.pdf.open_attachment_pdf()`.
+"""
+import logging
+import os
+
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.utils.html import format_html
+from PyPDF2 import PdfReader
+
+from apps.minute.cache import bump_minute_versions_on_commit
+from apps.minute.models import AttachmentRendition
+from apps.minute.pdf import (
+    EXCEL_EXTENSIONS,
+    IMAGE_EXTENSIONS,
+    attachment_digest,
+    read_excel_attachment,
+    spooled_file,
+    write_attachment_pdf,
+)
+
+logger = logging.getLogger(__name__)
+
+RENDITION_DIRECTORY = "minute_attachments/renditions"
+PREVIEW_ROWS = 50  # ✅ Rows of an Excel sheet shown on the detail page; the PDF has them all
+
+
+def ingest_attachment(minute):
+    """
+    Makes (or refreshes) the minute's AttachmentRendition for its current attachment.
+    Does nothing if the rendition already matches the file's SHA-256; removes it when the
+    attachment is gone. Returns the rendition, or None without an attachment.
+    """
+    existing = AttachmentRendition.objects.filter(minute=minute).first()
+    if not minute.attachment:
+        if existing:
+            existing.delete()
+            _delete_unused_rendition(existing.pdf.name)
+        return None
+
+    sha256 = attachment_digest(minute)
+    if existing and existing.sha256 == sha256:
+        return existing
+
+    path = minute.attachment.path
+    extension = os.path.splitext(path)[1].lower()
+    pdf_name, page_count, preview_html = "", None, ""
+
+    if extension == ".pdf":
+        with open(path, "rb") as f:
+            page_count = len(PdfReader(f).pages)
+
+    elif extension in IMAGE_EXTENSIONS + EXCEL_EXTENSIONS:
+        frame = read_excel_attachment(path) if extension in EXCEL_EXTENSIONS else None
+        pdf_name, page_count = _store_rendition(path, sha256, frame)
+        if frame is not None:
+            preview_html = frame.head(PREVIEW_ROWS).to_html(
+                index=False, border=0, classes="table table-sm table-bordered", na_rep=""
+            )
+            if len(frame) > PREVIEW_ROWS:
+                preview_html += format_html(
+                    '<p class="text-muted small">First {} of {} rows.</p>', PREVIEW_ROWS, len(frame)
+                )
+
+    rendition, _ = AttachmentRendition.objects.update_or_create(
+        minute=minute,
+        defaults={"sha256": sha256, "pdf": pdf_name, "page_count": page_count, "preview_html": preview_html},
+    )
+    if existing and existing.pdf.name != pdf_name:
+        _delete_unused_rendition(existing.pdf.name)
+
+    bump_minute_versions_on_commit([minute.pk])  # ✅ The cached detail page shows the preview
+    return rendition
+
+
+def _store_rendition(path, sha256, frame=None):
+    """
+    Converts the attachment and saves the PDF as <sha256>.pdf unless an identical upload
+    already did. Returns (storage name, page count).
+    """
+    name = f"{RENDITION_DIRECTORY}/{sha256}.pdf"
+    if default_storage.exists(name):
+        with default_storage.open(name, "rb") as f:
+            return name, len(PdfReader(f).pages)
+
+    with spooled_file() as output:
+        write_attachment_pdf(path, output, frame)
+        output.seek(0)
+        page_count = len(PdfReader(output).pages)
+        output.seek(0)
+        return default_storage.save(name, File(output, name=f"{sha256}.pdf")), page_count
+
+
+def _delete_unused_rendition(name):
+    """
+    Deletes a rendition file no other minute's attachment shares.
+    """
+    if name and not AttachmentRendition.objects.filter(pdf=name).exists():
+        default_storage.delete(name)
@@ -0,0 +1,167 @@
+# apps/minute/cache.py
+"""
+Per-minute version counters kept in the cache.
+Every change to a minute's approval state bumps its version, so anything derived
+from that state (ETags, cached fragments) can be validated with one cache read.
+"""
+import asyncio
+import time
+import weakref
+
+from django.core.cache import cache
+from django.db import transaction
+
+VERSION_KEY = "minute:{}:version"
+
+
+def _initial_version():
+    # ✅ Time-based, so a flushed or evicted counter never restarts at a value clients have seen
+    return time.time_ns()
+
+
+def minute_version(minute_id):
+    """
+    Returns the minute's current version, creating the counter if needed.
+    """
+    key = VERSION_KEY.format(minute_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, _initial_version(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_minute_versions(minute_ids):
+    """
+    Increments the versions of the given minutes.
+    """
+    for minute_id in set(minute_ids):
+        key = VERSION_KEY.format(minute_id)
+        try:
+            cache.incr(key)
+        except ValueError:  # Not in the cache (yet, or any more)
+            cache.set(key, _initial_version(), timeout=None)
+
+
+def bump_minute_versions_on_commit(minute_ids):
+    """
+    Bumps the versions once the current transaction commits, so readers never see
+    a new version paired with the old data.
+    """
+    minute_ids = list(minute_ids)
+    transaction.on_commit(lambda: bump_minute_versions(minute_ids))
+
+
+def cached_for_version(minute_id, name, build, timeout=60 * 60):
+    """
+    Returns `build()` for the minute, cached until the minute's version moves on.
+    The entry stores the version it was built from; the counter and the entry are
+    read together, so a hit costs one cache round trip.
+    """
+    version_key, key = VERSION_KEY.format(minute_id), f"minute:{minute_id}:{name}"
+    cached = cache.get_many([version_key, key])
+
+    version = cached.get(version_key)
+    if version is None:
+        version = minute_version(minute_id)
+    elif key in cached and cached[key][0] == version:
+        return cached[key][1]
+
+    value = build()  # ✅ Built after reading the version, so a concurrent bump only causes a rebuild
+    cache.set(key, (version, value), timeout)
+    return value
+
+
+INBOX_COUNT_KEY = "inbox:{}:count"
+INBOX_COUNT_TIMEOUT = 60 * 60  # ✅ Bounds any drift from a count read racing a commit
+
+
+def cached_inbox_count(user_id, count):
+    """
+    Returns the user's pending-approval count, calling `count()` only when it is not cached.
+    """
+    key = INBOX_COUNT_KEY.format(user_id)
+    value = cache.get(key)
+    if value is None:
+        value = count()
+        cache.add(key, value, INBOX_COUNT_TIMEOUT)
+    return value
+
+
+def adjust_inbox_counts(deltas):
+    """
+    Applies {user_id: delta} to the cached inbox counts; uncached counts are left to be recounted.
+    """
+    for user_id, delta in deltas.items():
+        if delta:
+            try:
+                cache.incr(INBOX_COUNT_KEY.format(user_id), delta)
+            except ValueError:  # Not cached; the next read counts from the table
+                pass
+
+
+def adjust_inbox_counts_on_commit(deltas):
+    """
+    Adjusts the cached inbox counts once the current transaction commits.
+    """
+    deltas = dict(deltas)
+    transaction.on_commit(lambda: adjust_inbox_counts(deltas))
+
+
+class VersionWatcher:
+    """
+    Lets many idle connections wait for minute version bumps at almost no cost.
+    Waiters are parked on futures; a single task per event loop reads all watched
+    versions with one `get_many` per tick and wakes the waiters whose minute changed.
+    """
+
+    interval = 1.0  # Seconds between cache reads while anyone is waiting
+
+    def __init__(self):
+        self.waiters = {}  # minute_id -> {future: version the waiter last saw}
+        self.task = None
+
+    async def wait(self, minute_id, version, timeout):
+        """
+        Returns True once the minute's version differs from `version`, or False after `timeout` seconds.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self.waiters.setdefault(minute_id, {})[future] = version
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self._watch())
+
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            waiting = self.waiters.get(minute_id, {})
+            waiting.pop(future, None)
+            if not waiting:
+                self.waiters.pop(minute_id, None)
+
+    async def _watch(self):
+        while self.waiters:
+            await asyncio.sleep(self.interval)
+            keys = {VERSION_KEY.format(minute_id): minute_id for minute_id in self.waiters}
+            versions = await cache.aget_many(keys)
+            for key, minute_id in keys.items():
+                current = versions.get(key)
+                for future, seen in list(self.waiters.get(minute_id, {}).items()):
+                    if current != seen and not future.done():
+                        future.set_result(True)
+
+
+_watchers = weakref.WeakKeyDictionary()
+
+
+async def wait_for_version_change(minute_id, version, timeout):
+    """
+    Waits (without touching the database) until the minute's cached version moves past `version`.
+    Returns True on a change (a flushed counter counts as one), False on timeout.
+    """
+    loop = asyncio.get_running_loop()
+    watcher = _watchers.get(loop)
+    if watcher is None:
+        watcher = _watchers[loop] = VersionWatcher()
+    return await watcher.wait(minute_id, version, timeout)
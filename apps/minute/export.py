@@ -0,0 +1,118 @@
+# apps/minute/export.py
+"""
+Bulk minute sheet exports: one ZIP holding the PDF of every minute matching a filter.
+
+Laying out a sheet is CPU-bound, so sheets are rendered across a process pool. Each
+worker stores its PDF in the shared render cache and hands back only the cache key;
+the exporting process then copies the cached files into the ZIP one chunk at a time.
+An export therefore never holds more than one chunk of PDF in memory, and sheets that
+were downloaded or exported before are not rendered again.
+"""
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.conf import settings
+from django.db import connections
+
+from apps.minute.models import Minute
+from apps.minute.pdf import (
+    attachment_digest,
+    cached_minute_pdf,
+    minute_pdf_cache,
+    minute_pdf_key,
+    minute_sheet_html,
+    render_minute_pdf,
+)
+
+EXPORT_CHUNK_SIZE = 1024 * 1024
+
+
+def _init_worker():
+    django.setup()  # ✅ Needed where workers are spawned rather than forked (Windows, macOS)
+
+
+def render_to_cache(minute_id):
+    """
+    Renders one minute's sheet into the render cache unless it is already there.
+    Returns (minute_id, key), with key None if the minute has been deleted.
+    """
+    try:
+        minute = Minute.objects.select_related("created_by__department", "approval_chain").get(pk=minute_id)
+    except Minute.DoesNotExist:
+        return minute_id, None
+
+    html = minute_sheet_html(minute)
+    key = minute_pdf_key(html, attachment_digest(minute))
+    minute_pdf_cache.get_or_render(key, lambda: render_minute_pdf(minute, html)).close()
+    return minute_id, key
+
+
+def rendered_sheets(minute_ids, workers=None):
+    """
+    Yields (minute_id, key) for each minute in order, rendering up to `workers` sheets at
+    once in separate processes (default MINUTE_PDF_EXPORT_WORKERS; 1 renders in this process).
+    """
+    workers = workers or settings.MINUTE_PDF_EXPORT_WORKERS
+    if workers <= 1:
+        yield from map(render_to_cache, minute_ids)
+        return
+
+    connections.close_all()  # ✅ Forked workers must open their own database connections
+    pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+    try:
+        yield from pool.map(render_to_cache, minute_ids)
+    finally:
+        pool.shutdown(cancel_futures=True)  # An abandoned download stops the remaining renders
+
+
+class _ChunkSink:
+    """
+    Write-only file for ZipFile that hands over what was written since the last `take()`.
+    """
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def take(self):
+        data, self.chunks = b"".join(self.chunks), []
+        return data
+
+
+def iter_minutes_zip(minute_ids, workers=None):
+    """
+    Yields a ZIP archive of the minutes' sheet PDFs ("Minute_<unique id>.pdf", in the
+    order given) as byte chunks, suitable for a streaming response or a file.
+    Minutes deleted in the meantime are left out.
+    """
+    unique_ids = dict(Minute.objects.filter(pk__in=minute_ids).values_list("pk", "unique_id"))
+    sink = _ChunkSink()
+
+    with zipfile.ZipFile(sink, "w", zipfile.ZIP_STORED) as archive:  # PDFs are compressed already
+        for minute_id, key in rendered_sheets(minute_ids, workers):
+            if key is None:
+                continue
+            # ✅ Evicted since the worker stored it (an export larger than the cache): render it here
+            pdf = minute_pdf_cache.get(key) or cached_minute_pdf(Minute.objects.get(pk=minute_id))
+            name = f"Minute_{unique_ids[minute_id].replace('/', '-')}.pdf"
+            with pdf, archive.open(name, "w") as entry:
+                for chunk in iter(lambda: pdf.read(EXPORT_CHUNK_SIZE), b""):
+                    entry.write(chunk)
+                    yield sink.take()
+            yield sink.take()
+    yield sink.take()  # The central directory, written on close
+
+
+def write_minutes_zip(minute_ids, output, workers=None):
+    """
+    Writes the ZIP of `iter_minutes_zip()` to an open binary file.
+    """
+    for chunk in iter_minutes_zip(minute_ids, workers):
+        output.write(chunk)
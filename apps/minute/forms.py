@@ -4,8 +4,9 @@ from django import forms
 from django.core.exceptions import ValidationError
 from django.contrib.auth import get_user_model
 from apps.minute.models import Minute
-from apps.approval_chain.models import Approver, ApprovalChain
-from django.db import models
+from apps.departments.models import Department
+from apps.approval_chain.models import ApprovalChain
+from apps.approval_chain.transitions import MARK_TO, RETURN_TO, apply_transition
 
 
 User = get_user_model()
@@ -54,7 +55,7 @@ class MinuteForm(forms.ModelForm):
         instance.department = self.user.department  # ✅ Auto-assign department
 
         if commit:
-            instance.save()
+            instance = Minute.objects.create_minute(instance=instance)  # ✅ Also creates the approval chain
         return instance
 
 
@@ -88,25 +89,19 @@ class ApprovalActionForm(forms.Form):
         if not self.minute or not self.user:
             raise ValidationError("Invalid request.")
 
-        current_approver = self.minute.approval_chain.approvers.filter(user=self.user, is_current=True).first()
-
-        if not current_approver:
+        approval_chain = self.minute.approval_chain
+        if not approval_chain or approval_chain.current_user_id != self.user.pk:
             raise ValidationError("You are not authorized to take action on this minute.")
 
         return self.cleaned_data
 
     def save(self):
         """
-        Saves the approve/reject action.
+        Saves the approve/reject action together with the remarks.
         """
-        action = self.cleaned_data["action"]
-
-        if action == "approve":
-            self.minute.approve(self.user)
-        else:
-            self.minute.reject(self.user)
-
-from django.db.models import F
+        return apply_transition(
+            self.minute, self.user, self.cleaned_data["action"], remark_text=self.cleaned_data.get("remarks")
+        )
 
 
 class MarkToForm(forms.Form):
@@ -167,40 +162,28 @@ class MarkToForm(forms.Form):
         """
         order = self.cleaned_data.get("order")
 
-        # ✅ Get max existing order, default to 0 if none exist
-        max_existing_order = self.approval_chain.approvers.aggregate(models.Max("order"))["order__max"] or 0
+        # ✅ Orders are positions in the chain (ranks are sparse), so the limit is the approver count
+        approver_count = self.approval_chain.approvers.count()
 
-        if order > max_existing_order + 1:
-            raise ValidationError(f"Invalid order. Maximum order allowed is {max_existing_order + 1}.")
+        if order > approver_count + 1:
+            raise ValidationError(f"Invalid order. Maximum order allowed is {approver_count + 1}.")
 
         return order
 
-    def save(self, current_approver):
+    def save(self, current_approver, remark_text=None):
         """
         Saves the mark-to action and inserts a new approver in the chain.
+        The new approver takes control of the minute.
         """
-        target_user = self.cleaned_data["user"]
-        target_order = self.cleaned_data["order"]
-
-        # ✅ Ensure existing orders are shifted correctly
-        if self.approval_chain.approvers.filter(order=target_order).exists():
-            self.approval_chain.approvers.filter(order__gte=target_order).update(order=F("order") + 1)
-
-        # ✅ Insert New Approver (New approver should be active)
-        new_approver = Approver.objects.create(
-            approval_chain=self.approval_chain,
-            user=target_user,
-            order=target_order,
-            status="Pending",
-            is_current=True  # ✅ New approver takes control
+        transition = apply_transition(
+            self.approval_chain.minute,
+            current_approver.user,
+            MARK_TO,
+            target_user=self.cleaned_data["user"],
+            target_order=self.cleaned_data["order"],
+            remark_text=remark_text,
         )
-
-        # ✅ Update Current Approver (Mark them as "Marked" & Deactivate)
-        current_approver.status = "Marked"
-        current_approver.is_current = False
-        current_approver.save()
-
-        return new_approver
+        return transition.new_approver
 
 
 
@@ -220,8 +203,8 @@ class ReturnToForm(forms.Form):
         approval_chain = kwargs.pop("approval_chain", None)
         super().__init__(*args, **kwargs)
 
-        if approval_chain:
-            previous_approvers = approval_chain.approvers.filter(order__lt=approval_chain.approvers.filter(is_current=True).first().order)
+        if approval_chain and approval_chain.current_approver:
+            previous_approvers = approval_chain.approvers.filter(order__lt=approval_chain.current_approver.order)
             self.fields["user"].queryset = User.objects.filter(id__in=previous_approvers.values_list("user_id", flat=True))
 
     def clean(self):
@@ -236,21 +219,63 @@ class ReturnToForm(forms.Form):
 
         return cleaned_data
 
-    def save(self, approval_chain, current_approver):
+    def save(self, approval_chain, current_approver, remark_text=None):
         """
         Saves the return-to action by reverting to a previous approver.
         """
-        target_user = self.cleaned_data["user"]
-        previous_approver = approval_chain.approvers.filter(user=target_user, order__lt=current_approver.order).first()
+        transition = apply_transition(
+            approval_chain.minute,
+            current_approver.user,
+            RETURN_TO,
+            target_user=self.cleaned_data["user"],
+            remark_text=remark_text,
+        )
+        return transition.next_approver
+
 
-        if previous_approver:
-            current_approver.is_current = False
-            current_approver.save()
+class MinuteExportForm(forms.Form):
+    """
+    Filters for a bulk PDF export: department code, status and an inclusive range of creation dates.
+    Every field is optional.
+    """
 
-            previous_approver.is_current = True
-            previous_approver.status = "Pending"  # ✅ Reset status so they need to approve again
-            previous_approver.save()
+    department = forms.ModelChoiceField(queryset=Department.objects.all(), to_field_name="code", required=False)
+    status = forms.ChoiceField(choices=[("", "Any")] + Minute.STATUS_CHOICES, required=False)
+    date_from = forms.DateField(required=False)
+    date_to = forms.DateField(required=False)
 
-            return previous_approver
-        else:
-            raise ValidationError("Invalid previous approver selected.")
+    def __init__(self, data=None, *args, **kwargs):
+        if data is not None and data.get("department"):
+            data = data.copy()
+            data["department"] = data["department"].upper()  # ✅ Codes are stored upper-case
+        super().__init__(data, *args, **kwargs)
+
+    def clean(self):
+        cleaned_data = super().clean()
+        date_from, date_to = cleaned_data.get("date_from"), cleaned_data.get("date_to")
+        if date_from and date_to and date_from > date_to:
+            raise ValidationError("The start date must not be after the end date.")
+        return cleaned_data
+
+    def filter(self, queryset):
+        """
+        Narrows a Minute queryset to the chosen filters, oldest first.
+        """
+        data = self.cleaned_data
+        if data["department"]:
+            queryset = queryset.filter(department=data["department"])
+        if data["status"]:
+            queryset = queryset.filter(status=data["status"])
+        if data["date_from"]:
+            queryset = queryset.filter(created_at__date__gte=data["date_from"])
+        if data["date_to"]:
+            queryset = queryset.filter(created_at__date__lte=data["date_to"])
+        return queryset.order_by("created_at", "pk")
+
+    def archive_name(self):
+        """
+        ZIP file name describing the filters, e.g. "minutes_CS_Approved_2026-03-01_2026-03-31.zip".
+        """
+        data = self.cleaned_data
+        parts = [data["department"] and data["department"].code, data["status"], data["date_from"], data["date_to"]]
+        return "_".join(["minutes", *(str(part) for part in parts if part)]) + ".zip"
@@ -0,0 +1,106 @@
+import os
+import tempfile
+import time
+import tracemalloc
+
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+from PIL import Image
+from PyPDF2 import PdfWriter
+from PyPDF2.generic import DecodedStreamObject, DictionaryObject, NameObject, NumberObject
+
+from apps.minute.models import Minute
+from apps.minute.pdf import PdfCache, render_minute_pdf
+
+PAGE_SIZE = 5 * 1024 * 1024  # Bytes of raw image data per synthetic scanned page
+PAGE_WIDTH = 1024
+
+
+def write_scanned_pdf(path, size):
+    """
+    Writes a PDF of about `size` bytes whose pages each hold one uncompressed, incompressible
+    image, like a scan saved without compression.
+    """
+    writer = PdfWriter()
+    height = PAGE_SIZE // (PAGE_WIDTH * 3)
+    for _ in range(max(size // PAGE_SIZE, 1)):
+        image = DecodedStreamObject()
+        image.set_data(os.urandom(PAGE_WIDTH * height * 3))
+        image.update({
+            NameObject("/Type"): NameObject("/XObject"),
+            NameObject("/Subtype"): NameObject("/Image"),
+            NameObject("/Width"): NumberObject(PAGE_WIDTH),
+            NameObject("/Height"): NumberObject(height),
+            NameObject("/ColorSpace"): NameObject("/DeviceRGB"),
+            NameObject("/BitsPerComponent"): NumberObject(8),
+        })
+        content = DecodedStreamObject()
+        content.set_data(b"q 612 0 0 792 0 0 cm /Scan Do Q")
+
+        writer.add_blank_page(612, 792)
+        page = writer.pages[-1]  # ✅ The stored page; add_blank_page returns a copy
+        page[NameObject("/Resources")] = DictionaryObject({
+            NameObject("/XObject"): DictionaryObject({NameObject("/Scan"): writer._add_object(image)})
+        })
+        page[NameObject("/Contents")] = writer._add_object(content)
+    with open(path, "wb") as f:
+        writer.write(f)
+
+
+def write_scanned_image(path, size):
+    """
+    Writes a noise PNG of about `size` bytes (noise does not compress).
+    """
+    height = max(size // (PAGE_WIDTH * 3), 1)
+    Image.frombytes("RGB", (PAGE_WIDTH, height), os.urandom(PAGE_WIDTH * height * 3)).save(path, compress_level=1)
+
+
+class Command(BaseCommand):
+    """
+    Measures peak Python memory while a minute sheet with a large synthetic attachment is
+    assembled and stored in the render cache. With spooled assembly the peak should stay
+    near the attachment's size instead of a multiple of it.
+    tracemalloc only sees Python allocations; memory WeasyPrint and Pillow take in C is not counted.
+    """
+
+    help = "Benchmarks peak memory of minute PDF assembly for large attachments."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes", type=int, nargs="+", default=[10, 50, 200], help="Attachment sizes in MB (default: 10 50 200)."
+        )
+        parser.add_argument("--kind", choices=["pdf", "png"], default="pdf", help="Attachment type (default: pdf).")
+        parser.add_argument(
+            "--spool-max-bytes",
+            type=int,
+            help="Override MINUTE_PDF_SPOOL_MAX_BYTES; a value above the sizes keeps everything in memory, for comparison.",
+        )
+
+    def handle(self, *args, **options):
+        write_attachment = write_scanned_pdf if options["kind"] == "pdf" else write_scanned_image
+        overrides = {}
+        if options["spool_max_bytes"] is not None:
+            overrides["MINUTE_PDF_SPOOL_MAX_BYTES"] = options["spool_max_bytes"]
+        self.stdout.write(f"{'attachment':>12} {'output':>10} {'peak':>10} {'peak/att.':>10} {'seconds':>8}")
+
+        for megabytes in options["sizes"]:
+            with tempfile.TemporaryDirectory() as directory, override_settings(MEDIA_ROOT=directory, **overrides):
+                name = f"attachment.{options['kind']}"
+                write_attachment(os.path.join(directory, name), megabytes * 1024 * 1024)
+                attachment_size = os.path.getsize(os.path.join(directory, name))
+
+                minute = Minute(pk=0, unique_id="BENCHMARK", attachment=name)
+                pdf_cache = PdfCache(os.path.join(directory, "cache"), max_bytes=10 * attachment_size)
+
+                tracemalloc.start()
+                started = time.perf_counter()
+                with pdf_cache.get_or_render("benchmark", lambda: render_minute_pdf(minute, "<p>Benchmark</p>")) as pdf:
+                    output_size = os.fstat(pdf.fileno()).st_size
+                elapsed = time.perf_counter() - started
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+
+            self.stdout.write(
+                f"{attachment_size / 2**20:>10.1f}MB {output_size / 2**20:>8.1f}MB {peak / 2**20:>8.1f}MB "
+                f"{peak / attachment_size:>10.2f} {elapsed:>8.2f}"
+            )
@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.minute.export import write_minutes_zip
+from apps.minute.forms import MinuteExportForm
+from apps.minute.models import Minute
+
+
+class Command(BaseCommand):
+    """
+    Writes a ZIP with the sheet PDF of every minute matching the filters, e.g. all approved
+    minutes of one department and month for an audit:
+        manage.py export_minute_pdfs --department CS --status Approved --from 2026-03-01 --to 2026-03-31
+    Sheets are rendered in parallel processes and reused from the PDF render cache.
+    """
+
+    help = "Exports the sheet PDFs of the matching minutes as a ZIP file."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--department", help="Department code.")
+        parser.add_argument("--status", choices=[status for status, _ in Minute.STATUS_CHOICES])
+        parser.add_argument("--from", dest="date_from", help="First creation date (YYYY-MM-DD).")
+        parser.add_argument("--to", dest="date_to", help="Last creation date (YYYY-MM-DD).")
+        parser.add_argument("--output", help="ZIP path (default: a name describing the filters).")
+        parser.add_argument("--workers", type=int, help="Render processes (default: MINUTE_PDF_EXPORT_WORKERS).")
+
+    def handle(self, *args, **options):
+        form = MinuteExportForm({field: options[field] or "" for field in ("department", "status", "date_from", "date_to")})
+        if not form.is_valid():
+            raise CommandError(" ".join(f"{field}: {' '.join(errors)}" for field, errors in form.errors.items()))
+
+        minute_ids = list(form.filter(Minute.objects.all()).values_list("pk", flat=True))
+        if not minute_ids:
+            raise CommandError("No minutes match these filters.")
+
+        output = options["output"] or form.archive_name()
+        with open(output, "wb") as f:
+            write_minutes_zip(minute_ids, f, options["workers"])
+
+        self.stdout.write(self.style.SUCCESS(f"Exported {len(minute_ids)} minute(s) to {output}."))
@@ -0,0 +1,56 @@
+import json
+import sys
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.minute.models import Minute
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    """
+    Imports minutes in bulk from a JSON file (e.g. the registrar's term-start batch).
+    The file holds a list of minutes, or {"minutes": [...]}; see `MinuteManager.bulk_create_minutes`.
+    """
+
+    help = "Bulk-creates minutes, approval chains and approvers from a JSON file."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Path to the JSON file, or '-' to read from stdin.")
+        parser.add_argument(
+            "--created-by",
+            help="Username used for rows that do not name their own creator.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            if options["path"] == "-":
+                payload = json.load(sys.stdin)
+            else:
+                with open(options["path"], encoding="utf-8") as f:
+                    payload = json.load(f)
+        except (OSError, ValueError) as e:
+            raise CommandError(f"Could not read {options['path']}: {e}")
+
+        if isinstance(payload, dict):
+            payload = payload.get("minutes")
+        if not isinstance(payload, list):
+            raise CommandError("Expected a list of minutes.")
+
+        created_by = None
+        if options["created_by"]:
+            created_by = User.objects.filter(username=options["created_by"]).first()
+            if not created_by:
+                raise CommandError(f"Unknown user: {options['created_by']}")
+
+        results = Minute.objects.bulk_create_minutes(payload, created_by=created_by)
+
+        failed = 0
+        for result in results:
+            if "errors" in result:
+                failed += 1
+                self.stderr.write(f"Row {result['row']}: {' '.join(result['errors'])}")
+
+        self.stdout.write(self.style.SUCCESS(f"Created {len(results) - failed} minute(s), {failed} failed."))
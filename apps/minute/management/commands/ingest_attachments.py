@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from apps.minute.attachments import ingest_attachment
+from apps.minute.models import Minute
+
+
+class Command(BaseCommand):
+    """
+    Converts the attachments of existing minutes, which were uploaded before ingestion ran
+    at upload time (or whose ingestion failed). Attachments already ingested are skipped.
+    """
+
+    help = "Builds the PDF renditions, page counts and previews of minute attachments."
+
+    def handle(self, *args, **options):
+        ingested = failed = 0
+        for minute in Minute.objects.exclude(attachment__isnull=True).exclude(attachment="").order_by("pk").iterator():
+            try:
+                ingest_attachment(minute)
+            except Exception as e:
+                failed += 1
+                self.stderr.write(f"Minute {minute.pk} ({minute.attachment.name}): {e}")
+            else:
+                ingested += 1
+
+        self.stdout.write(self.style.SUCCESS(f"Ingested {ingested} attachment(s); {failed} failed."))
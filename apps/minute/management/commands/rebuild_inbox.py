@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from apps.minute.models import InboxEntry, Minute
+
+
+class Command(BaseCommand):
+    """
+    Resynchronizes the materialized approval inbox from the approval chains.
+    Every Pending minute, and every minute that still has an inbox row, is rebuilt
+    in batches, each in its own transaction.
+    """
+
+    help = "Rebuilds the approval inbox table from the approval chains."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500, help="Minutes rebuilt per transaction.")
+
+    def handle(self, *args, **options):
+        minute_ids = set(Minute.objects.filter(status="Pending").values_list("pk", flat=True).iterator())
+        minute_ids.update(InboxEntry.objects.values_list("minute_id", flat=True).iterator())
+
+        minute_ids = sorted(minute_ids)
+        batch_size = options["batch_size"]
+        rows = 0
+        for start in range(0, len(minute_ids), batch_size):
+            rows += len(InboxEntry.objects.sync(minute_ids[start:start + batch_size]))
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rows} inbox row(s) for {len(minute_ids)} minute(s)."))
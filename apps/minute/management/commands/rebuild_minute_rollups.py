@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.minute.models import Minute, MinuteRollup, build_minute_rollups, rollups_recorded
+from apps.remarks.models import Remark
+
+
+class Command(BaseCommand):
+    """
+    Recomputes the dashboard rollups from the minutes table.
+    Status changes record themselves; this repairs rollups after raw SQL or bulk edits
+    that bypassed the models. Best run when few approvals are in flight.
+    """
+
+    help = "Rebuilds the per-creator and per-department minute rollups."
+
+    def handle(self, *args, **options):
+        rollups = build_minute_rollups(Minute, Remark)
+        with transaction.atomic():
+            MinuteRollup.objects.all().delete()
+            MinuteRollup.objects.bulk_create(
+                [MinuteRollup(scope=scope, scope_id=scope_id, **counters) for (scope, scope_id), counters in rollups.items()],
+                batch_size=500,
+            )
+            rollups_recorded.send(
+                sender=MinuteRollup,
+                department_ids=[scope_id for scope, scope_id in rollups if scope == MinuteRollup.DEPARTMENT],
+            )
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {len(rollups)} rollup row(s)."))
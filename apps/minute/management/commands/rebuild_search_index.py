@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from apps.minute.models import Minute, MinuteSearchDocument
+
+
+class Command(BaseCommand):
+    """
+    Rebuilds the minute search index from the minutes and remarks tables.
+    Saves and approval actions index themselves; this repairs the index after raw SQL
+    or bulk edits that bypassed the models. Minutes are reindexed in batches, each in
+    its own transaction.
+    """
+
+    help = "Rebuilds the full-text search index over minutes and remarks."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500, help="Minutes reindexed per transaction.")
+
+    def handle(self, *args, **options):
+        minute_ids = list(Minute.objects.order_by("pk").values_list("pk", flat=True).iterator())
+        batch_size = options["batch_size"]
+        for start in range(0, len(minute_ids), batch_size):
+            MinuteSearchDocument.objects.sync(minute_ids[start:start + batch_size])
+
+        self.stdout.write(self.style.SUCCESS(f"Indexed {len(minute_ids)} minute(s)."))
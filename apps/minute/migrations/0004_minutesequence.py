@@ -0,0 +1,60 @@
+# Generated by Django 5.1.4 on 2026-10-18 13:48
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("departments", "0002_initial"),
+        ("minute", "0003_minute_attachment"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MinuteSequence",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "period",
+                    models.CharField(
+                        blank=True,
+                        help_text='"MM-YYYY" for unique ID counters, blank for the sheet number counter.',
+                        max_length=7,
+                    ),
+                ),
+                (
+                    "last_value",
+                    models.PositiveIntegerField(
+                        default=0, help_text="Last number handed out."
+                    ),
+                ),
+                (
+                    "department",
+                    models.ForeignKey(
+                        help_text="The department this counter belongs to.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="minute_sequences",
+                        to="departments.department",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("department", "period"),
+                        name="minute_sequence_unique_period",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.1.4 on 2026-10-18 14:01
+
+from django.conf import settings
+from django.db import migrations, models
+
+from utils.migrations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+
+    atomic = False  # ✅ CREATE INDEX CONCURRENTLY cannot run in a transaction
+
+    dependencies = [
+        ("approval_chain", "0007_approver_approver_current_user_idx"),
+        ("departments", "0002_initial"),
+        ("minute", "0004_minutesequence"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="minute",
+            index=models.Index(
+                fields=["department", "-created_at"], name="minute_dept_created_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,141 @@
+# Generated by Django 5.1.4 on 2026-10-18 14:03
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def fill_inbox(apps, schema_editor):
+    """
+    One row for the current approver of every Pending minute, waiting since its last remark.
+    """
+    Minute = apps.get_model("minute", "Minute")
+    InboxEntry = apps.get_model("minute", "InboxEntry")
+    Remark = apps.get_model("remarks", "Remark")
+
+    last_action_at = (
+        Remark.objects.filter(minute=models.OuterRef("pk"))
+        .order_by("-timestamp")
+        .values("timestamp")
+    )
+    minutes = (
+        Minute.objects.filter(
+            status="Pending", approval_chain__current_approver__isnull=False
+        )
+        .select_related("department", "created_by", "approval_chain")
+        .annotate(last_action_at=models.Subquery(last_action_at[:1]))
+        .order_by()
+    )
+    InboxEntry.objects.bulk_create(
+        (
+            InboxEntry(
+                user_id=minute.approval_chain.current_user_id,
+                minute=minute,
+                approval_chain=minute.approval_chain,
+                approver_id=minute.approval_chain.current_approver_id,
+                subject=minute.subject,
+                unique_id=minute.unique_id,
+                department=minute.department,
+                department_name=minute.department.name,
+                created_by_name=f"{minute.created_by.first_name} {minute.created_by.last_name}".strip(),
+                minute_created_at=minute.created_at,
+                waiting_since=minute.last_action_at or minute.created_at,
+            )
+            for minute in minutes.iterator()
+        ),
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("approval_chain", "0007_approver_approver_current_user_idx"),
+        ("departments", "0002_initial"),
+        ("minute", "0005_minute_minute_dept_created_idx"),
+        ("remarks", "0002_remark_remark_minute_timestamp_idx"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="InboxEntry",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("subject", models.CharField(max_length=255)),
+                ("unique_id", models.CharField(max_length=50)),
+                ("department_name", models.CharField(max_length=100)),
+                ("created_by_name", models.CharField(max_length=301)),
+                ("minute_created_at", models.DateTimeField()),
+                (
+                    "waiting_since",
+                    models.DateTimeField(
+                        help_text="When the minute reached this user."
+                    ),
+                ),
+                (
+                    "approval_chain",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="approval_chain.approvalchain",
+                    ),
+                ),
+                (
+                    "approver",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="approval_chain.approver",
+                    ),
+                ),
+                (
+                    "department",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="departments.department",
+                    ),
+                ),
+                (
+                    "minute",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="inbox_entries",
+                        to="minute.minute",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        help_text="User the minute is waiting on.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="inbox_entries",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["user", "waiting_since", "id"],
+                        name="inbox_entry_keyset_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("user", "minute"), name="inbox_entry_unique_user_minute"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(fill_inbox, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.1.4 on 2026-10-18 14:13
+
+from django.db import migrations, models
+
+from apps.minute.models import description_page_offsets
+
+
+def fill_page_offsets(apps, schema_editor):
+    """
+    Computes the description page offsets of existing minutes, in batches.
+    """
+    Minute = apps.get_model("minute", "Minute")
+    batch = []
+    for minute in (
+        Minute.objects.only("pk", "description").order_by("pk").iterator(chunk_size=500)
+    ):
+        minute.description_page_offsets = description_page_offsets(minute.description)
+        batch.append(minute)
+        if len(batch) == 500:
+            Minute.objects.bulk_update(batch, ["description_page_offsets"])
+            batch = []
+    Minute.objects.bulk_update(batch, ["description_page_offsets"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("minute", "0006_inboxentry"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="minute",
+            name="description_page_offsets",
+            field=models.JSONField(
+                blank=True,
+                default=list,
+                editable=False,
+                help_text="Character offset where each description page starts (kept in sync on save).",
+            ),
+        ),
+        migrations.RunPython(fill_page_offsets, migrations.RunPython.noop),
+    ]
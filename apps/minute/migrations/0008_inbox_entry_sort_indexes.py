@@ -0,0 +1,41 @@
+# Generated by Django 5.1.4 on 2026-10-18 14:16
+
+from django.conf import settings
+from django.db import migrations, models
+
+from utils.migrations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+
+    atomic = False  # ✅ CREATE INDEX CONCURRENTLY cannot run in a transaction
+
+    dependencies = [
+        ("approval_chain", "0007_approver_approver_current_user_idx"),
+        ("departments", "0002_initial"),
+        ("minute", "0007_minute_description_page_offsets"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="inboxentry",
+            index=models.Index(
+                fields=["user", "department_name", "id"],
+                name="inbox_entry_dept_name_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="inboxentry",
+            index=models.Index(
+                fields=["user", "subject", "id"], name="inbox_entry_subject_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="inboxentry",
+            index=models.Index(
+                fields=["user", "department", "waiting_since", "id"],
+                name="inbox_entry_dept_age_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,84 @@
+# Generated by Django 5.1.4 on 2026-10-18 14:19
+
+from django.db import migrations, models
+
+from apps.minute.models import build_minute_rollups
+
+
+def fill_rollups(apps, schema_editor):
+    """
+    Computes the rollups of the existing minutes.
+    """
+    MinuteRollup = apps.get_model("minute", "MinuteRollup")
+    rollups = build_minute_rollups(
+        apps.get_model("minute", "Minute"), apps.get_model("remarks", "Remark")
+    )
+    MinuteRollup.objects.bulk_create(
+        [
+            MinuteRollup(scope=scope, scope_id=scope_id, **counters)
+            for (scope, scope_id), counters in rollups.items()
+        ],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("minute", "0008_inbox_entry_sort_indexes"),
+        ("remarks", "0003_remark_timeline_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MinuteRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "scope",
+                    models.CharField(
+                        choices=[("user", "Creator"), ("department", "Department")],
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "scope_id",
+                    models.PositiveIntegerField(
+                        help_text="User or department ID, depending on the scope."
+                    ),
+                ),
+                ("pending", models.IntegerField(default=0)),
+                ("approved", models.IntegerField(default=0)),
+                ("rejected", models.IntegerField(default=0)),
+                ("archived", models.IntegerField(default=0)),
+                (
+                    "completed",
+                    models.IntegerField(
+                        default=0, help_text="Minutes that have left Pending."
+                    ),
+                ),
+                (
+                    "turnaround_seconds",
+                    models.BigIntegerField(
+                        default=0, help_text="Total time from creation to completion."
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("scope", "scope_id"), name="minute_rollup_unique_scope"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(fill_rollups, migrations.RunPython.noop),
+    ]
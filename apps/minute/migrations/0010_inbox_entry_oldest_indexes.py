@@ -0,0 +1,32 @@
+# Generated by Django 5.1.4 on 2026-10-18 14:19
+
+from django.conf import settings
+from django.db import migrations, models
+
+from utils.migrations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+
+    atomic = False  # ✅ CREATE INDEX CONCURRENTLY cannot run in a transaction
+
+    dependencies = [
+        ("approval_chain", "0007_approver_approver_current_user_idx"),
+        ("departments", "0002_initial"),
+        ("minute", "0009_minuterollup"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="inboxentry",
+            index=models.Index(
+                fields=["department", "waiting_since"],
+                name="inbox_entry_dept_oldest_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="inboxentry",
+            index=models.Index(fields=["waiting_since"], name="inbox_entry_oldest_idx"),
+        ),
+    ]
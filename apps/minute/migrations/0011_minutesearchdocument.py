@@ -0,0 +1,123 @@
+# Generated by Django 5.1.4 on 2026-10-18 14:29
+
+import django.contrib.postgres.search
+import django.db.models.deletion
+from django.db import migrations, models
+
+from apps.minute.models import (
+    SEARCH_FIELDS,
+    SEARCH_FTS_TABLE,
+    build_search_documents,
+    search_vector,
+)
+
+DOCUMENT_TABLE = "minute_minutesearchdocument"
+
+
+def create_fts_table(apps, schema_editor):
+    """
+    On SQLite, creates the FTS5 shadow table over the search documents and the triggers that keep it in step.
+    """
+    if schema_editor.connection.vendor != "sqlite":
+        return
+
+    columns = ", ".join(SEARCH_FIELDS)
+    new_values = ", ".join(f"new.{field}" for field in SEARCH_FIELDS)
+    old_values = ", ".join(f"old.{field}" for field in SEARCH_FIELDS)
+    delete_old = (
+        f"INSERT INTO {SEARCH_FTS_TABLE}({SEARCH_FTS_TABLE}, rowid, {columns}) "
+        f"VALUES ('delete', old.minute_id, {old_values});"
+    )
+    insert_new = f"INSERT INTO {SEARCH_FTS_TABLE}(rowid, {columns}) VALUES (new.minute_id, {new_values});"
+
+    schema_editor.execute(
+        f"CREATE VIRTUAL TABLE {SEARCH_FTS_TABLE} USING fts5({columns}, content='{DOCUMENT_TABLE}', "
+        f"content_rowid='minute_id', tokenize='porter unicode61')"
+    )
+    schema_editor.execute(
+        f"CREATE TRIGGER {SEARCH_FTS_TABLE}_ai AFTER INSERT ON {DOCUMENT_TABLE} BEGIN {insert_new} END"
+    )
+    schema_editor.execute(
+        f"CREATE TRIGGER {SEARCH_FTS_TABLE}_ad AFTER DELETE ON {DOCUMENT_TABLE} BEGIN {delete_old} END"
+    )
+    schema_editor.execute(
+        f"CREATE TRIGGER {SEARCH_FTS_TABLE}_au AFTER UPDATE ON {DOCUMENT_TABLE} BEGIN {delete_old} {insert_new} END"
+    )
+
+
+def drop_fts_table(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+
+    for suffix in ("ai", "ad", "au"):
+        schema_editor.execute(f"DROP TRIGGER IF EXISTS {SEARCH_FTS_TABLE}_{suffix}")
+    schema_editor.execute(f"DROP TABLE IF EXISTS {SEARCH_FTS_TABLE}")
+
+
+def fill_search_documents(apps, schema_editor):
+    """
+    Indexes the existing minutes, 500 at a time.
+    """
+    Minute = apps.get_model("minute", "Minute")
+    Remark = apps.get_model("remarks", "Remark")
+    MinuteSearchDocument = apps.get_model("minute", "MinuteSearchDocument")
+
+    minute_ids = list(Minute.objects.order_by("pk").values_list("pk", flat=True))
+    for start in range(0, len(minute_ids), 500):
+        documents = build_search_documents(
+            Minute, Remark, minute_ids[start : start + 500]
+        )
+        MinuteSearchDocument.objects.bulk_create(
+            [
+                MinuteSearchDocument(minute_id=pk, **fields)
+                for pk, fields in documents.items()
+            ]
+        )
+        if schema_editor.connection.vendor == "postgresql":
+            MinuteSearchDocument.objects.filter(minute_id__in=documents).update(
+                search_vector=search_vector()
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("minute", "0010_inbox_entry_oldest_indexes"),
+        ("remarks", "0003_remark_timeline_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MinuteSearchDocument",
+            fields=[
+                (
+                    "minute",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="search_document",
+                        serialize=False,
+                        to="minute.minute",
+                    ),
+                ),
+                ("unique_id", models.CharField(max_length=50)),
+                ("subject", models.CharField(max_length=255)),
+                ("description", models.TextField()),
+                (
+                    "remarks",
+                    models.TextField(
+                        blank=True,
+                        help_text="Text of the minute's remarks, oldest first.",
+                    ),
+                ),
+                (
+                    "search_vector",
+                    django.contrib.postgres.search.SearchVectorField(
+                        help_text="Weighted tsvector (PostgreSQL only).", null=True
+                    ),
+                ),
+            ],
+        ),
+        migrations.RunPython(create_fts_table, drop_fts_table),
+        migrations.RunPython(fill_search_documents, migrations.RunPython.noop),
+    ]
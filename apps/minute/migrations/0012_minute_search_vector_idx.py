@@ -0,0 +1,24 @@
+# Generated by Django 5.1.4 on 2026-10-18 14:31
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+from utils.migrations import AddPostgresIndexConcurrently
+
+
+class Migration(migrations.Migration):
+
+    atomic = False  # ✅ CREATE INDEX CONCURRENTLY cannot run in a transaction
+
+    dependencies = [
+        ("minute", "0011_minutesearchdocument"),
+    ]
+
+    operations = [
+        AddPostgresIndexConcurrently(
+            model_name="minutesearchdocument",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="minute_search_vector_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.1.4 on 2026-10-18 14:42
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("minute", "0012_minute_search_vector_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AttachmentRendition",
+            fields=[
+                (
+                    "minute",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="attachment_rendition",
+                        serialize=False,
+                        to="minute.minute",
+                    ),
+                ),
+                (
+                    "sha256",
+                    models.CharField(
+                        help_text="SHA-256 of the attachment this was made from.",
+                        max_length=64,
+                    ),
+                ),
+                (
+                    "pdf",
+                    models.FileField(
+                        blank=True, upload_to="minute_attachments/renditions/"
+                    ),
+                ),
+                ("page_count", models.PositiveIntegerField(blank=True, null=True)),
+                ("preview_html", models.TextField(blank=True)),
+                ("ingested_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
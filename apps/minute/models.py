@@ -1,33 +1,415 @@
 # apps/minute/models.py
-from django.db import models, transaction
+import operator
+import re
+from collections import Counter
+from datetime import timedelta
+from functools import reduce
+
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector, SearchVectorField
+from django.db import IntegrityError, connection, models, transaction
 from django.utils.timezone import now
 from django.contrib.auth import get_user_model
 from django.apps import apps
-from django.core.exceptions import ValidationError
 from django.db.models import F
+from django.db.models.functions import Cast, Concat, Substr, Trim
+from django.dispatch import Signal
 
-from apps.approval_chain.models import Approver
+from apps.approval_chain.models import ORDER_GAP, Approver
+from apps.minute.cache import adjust_inbox_counts_on_commit, cached_inbox_count
+from apps.approval_chain.transitions import APPROVE, MARK_TO, REJECT, RETURN_TO, apply_transition
+from utils.pagination import decode_keyset_cursor, encode_keyset_cursor
 
 User = get_user_model()
 
 
+def unique_id_period(when=None):
+    """
+    Returns the "MM-YYYY" period used in unique IDs and as the monthly sequence key.
+    """
+    return (when or now()).strftime("%m-%Y")
+
+
+def format_unique_id(department, period, number):
+    """
+    Formats a unique ID as DHA/DSU/{DepartmentCode}/{MM-YYYY}/{4-digit Unique Number}.
+    """
+    return f"DHA/DSU/{department.code}/{period}/{number:04d}"
+
+
+DESCRIPTION_WORDS_PER_PAGE = 200
+_WORD = re.compile(r"\S+")
+
+
+def description_page_offsets(description, words_per_page=DESCRIPTION_WORDS_PER_PAGE):
+    """
+    Returns the character offset at which each page of the description starts
+    (a new page every `words_per_page` words). Empty descriptions have no pages.
+    """
+    if not description:
+        return []
+    return [match.start() for index, match in enumerate(_WORD.finditer(description)) if index % words_per_page == 0]
+
+
 def generate_unique_id(department):
     """
     Generates a unique ID for the minute sheet using the format:
     DHA/DSU/{DepartmentCode}/{MM-YYYY}/{4-digit Unique Number}
     """
-    current_date = now()
-    month_year = current_date.strftime("%m-%Y")
+    month_year = unique_id_period()
+    unique_number = MinuteSequence.reserve(department, month_year)[0]
+
+    return format_unique_id(department, month_year, unique_number)
+
+
+def generate_sheet_no(department):
+    """
+    Returns the next sheet number for the department.
+    """
+    return MinuteSequence.reserve(department, MinuteSequence.SHEET_PERIOD)[0]
+
+
+class MinuteSequence(models.Model):
+    """
+    Per-department counter that hands out unique ID and sheet numbers.
+    - The monthly unique ID counter is keyed by its "MM-YYYY" period.
+    - The sheet number counter never resets and uses a blank period.
+    """
+
+    SHEET_PERIOD = ""
+
+    department = models.ForeignKey(
+        "departments.Department",
+        on_delete=models.CASCADE,
+        related_name="minute_sequences",
+        help_text="The department this counter belongs to."
+    )
+    period = models.CharField(
+        max_length=7,
+        blank=True,
+        help_text='"MM-YYYY" for unique ID counters, blank for the sheet number counter.'
+    )
+    last_value = models.PositiveIntegerField(default=0, help_text="Last number handed out.")
 
-    Minute = apps.get_model("minute", "Minute")  # ✅ Prevents circular import issues
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["department", "period"], name="minute_sequence_unique_period"),
+        ]
+
+    def __str__(self):
+        return f"{self.department.code} {self.period or 'sheet'}: {self.last_value}"
 
-    count = Minute.objects.filter(
-        department=department, created_at__year=current_date.year, created_at__month=current_date.month
-    ).count()
+    @classmethod
+    def reserve(cls, department, period=SHEET_PERIOD, count=1):
+        """
+        Reserves `count` consecutive numbers and returns them as a range.
+        The increment is a single UPDATE, so the counter row stays locked only until
+        the surrounding transaction ends. Bulk callers reserve a whole block at once.
+        """
+        if count < 1:
+            raise ValueError("count must be at least 1.")
+
+        with transaction.atomic():
+            counter = cls.objects.filter(department=department, period=period)
+
+            if not counter.update(last_value=F("last_value") + count):
+                try:
+                    with transaction.atomic():
+                        cls.objects.create(
+                            department=department,
+                            period=period,
+                            last_value=cls._initial_value(department, period) + count,
+                        )
+                except IntegrityError:
+                    # ✅ Another creator seeded the counter first, so just increment theirs
+                    counter.update(last_value=F("last_value") + count)
+
+            last_value = counter.values_list("last_value", flat=True).get()
+
+        return range(last_value - count + 1, last_value + 1)
+
+    @classmethod
+    def reserve_ids(cls, department, count=1, when=None):
+        """
+        Reserves `count` unique IDs and sheet numbers for the department.
+        Both counters are bumped by one UPDATE; counters that do not exist yet
+        are seeded through `reserve()`. Returns (unique_ids, sheet_nos).
+        """
+        period = unique_id_period(when)
+        periods = [period, cls.SHEET_PERIOD]
+
+        with transaction.atomic():
+            counters = cls.objects.filter(department=department, period__in=periods)
+
+            try:
+                with transaction.atomic():
+                    if counters.update(last_value=F("last_value") + count) < len(periods):
+                        raise cls.DoesNotExist  # ✅ Roll back the partial increment and seed instead
+                    last_values = dict(counters.values_list("period", "last_value"))
+                numbers = {p: range(last_values[p] - count + 1, last_values[p] + 1) for p in periods}
+            except cls.DoesNotExist:
+                numbers = {p: cls.reserve(department, p, count) for p in periods}
+
+        unique_ids = [format_unique_id(department, period, number) for number in numbers[period]]
+        return unique_ids, numbers[cls.SHEET_PERIOD]
+
+    @staticmethod
+    def _initial_value(department, period):
+        """
+        Seeds a new counter from minutes created before it existed.
+        """
+        if period == MinuteSequence.SHEET_PERIOD:
+            return Minute.objects.filter(department=department).aggregate(models.Max("sheet_no"))["sheet_no__max"] or 0
+
+        # ✅ Compared as numbers: past 9999 the suffix grows a digit and "…/9999" would sort above "…/10000"
+        prefix = format_unique_id(department, period, 0)[:-4]
+        return Minute.objects.filter(unique_id__startswith=prefix).aggregate(
+            last=models.Max(Cast(Substr("unique_id", len(prefix) + 1), models.IntegerField()))
+        )["last"] or 0
+
+
+class MinuteManager(models.Manager):
+    """
+    Manager that creates minutes together with their approval chains.
+    """
+
+    def visible_to(self, user):
+        """
+        Minutes the user may read: those they created or sit on the approval chain of (superusers see all).
+        """
+        if user.is_superuser:
+            return self.all()
+        return self.filter(
+            models.Q(created_by=user)
+            | models.Exists(Approver.objects.filter(approval_chain=models.OuterRef("approval_chain_id"), user=user))
+        )
+
+    @transaction.atomic
+    def create_minute(self, approvers=(), instance=None, **fields):
+        """
+        Creates a minute, its approval chain and initial approvers in one transaction:
+        - Unique ID and Sheet Number come from a single counter UPDATE.
+        - The minute, its chain and the approvers are each written once.
+        - The first approver is activated immediately.
+        Accepts either model field values or an unsaved `instance` (e.g. from a ModelForm).
+        """
+        ApprovalChain = apps.get_model("approval_chain", "ApprovalChain")
+
+        minute = instance or self.model(**fields)
+        if not minute.department_id:
+            minute.department = minute.created_by.department  # Auto-assign department from user
+
+        unique_ids, sheet_nos = MinuteSequence.reserve_ids(minute.department)
+        minute.unique_id = minute.unique_id or unique_ids[0]
+        minute.sheet_no = minute.sheet_no or sheet_nos[0]
+        minute.save(force_insert=True)
+        MinuteRollup.objects.record([(minute, None, minute.status)])
+
+        approval_chain = ApprovalChain.objects.create(
+            name=f"Approval Chain for {minute.unique_id}",
+            created_by=minute.created_by,
+            minute=minute,
+        )
+        minute.approval_chain = approval_chain
+        self.filter(pk=minute.pk).update(approval_chain=approval_chain)
+
+        created = Approver.objects.bulk_create([
+            Approver(
+                approval_chain=approval_chain,
+                user=user,
+                order=position * ORDER_GAP,
+                status="Pending",
+                is_current=position == 1,
+            )
+            for position, user in enumerate(approvers, start=1)
+        ])
 
-    unique_number = f"{count + 1:04d}"  # 4-digit unique number
+        if created:
+            approval_chain.set_current_approver(created[0])
+            approval_chain.save(update_fields=["current_approver", "current_user"])
+            InboxEntry.objects.sync([minute.pk])
 
-    return f"DHA/DSU/{department.code}/{month_year}/{unique_number}"
+        return minute
+
+
+    @transaction.atomic
+    def bulk_create_minutes(self, payloads, created_by=None):
+        """
+        Creates many minutes with their approval chains and approvers using bulk inserts.
+        Each payload is a dict with `subject`, `description`, an optional `created_by`
+        (username or user ID, defaults to `created_by`), an optional `department` code
+        (defaults to the creator's department) and an ordered `approvers` list.
+        Invalid rows are skipped and reported; the query count does not grow with the
+        number of rows. Returns one result per payload, either
+        {"row", "id", "unique_id"} or {"row", "errors"}.
+        """
+        ApprovalChain = apps.get_model("approval_chain", "ApprovalChain")
+        Department = apps.get_model("departments", "Department")
+
+        # ✅ Resolve every referenced user and department up front (one query each)
+        user_refs = {created_by} if created_by is not None else set()
+        department_codes = set()
+        for payload in payloads:
+            if isinstance(payload, dict):
+                approver_refs = payload.get("approvers") if isinstance(payload.get("approvers"), list) else []
+                user_refs.update(
+                    ref for ref in [payload.get("created_by"), *approver_refs] if self._is_user_ref(ref)
+                )
+                if isinstance(payload.get("department"), str):
+                    department_codes.add(payload["department"].upper())
+
+        users = {}
+        for user in User.objects.filter(
+            models.Q(pk__in=[ref for ref in user_refs if isinstance(ref, int)])
+            | models.Q(username__in=[ref for ref in user_refs if isinstance(ref, str)])
+        ).select_related("department"):
+            users[user.pk] = users[user.username] = user
+        if isinstance(created_by, User):
+            users[created_by] = created_by
+        departments = {department.code: department for department in Department.objects.filter(code__in=department_codes)}
+
+        results, rows = [], []
+        for index, payload in enumerate(payloads):
+            errors, row = self._clean_bulk_row(payload, created_by, users, departments)
+            if errors:
+                results.append({"row": index, "errors": errors})
+            else:
+                results.append({"row": index})
+                rows.append((index, row))
+
+        # ✅ Reserve IDs in one block per department
+        minutes, approver_lists, row_indexes = [], [], []
+        rows_by_department = {}
+        for index, row in rows:
+            rows_by_department.setdefault(row["department"], []).append((index, row))
+
+        for department, department_rows in rows_by_department.items():
+            unique_ids, sheet_nos = MinuteSequence.reserve_ids(department, count=len(department_rows))
+            for (index, row), unique_id, sheet_no in zip(department_rows, unique_ids, sheet_nos):
+                minute = self.model(
+                    subject=row["subject"],
+                    description=row["description"],
+                    description_page_offsets=description_page_offsets(row["description"]),  # ✅ bulk_create skips save()
+                    created_by=row["created_by"],
+                    department=department,
+                    unique_id=unique_id,
+                    sheet_no=sheet_no,
+                )
+                minutes.append(minute)
+                approver_lists.append(row["approvers"])
+                row_indexes.append(index)
+
+        if not minutes:
+            return results
+
+        self.bulk_create(minutes)
+        MinuteRollup.objects.record((minute, None, minute.status) for minute in minutes)
+
+        approval_chains = ApprovalChain.objects.bulk_create([
+            ApprovalChain(name=f"Approval Chain for {minute.unique_id}", created_by=minute.created_by, minute=minute)
+            for minute in minutes
+        ])
+        for minute, approval_chain in zip(minutes, approval_chains):
+            minute.approval_chain = approval_chain
+        self.bulk_update(minutes, ["approval_chain"], batch_size=500)
+
+        created = Approver.objects.bulk_create([
+            Approver(
+                approval_chain=minute.approval_chain,
+                user=user,
+                order=position * ORDER_GAP,
+                status="Pending",
+                is_current=position == 1,
+            )
+            for minute, approvers in zip(minutes, approver_lists)
+            for position, user in enumerate(approvers, start=1)
+        ])
+
+        # ✅ Point each chain at its first approver
+        for approver in created:
+            if approver.is_current:
+                approver.approval_chain.set_current_approver(approver)
+        ApprovalChain.objects.bulk_update(approval_chains, ["current_approver", "current_user"], batch_size=500)
+        InboxEntry.objects.sync(minute.pk for minute in minutes)
+        MinuteSearchDocument.objects.sync_on_commit(minute.pk for minute in minutes)
+
+        for minute, index in zip(minutes, row_indexes):
+            results[index].update(id=minute.pk, unique_id=minute.unique_id)
+
+        return results
+
+    @staticmethod
+    def _is_user_ref(ref):
+        """
+        Whether `ref` can name a user (a pk or a username). Booleans are ints in Python,
+        but `true` must not resolve to the user with pk 1.
+        """
+        return isinstance(ref, (int, str)) and not isinstance(ref, bool)
+
+    @staticmethod
+    def _clean_bulk_row(payload, created_by, users, departments):
+        """
+        Validates one bulk payload against the preloaded users and departments.
+        Returns (errors, cleaned_row).
+        """
+        if not isinstance(payload, dict):
+            return ["Each minute must be an object."], None
+
+        errors = []
+        subject = payload.get("subject")
+        description = payload.get("description")
+
+        if not isinstance(subject, str) or not subject.strip():
+            errors.append("Subject is required.")
+        elif len(subject) > Minute._meta.get_field("subject").max_length:
+            errors.append("Subject is too long.")
+
+        if not isinstance(description, str) or not description.strip():
+            errors.append("Description is required.")
+
+        creator_ref = payload.get("created_by", created_by)
+        is_ref = isinstance(creator_ref, User) or MinuteManager._is_user_ref(creator_ref)
+        creator = users.get(creator_ref) if is_ref else None
+        if not creator:
+            errors.append(f"Unknown creator: {creator_ref}.")
+
+        department_code = payload.get("department")
+        if department_code:
+            department = departments.get(department_code.upper()) if isinstance(department_code, str) else None
+            if not department:
+                errors.append(f"Unknown department: {department_code}.")
+        else:
+            department = creator.department if creator else None
+            if creator and not department:
+                errors.append("The creator must belong to a department to create a Minute.")
+
+        approvers = []
+        approver_refs = payload.get("approvers") or []
+        if not isinstance(approver_refs, list):
+            errors.append("Approvers must be a list.")
+            approver_refs = []
+
+        for ref in approver_refs:
+            user = users.get(ref) if MinuteManager._is_user_ref(ref) else None
+            if not user:
+                errors.append(f"Unknown approver: {ref}.")
+            elif user == creator:
+                errors.append("The minute creator cannot be an approver.")
+            elif user in approvers:
+                errors.append(f"{user.get_full_name() or user.username} is listed more than once.")
+            else:
+                approvers.append(user)
+
+        if errors:
+            return errors, None
+
+        return [], {
+            "subject": subject.strip(),
+            "description": description,
+            "created_by": creator,
+            "department": department,
+            "approvers": approvers,
+        }
 
 
 class Minute(models.Model):
@@ -44,6 +426,12 @@ class Minute(models.Model):
 
     subject = models.CharField(max_length=255, help_text="The subject of the minute sheet.")
     description = models.TextField(help_text="Detailed description of the minute.")
+    description_page_offsets = models.JSONField(
+        default=list,
+        blank=True,
+        editable=False,
+        help_text="Character offset where each description page starts (kept in sync on save).",
+    )
     unique_id = models.CharField(max_length=50, unique=True, editable=False, help_text="Auto-generated unique ID.")
     sheet_no = models.PositiveIntegerField(help_text="Auto-incremented Sheet No per department.")
 
@@ -78,189 +466,663 @@ class Minute(models.Model):
         help_text="Optional attachment (PDF, image, Word, Excel, etc.)."
     )
 
+    objects = MinuteManager()
+
     class Meta:
         ordering = ["-created_at"]
         indexes = [
             models.Index(fields=["unique_id"]),
             models.Index(fields=["status"]),
+            models.Index(fields=["department", "-created_at"], name="minute_dept_created_idx"),  # ✅ Department listings
         ]
 
     def __str__(self):
         return f"{self.subject} ({self.unique_id})"
 
-    # apps/minute/models.py
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # ✅ Remember the stored attachment, so a save can tell whether a new file arrived
+        if "attachment" in instance.__dict__:
+            instance._stored_attachment = instance.__dict__["attachment"] or ""
+        return instance
+
+    def attachment_changed(self):
+        """
+        Whether the attachment differs from the one last loaded or saved.
+        Always true for a minute that was not loaded from the database.
+        """
+        return (self.attachment.name or "") != getattr(self, "_stored_attachment", None)
 
     def save(self, *args, **kwargs):
         """
-        Custom save method to ensure:
-        - Unique ID and Sheet Number are set.
-        - Approval Chain is created (if missing).
-        - First Approver is activated automatically.
+        Custom save method to ensure Unique ID and Sheet Number are set.
+        New minutes should go through `Minute.objects.create_minute()`, which also
+        creates the approval chain and its approvers.
         """
-        if not self.department:
+        if not self.department_id:
             self.department = self.created_by.department  # Auto-assign department from user
 
-        if not self.unique_id:
-            self.unique_id = generate_unique_id(self.department)
+        if not self.unique_id or not self.sheet_no:
+            unique_ids, sheet_nos = MinuteSequence.reserve_ids(self.department)
+            self.unique_id = self.unique_id or unique_ids[0]
+            self.sheet_no = self.sheet_no or sheet_nos[0]
 
-        if not self.sheet_no:
-            last_sheet = Minute.objects.filter(department=self.department).order_by("-sheet_no").first()
-            self.sheet_no = (last_sheet.sheet_no + 1) if last_sheet else 1
+        # ✅ Page boundaries are computed once here, so serving page N is a slice
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "description" in update_fields:
+            self.description_page_offsets = description_page_offsets(self.description)
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "description_page_offsets"}
 
-        super().save(*args, **kwargs)  # ✅ First save the Minute object
+        super().save(*args, **kwargs)
+        if update_fields is None or "attachment" in update_fields:
+            self._stored_attachment = self.attachment.name or ""
 
-        # ✅ Ensure ApprovalChain is created **only if it does not exist**
-        ApprovalChain = apps.get_model("approval_chain", "ApprovalChain")
+    @property
+    def description_page_count(self):
+        """
+        Number of description pages (an empty description still renders one page).
+        """
+        return max(1, len(self.description_page_offsets))
 
-        if not self.approval_chain:
-            approval_chain = ApprovalChain.objects.create(
-                name=f"Approval Chain for {self.unique_id}",
-                created_by=self.created_by,
-                minute=self
-            )
-            self.approval_chain = approval_chain
-            self.save(update_fields=["approval_chain"])  # ✅ Save only the new field
+    def description_page(self, number):
+        """
+        Returns the text of description page `number` (1-based, clamped to the valid range).
+        """
+        offsets = self.description_page_offsets
+        if not offsets:
+            return "No description available."
+        number = max(1, min(number, len(offsets)))
+        end = offsets[number] if number < len(offsets) else len(self.description)
+        return self.description[offsets[number - 1]:end].strip()
 
-        # ✅ Auto-Activate First Approver
-        first_approver = self.approval_chain.approvers.order_by("order").first()
-        if first_approver and not first_approver.is_current:
-            first_approver.is_current = True
-            first_approver.save()  # ✅ Ensure the first approver is activated immediately
+    @staticmethod
+    def final_status_for(status):
+        """
+        Returns the status a minute ends with once its chain completes (rejected minutes are archived).
+        """
+        return "Archived" if status == "Rejected" else status
 
     @transaction.atomic
     def finalize_minute(self, status):
         """
         Finalizes the minute by marking it as Approved or Rejected, then moving to the archive.
         """
-        self.status = status
+        old_status, self.status = self.status, self.final_status_for(status)
         self.approval_chain.status = "Completed"
-        self.approval_chain.save()
+        self.approval_chain.save(update_fields=["status"])
+        self.save(update_fields=["status"])
+        InboxEntry.objects.sync([self.pk])
+        MinuteRollup.objects.record([(self, old_status, self.status)])
 
-        if status == "Rejected":
-            self.archive()
+    def approve(self, approver, remark_text=None):
+        """
+        Approves the minute and moves it to the next approver.
+        If it's the last approver, the minute is marked as 'Approved'.
+        """
+        return apply_transition(self, approver, APPROVE, remark_text=remark_text)
 
-        self.save()
+    def reject(self, approver, remark_text=None):
+        """
+        Rejects the minute and archives it.
+        """
+        return apply_transition(self, approver, REJECT, remark_text=remark_text)
+
+    def mark_to(self, approver, target_user, target_order=None, remark_text=None):
+        """
+        Marks the minute to another user, inserting them into the approval chain.
+        The new approver becomes the current approver.
+        """
+        return apply_transition(
+            self, approver, MARK_TO, target_user=target_user, target_order=target_order, remark_text=remark_text
+        )
+
+    def return_to(self, approver, target_user, remark_text=None):
+        """
+        Returns the minute to a previous approver.
+        """
+        return apply_transition(self, approver, RETURN_TO, target_user=target_user, remark_text=remark_text)
 
     @transaction.atomic
-    def approve(self, approver):
+    def archive(self):
         """
-        Approves the minute and moves it to the next approver.
-        If it's the last approver, the minute is marked as 'Approved'.
+        Moves the minute to the archive after approval or rejection.
         """
-        current_approver = self.approval_chain.approvers.filter(user=approver, is_current=True).first()
+        old_status, self.status = self.status, "Archived"
+        self.save()
+        InboxEntry.objects.sync([self.pk])
+        MinuteRollup.objects.record([(self, old_status, self.status)])
 
-        if not current_approver:
-            raise ValidationError("You are not authorized to approve this minute.")
+    def is_pending(self):
+        return self.status == "Pending"
 
-        current_approver.approve()
+    def is_archived(self):
+        return self.status == "Archived"
 
-        next_approver = self.approval_chain.get_next_approver(current_approver.order)
 
-        if next_approver:
-            next_approver.is_current = True
-            next_approver.save()
-        else:
-            self.finalize_minute("Approved")
+# ✅ Inbox list orderings: sort key -> InboxEntry column (each backed by a keyset index)
+INBOX_SORTS = {"age": "waiting_since", "department": "department_name", "subject": "subject"}
+DEFAULT_INBOX_SORT = "age"
+INBOX_LIST_FIELDS = (
+    "minute_id", "approval_chain_id", "subject", "unique_id", "department_name",
+    "created_by_name", "minute_created_at", "waiting_since",
+)
+INBOX_COPIED_FIELDS = ("subject", "unique_id", "department", "created_by")  # ✅ Minute fields inbox rows copy
+
+
+class InboxEntryManager(models.Manager):
+    """
+    Keeps the materialized inbox in step with the approval chains and pages through it.
+    """
 
     @transaction.atomic
-    def reject(self, approver):
+    def sync(self, minute_ids):
         """
-        Rejects the minute and archives it.
+        Rebuilds the inbox rows of the given minutes from their chains' current-approver pointer:
+        a Pending minute gets one row for its current approver, anything else gets none.
+        Runs in a fixed number of queries however many minutes are passed.
         """
-        current_approver = self.approval_chain.approvers.filter(user=approver, is_current=True).first()
+        Remark = apps.get_model("remarks", "Remark")
 
-        if not current_approver:
-            raise ValidationError("You are not authorized to reject this minute.")
+        minute_ids = list(minute_ids)
+        self.filter(minute_id__in=minute_ids).delete()  # ✅ Counted out by the post_delete signal
 
-        current_approver.reject()
-        self.finalize_minute("Rejected")
+        last_action_at = Remark.objects.filter(minute=models.OuterRef("pk")).order_by("-timestamp").values("timestamp")
+        minutes = (
+            Minute.objects.filter(
+                pk__in=minute_ids, status="Pending", approval_chain__current_approver__isnull=False
+            )
+            .select_related("department", "created_by", "approval_chain")
+            .annotate(last_action_at=models.Subquery(last_action_at[:1]))
+            .order_by()
+        )
+        entries = self.bulk_create([
+            self.model(
+                user_id=minute.approval_chain.current_user_id,
+                minute=minute,
+                approval_chain=minute.approval_chain,
+                approver_id=minute.approval_chain.current_approver_id,
+                subject=minute.subject,
+                unique_id=minute.unique_id,
+                department=minute.department,
+                department_name=minute.department.name,
+                created_by_name=minute.created_by.get_full_name(),
+                minute_created_at=minute.created_at,
+                waiting_since=minute.last_action_at or minute.created_at,  # ✅ Last transition, else creation
+            )
+            for minute in minutes
+        ])
 
-    @transaction.atomic
-    def mark_to(self, approver, target_user, target_order=None):
+        # ✅ Keep the cached per-user counts in step instead of recounting
+        adjust_inbox_counts_on_commit(Counter(entry.user_id for entry in entries))
+        return entries
+
+    def refresh_copies(self, **filters):
         """
-        Marks the minute to another user, inserting them into the approval chain.
-        - If an approver already exists at the target order, shift all subsequent approvers down.
-        - Ensures only one approver remains active.
+        Rewrites the minute, department and creator details copied onto the rows matching
+        `filters` (e.g. `minute=...`, `department=...`) in one UPDATE, leaving who they wait on alone.
+        """
+        minute = Minute.objects.filter(pk=models.OuterRef("minute_id"))
+        full_name = Trim(Concat("created_by__first_name", models.Value(" "), "created_by__last_name"))
+        return self.filter(**filters).update(
+            subject=models.Subquery(minute.values("subject")[:1]),
+            unique_id=models.Subquery(minute.values("unique_id")[:1]),
+            department_id=models.Subquery(minute.values("department_id")[:1]),
+            department_name=models.Subquery(minute.values("department__name")[:1]),
+            created_by_name=models.Subquery(minute.annotate(name=full_name).values("name")[:1]),
+        )
+
+    def count_for(self, user):
+        """
+        The number of minutes waiting on the user, from the cached counter.
+        """
+        return cached_inbox_count(user.pk, lambda: self.filter(user=user).count())
+
+    def page(self, user, cursor=None, limit=25, sort=DEFAULT_INBOX_SORT, department=None):
+        """
+        Keyset-paginates a user's inbox in `sort` order (a key of INBOX_SORTS, "-" for descending),
+        optionally limited to one department. Only the columns the list shows are loaded.
+        Returns (entries, next_cursor); `next_cursor` is None on the last page.
+        Raises ValueError for a malformed cursor or an unknown sort.
+        """
+        if sort.removeprefix("-") not in INBOX_SORTS:
+            raise ValueError(f"Unknown inbox sort: {sort}")
+        field = INBOX_SORTS[sort.removeprefix("-")]
+        descending = sort.startswith("-")
+
+        entries = self.filter(user=user).only(*INBOX_LIST_FIELDS)
+        if department:
+            entries = entries.filter(department_id=department)
+        entries = entries.order_by(f"-{field}", "-pk") if descending else entries.order_by(field, "pk")
+
+        if cursor:
+            value, pk = self.decode_cursor(cursor, field)
+            after = "lt" if descending else "gt"
+            entries = entries.filter(
+                models.Q(**{f"{field}__{after}": value}) | models.Q(**{field: value, f"pk__{after}": pk})
+            )
+
+        entries = list(entries[:limit + 1])
+        next_cursor = self.encode_cursor(entries[limit - 1], field) if len(entries) > limit else None
+        return entries[:limit], next_cursor
+
+    @staticmethod
+    def encode_cursor(entry, field="waiting_since"):
+        return encode_keyset_cursor(getattr(entry, field), entry.pk)
+
+    def decode_cursor(self, cursor, field="waiting_since"):
+        if isinstance(self.model._meta.get_field(field), models.DateTimeField):
+            return decode_keyset_cursor(cursor)
+        return decode_keyset_cursor(cursor, parse=str)
+
+
+class InboxEntry(models.Model):
+    """
+    Materialized approval inbox: one row per user per minute waiting on them.
+    Denormalizes what the pending list shows, so it is read without joins.
+    Maintained by `InboxEntryManager.sync()` whenever a chain's current approver changes.
+    """
+
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="inbox_entries", help_text="User the minute is waiting on."
+    )
+    minute = models.ForeignKey(Minute, on_delete=models.CASCADE, related_name="inbox_entries")
+    approval_chain = models.ForeignKey("approval_chain.ApprovalChain", on_delete=models.CASCADE, related_name="+")
+    approver = models.ForeignKey(Approver, on_delete=models.CASCADE, related_name="+")
+
+    subject = models.CharField(max_length=255)
+    unique_id = models.CharField(max_length=50)
+    department = models.ForeignKey("departments.Department", on_delete=models.CASCADE, related_name="+")
+    department_name = models.CharField(max_length=100)
+    created_by_name = models.CharField(max_length=301)
+    minute_created_at = models.DateTimeField()
+    waiting_since = models.DateTimeField(help_text="When the minute reached this user.")
+
+    objects = InboxEntryManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["user", "minute"], name="inbox_entry_unique_user_minute"),
+        ]
+        indexes = [
+            models.Index(fields=["user", "waiting_since", "id"], name="inbox_entry_keyset_idx"),
+            models.Index(fields=["user", "department_name", "id"], name="inbox_entry_dept_name_idx"),
+            models.Index(fields=["user", "subject", "id"], name="inbox_entry_subject_idx"),
+            models.Index(fields=["user", "department", "waiting_since", "id"], name="inbox_entry_dept_age_idx"),
+            models.Index(fields=["department", "waiting_since"], name="inbox_entry_dept_oldest_idx"),  # ✅ Dashboards
+            models.Index(fields=["waiting_since"], name="inbox_entry_oldest_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.unique_id} waiting on {self.user}"
+
+    @property
+    def waiting_for(self):
         """
-        # ✅ Ensure the user making this action is the current approver
-        current_approver = self.approval_chain.approvers.filter(user=approver, is_current=True).first()
+        How long the minute has been waiting on this user.
+        """
+        return now() - self.waiting_since
 
-        if not current_approver:
-            raise ValidationError("You are not authorized to mark this minute to another user.")
 
-        if self.approval_chain.approvers.filter(user=target_user).exists():
-            raise ValidationError(f"{target_user.get_full_name()} is already in the approval chain.")
+def build_minute_rollups(Minute, Remark):
+    """
+    Computes every rollup row from scratch as {(scope, scope_id): counters}.
+    A completed minute's turnaround runs from creation to its last remark.
+    Takes the model classes so data migrations can pass their historical models.
+    """
+    last_action_at = Remark.objects.filter(minute=models.OuterRef("pk")).order_by("-timestamp").values("timestamp")
+    rollups = {}
+    for created_by_id, department_id, status, created_at, last_at in (
+        Minute.objects.annotate(last_action_at=models.Subquery(last_action_at[:1]))
+        .values_list("created_by_id", "department_id", "status", "created_at", "last_action_at")
+        .order_by()
+        .iterator(chunk_size=2000)
+    ):
+        for key in ((MinuteRollup.USER, created_by_id), (MinuteRollup.DEPARTMENT, department_id)):
+            counters = rollups.setdefault(key, Counter())
+            counters[status.lower()] += 1
+            if status != "Pending":
+                counters["completed"] += 1
+                counters["turnaround_seconds"] += int(((last_at or created_at) - created_at).total_seconds())
+    return rollups
+
 
-        max_order = self.approval_chain.approvers.aggregate(models.Max("order"))["order__max"] or 0
-        target_order = target_order or max_order + 1  # Default to next available order
+# ✅ Sent after rollups change, with the IDs of the departments whose counters moved
+rollups_recorded = Signal()
 
-        # ✅ If inserting in the middle, shift subsequent orders down
-        if target_order <= max_order:
-            self.approval_chain.approvers.filter(order__gte=target_order).update(order=F("order") + 1)
 
-        # ✅ Create new approver
-        new_approver = Approver.objects.create(
-            approval_chain=self.approval_chain,
-            user=target_user,
-            order=target_order,
-            status="Pending",
-            is_current=False  # Default to inactive
+class MinuteRollupManager(models.Manager):
+    """
+    Keeps the running minute counters in step with status changes.
+    """
+
+    def record(self, changes):
+        """
+        Applies status changes to the rollups of each minute's creator and department.
+        `changes` holds (minute, old_status, new_status); None stands for "did not exist".
+        Writes one INSERT plus one UPDATE per distinct set of deltas, whatever the number of minutes.
+        Deleting a completed minute also takes back its turnaround, which is read from its remarks,
+        so deletions must be recorded before the remarks are gone (pre_delete).
+        """
+        changes = list(changes)
+        turnarounds = self.turnarounds(
+            minute for minute, old_status, new_status in changes if old_status not in (None, "Pending") and not new_status
         )
 
-        # ✅ Update the current approver's status
-        current_approver.status = "Marked"
-        current_approver.is_current = False
-        current_approver.save()
+        deltas = {}
+        for minute, old_status, new_status in changes:
+            if old_status == new_status:
+                continue
+            for key in ((MinuteRollup.USER, minute.created_by_id), (MinuteRollup.DEPARTMENT, minute.department_id)):
+                counters = deltas.setdefault(key, Counter())
+                if old_status:
+                    counters[old_status.lower()] -= 1
+                if new_status:
+                    counters[new_status.lower()] += 1
+                if old_status == "Pending" and new_status:
+                    counters["completed"] += 1
+                    counters["turnaround_seconds"] += int((now() - minute.created_at).total_seconds())
+                elif old_status not in (None, "Pending") and not new_status:
+                    counters["completed"] -= 1
+                    counters["turnaround_seconds"] -= turnarounds[minute.pk]
+        if not deltas:
+            return
 
-        # ✅ Ensure only one approver remains active
-        next_approver = self.approval_chain.approvers.filter(order__gt=self.order, status="Pending").order_by(
-            "order").first()
+        # ✅ Rows are created on first use, then every key sharing the same deltas is updated at once
+        self.bulk_create(
+            [self.model(scope=scope, scope_id=scope_id) for scope, scope_id in sorted(deltas)],
+            ignore_conflicts=True,
+        )
+        keys_by_delta = {}
+        for key, counters in sorted(deltas.items()):
+            delta = frozenset((name, value) for name, value in counters.items() if value)
+            if delta:
+                keys_by_delta.setdefault(delta, []).append(key)
+        for delta, keys in keys_by_delta.items():
+            matching = models.Q()
+            for scope, scope_id in keys:
+                matching |= models.Q(scope=scope, scope_id=scope_id)
+            self.filter(matching).update(**{name: F(name) + value for name, value in delta})
 
-        if next_approver:
-            next_approver.is_current = True
-            next_approver.save()
-        else:
-            new_approver.is_current = True  # If no next approver, activate the new one
-            new_approver.save()
+        rollups_recorded.send(
+            sender=MinuteRollup,
+            department_ids=[scope_id for scope, scope_id in deltas if scope == MinuteRollup.DEPARTMENT],
+        )
 
-    @transaction.atomic
-    def return_to(self, approver, target_user):
+    def turnarounds(self, minutes):
         """
-        Returns the minute to a previous approver.
+        {minute_id: seconds from creation to the last remark} for completed minutes,
+        counted the way `build_minute_rollups` counts them.
+        """
+        minutes = {minute.pk: minute for minute in minutes}
+        if not minutes:
+            return {}
+        Remark = apps.get_model("remarks", "Remark")
+        last_action_at = dict(
+            Remark.objects.filter(minute_id__in=minutes)
+            .values("minute_id")
+            .annotate(last_action_at=models.Max("timestamp"))
+            .values_list("minute_id", "last_action_at")
+            .order_by()
+        )
+        return {
+            pk: int(((last_action_at.get(pk) or minute.created_at) - minute.created_at).total_seconds())
+            for pk, minute in minutes.items()
+        }
+
+    def for_user(self, user):
+        """
+        The rollup row of the minutes the user created (unsaved and empty if they have none).
+        """
+        return self.filter(scope=MinuteRollup.USER, scope_id=user.pk).first() or self.model(
+            scope=MinuteRollup.USER, scope_id=user.pk
+        )
+
+    def for_departments(self, department_ids=None):
+        """
+        Department rollup rows (all departments, or the given ones) annotated with the department name.
+        """
+        Department = apps.get_model("departments", "Department")
+        rollups = self.filter(scope=MinuteRollup.DEPARTMENT)
+        if department_ids is not None:
+            rollups = rollups.filter(scope_id__in=department_ids)
+        return rollups.annotate(
+            department_name=models.Subquery(
+                Department.objects.filter(pk=models.OuterRef("scope_id")).values("name")[:1]
+            )
+        ).filter(department_name__isnull=False).order_by("department_name")
+
+
+class MinuteRollup(models.Model):
+    """
+    Running minute counters per creator and per department, so dashboards read
+    a handful of rows instead of aggregating the whole minute history.
+    Maintained by `MinuteRollupManager.record()`; `rebuild_minute_rollups` recomputes it.
+    """
+
+    USER = "user"
+    DEPARTMENT = "department"
+    SCOPE_CHOICES = [(USER, "Creator"), (DEPARTMENT, "Department")]
+
+    scope = models.CharField(max_length=20, choices=SCOPE_CHOICES)
+    scope_id = models.PositiveIntegerField(help_text="User or department ID, depending on the scope.")
+
+    pending = models.IntegerField(default=0)
+    approved = models.IntegerField(default=0)
+    rejected = models.IntegerField(default=0)
+    archived = models.IntegerField(default=0)
+    completed = models.IntegerField(default=0, help_text="Minutes that have left Pending.")
+    turnaround_seconds = models.BigIntegerField(default=0, help_text="Total time from creation to completion.")
+
+    objects = MinuteRollupManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["scope", "scope_id"], name="minute_rollup_unique_scope"),
+        ]
+
+    def __str__(self):
+        return f"{self.get_scope_display()} {self.scope_id} rollup"
+
+    @classmethod
+    def combined(cls, rollups):
+        """
+        An unsaved rollup holding the sums of the given ones.
         """
-        current_approver = self.approval_chain.approvers.filter(user=approver, is_current=True).first()
+        total = cls()
+        for rollup in rollups:
+            for name in ("pending", "approved", "rejected", "archived", "completed", "turnaround_seconds"):
+                setattr(total, name, getattr(total, name) + getattr(rollup, name))
+        return total
 
-        if not current_approver:
-            raise ValidationError("You are not authorized to return this minute.")
+    @property
+    def total(self):
+        return self.pending + self.approved + self.rejected + self.archived
 
-        previous_approver = self.approval_chain.approvers.filter(user=target_user,
-                                                                 order__lt=current_approver.order).first()
+    @property
+    def average_turnaround(self):
+        """
+        Mean time from creation to completion, or None before anything completes.
+        """
+        return timedelta(seconds=self.turnaround_seconds / self.completed) if self.completed else None
 
-        if not previous_approver:
-            raise ValidationError("The selected user is not a previous approver.")
+    @property
+    def average_turnaround_hours(self):
+        return self.turnaround_seconds / self.completed / 3600 if self.completed else None
 
-        # ✅ Deactivate the current approver
-        current_approver.is_current = False
-        current_approver.status = "Returned"
-        current_approver.save()
 
-        # ✅ Reactivate the previous approver only if necessary
-        if previous_approver.status != "Pending":
-            previous_approver.status = "Pending"
+SEARCH_PAGE_SIZE = 20
+SEARCH_MAX_PAGE = 500  # ✅ Deeper pages are refused; the offset would only grow (and overflow the database's integers)
+SEARCH_FTS_TABLE = "minute_search_fts"  # ✅ SQLite FTS5 shadow of MinuteSearchDocument, kept in step by triggers
+SEARCH_FIELDS = ("unique_id", "subject", "description", "remarks")
 
-        previous_approver.is_current = True
-        previous_approver.save()
+# ✅ Field weights: PostgreSQL setweight() letters and the matching SQLite bm25() column weights
+SEARCH_WEIGHTS = {"unique_id": ("A", 10.0), "subject": ("A", 10.0), "description": ("B", 4.0), "remarks": ("C", 1.0)}
+
+
+def build_search_documents(Minute, Remark, minute_ids):
+    """
+    The searchable text of the given minutes as {minute_id: {field: text}}, remarks joined oldest first.
+    Takes the model classes so data migrations can pass their historical models.
+    """
+    documents = {
+        pk: {"unique_id": unique_id, "subject": subject, "description": description, "remarks": []}
+        for pk, unique_id, subject, description in Minute.objects.filter(pk__in=minute_ids)
+        .values_list("pk", "unique_id", "subject", "description")
+        .order_by()
+    }
+    for minute_id, text in (
+        Remark.objects.filter(minute_id__in=documents).exclude(text__isnull=True).exclude(text="")
+        .values_list("minute_id", "text")
+        .order_by("timestamp", "pk")
+    ):
+        documents[minute_id]["remarks"].append(text)
+    for document in documents.values():
+        document["remarks"] = "\n".join(document["remarks"])
+    return documents
+
+
+def search_vector():
+    """
+    The weighted tsvector expression stored in MinuteSearchDocument.search_vector on PostgreSQL.
+    Reference numbers are indexed without stemming.
+    """
+    vectors = [
+        SearchVector(field, weight=weight, config="simple" if field == "unique_id" else "english")
+        for field, (weight, _) in SEARCH_WEIGHTS.items()
+    ]
+    return reduce(operator.add, vectors)
+
+
+class MinuteSearchDocumentManager(models.Manager):
+    """
+    Keeps the search documents in step with minutes and remarks and runs ranked searches.
+    """
 
     @transaction.atomic
-    def archive(self):
+    def sync(self, minute_ids):
         """
-        Moves the minute to the archive after approval or rejection.
+        Rebuilds the search documents of the given minutes with one upsert
+        (plus one UPDATE of the search vectors on PostgreSQL), however many are passed.
         """
-        self.status = "Archived"
-        self.save()
+        Minute = apps.get_model("minute", "Minute")
+        Remark = apps.get_model("remarks", "Remark")
 
-    def is_pending(self):
-        return self.status == "Pending"
+        documents = build_search_documents(Minute, Remark, list(minute_ids))
+        self.bulk_create(
+            [self.model(minute_id=pk, **fields) for pk, fields in documents.items()],
+            update_conflicts=True,
+            unique_fields=["minute"],
+            update_fields=list(SEARCH_FIELDS),
+        )
+        if connection.vendor == "postgresql":
+            self.filter(minute_id__in=documents).update(search_vector=search_vector())
+        return documents
 
-    def is_archived(self):
-        return self.status == "Archived"
+    def sync_on_commit(self, minute_ids):
+        """
+        Reindexes the minutes once the surrounding transaction commits, so indexing never
+        lengthens the transactions that hold approval locks.
+        """
+        minute_ids = list(minute_ids)
+        if minute_ids:
+            transaction.on_commit(lambda: self.sync(minute_ids))
+
+    def search(self, user, query, page=1, limit=SEARCH_PAGE_SIZE):
+        """
+        Ranked search over the minutes `user` may read, best match first.
+        Every word of `query` must match, as a prefix, in the reference number, subject,
+        description or remarks. Returns (minutes, has_next); each minute has a `search_rank`.
+        Pages past SEARCH_MAX_PAGE are empty.
+        Uses the GIN-indexed tsvector on PostgreSQL and the FTS5 table elsewhere.
+        """
+        terms = re.findall(r"\w+", query.lower())
+        if not terms or page > SEARCH_MAX_PAGE:
+            return [], False
+
+        Minute = apps.get_model("minute", "Minute")
+        visible = Minute.objects.visible_to(user)
+        offset = (page - 1) * limit
+
+        if connection.vendor == "postgresql":
+            search_query = SearchQuery(" & ".join(f"{term}:*" for term in terms), search_type="raw", config="english")
+            ranked = list(
+                self.filter(search_vector=search_query, minute__in=visible)
+                .annotate(rank=SearchRank(F("search_vector"), search_query))
+                .order_by("-rank", "-minute_id")
+                .values_list("minute_id", "rank")[offset:offset + limit + 1]
+            )
+        else:
+            visible_sql, visible_params = visible.values("pk").query.sql_with_params()
+            weights = ", ".join(str(weight) for _, weight in SEARCH_WEIGHTS.values())
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"SELECT rowid, -bm25({SEARCH_FTS_TABLE}, {weights}) AS rank FROM {SEARCH_FTS_TABLE} "
+                    f"WHERE {SEARCH_FTS_TABLE} MATCH %s AND rowid IN ({visible_sql}) "
+                    f"ORDER BY rank DESC, rowid DESC LIMIT %s OFFSET %s",
+                    [" ".join(f'"{term}"*' for term in terms), *visible_params, limit + 1, offset],
+                )
+                ranked = cursor.fetchall()
+
+        minutes = (
+            Minute.objects.select_related("department", "created_by", "approval_chain")
+            .defer("description_page_offsets")
+            .in_bulk([pk for pk, rank in ranked[:limit]])
+        )
+        results = []
+        for pk, rank in ranked[:limit]:
+            minute = minutes[pk]
+            minute.search_rank = rank
+            results.append(minute)
+        return results, len(ranked) > limit and page < SEARCH_MAX_PAGE
+
+
+class MinuteSearchDocument(models.Model):
+    """
+    Search copy of a minute: its reference number, subject, description and the text of its remarks.
+    PostgreSQL searches the weighted `search_vector` through a GIN index; SQLite searches the
+    FTS5 table `minute_search_fts`, which triggers keep in step with this one.
+    Maintained by `MinuteSearchDocumentManager.sync()`; `rebuild_search_index` recomputes it.
+    """
+
+    minute = models.OneToOneField(Minute, on_delete=models.CASCADE, primary_key=True, related_name="search_document")
+    unique_id = models.CharField(max_length=50)
+    subject = models.CharField(max_length=255)
+    description = models.TextField()
+    remarks = models.TextField(blank=True, help_text="Text of the minute's remarks, oldest first.")
+    search_vector = SearchVectorField(null=True, help_text="Weighted tsvector (PostgreSQL only).")
+
+    objects = MinuteSearchDocumentManager()
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=["search_vector"], name="minute_search_vector_idx"),  # ✅ PostgreSQL only
+        ]
+
+    def __str__(self):
+        return f"Search document for {self.unique_id}"
+
+
+class AttachmentRendition(models.Model):
+    """
+    What a minute's attachment was turned into when it was uploaded, so downloads and the
+    detail page do not convert it again:
+    - `pdf`: the attachment as PDF pages, ready to append to the sheet (images and Excel
+      sheets only; a PDF attachment is used as it is).
+    - `page_count` and `preview_html` (an Excel sheet's first rows as a table).
+    `sha256` is the attachment version it was made from; a replaced attachment is ingested again.
+    Written by `apps.minute.attachments.ingest_attachment()`; `ingest_attachments` backfills it.
+    """
+
+    minute = models.OneToOneField(
+        Minute, on_delete=models.CASCADE, primary_key=True, related_name="attachment_rendition"
+    )
+    sha256 = models.CharField(max_length=64, help_text="SHA-256 of the attachment this was made from.")
+    pdf = models.FileField(upload_to="minute_attachments/renditions/", blank=True)
+    page_count = models.PositiveIntegerField(null=True, blank=True)
+    preview_html = models.TextField(blank=True)
+    ingested_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Attachment rendition for Minute {self.minute_id}"
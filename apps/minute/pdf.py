@@ -0,0 +1,359 @@
+# apps/minute/pdf.py
+"""
+Minute sheet PDFs and their content-addressed render cache.
+
+The sheet HTML is cheap to build; laying it out with WeasyPrint and merging the
+attachment is what costs seconds. Rendered PDFs are therefore stored on disk under
+a hash of the sheet HTML and the attachment's contents, so an unchanged minute is
+served from the file and any change (text, approvals, remarks, attachment) yields a
+new key. The cache is bounded by total bytes and evicts the least recently served files.
+"""
+import hashlib
+import logging
+import os
+import tempfile
+import shutil
+import time
+from contextlib import ExitStack
+from pathlib import Path
+
+import pandas as pd
+import weasyprint
+from django.conf import settings
+from django.core.cache import cache
+from django.template.loader import get_template
+from PIL import Image
+from PyPDF2 import PdfReader, PdfWriter
+
+from apps.minute.models import AttachmentRendition
+from apps.remarks.models import Remark
+
+logger = logging.getLogger(__name__)
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg")
+EXCEL_EXTENSIONS = (".xls", ".xlsx")
+
+# ✅ Bump when the rendering code changes in a way the sheet HTML does not show
+PDF_RENDER_VERSION = 1
+
+PDF_STYLESHEET = '''
+    @page {
+        size: A4 portrait;
+        margin: 1in;
+
+        /* ✅ Dynamic Page Numbering */
+        @bottom-center {
+            content: "Page " counter(page) " of " counter(pages);
+            font-size: 10pt;
+            font-family: "Times New Roman", serif;
+        }
+
+        /* ✅ Dynamic Sheet Number */
+        @top-right {
+            content: "Sheet: " counter(page);
+            font-weight: bold;
+            font-size: 12pt;
+            font-family: "Times New Roman", serif;
+        }
+    }
+
+    body {
+        font-family: 'Times New Roman', serif;
+        font-size: 12pt;
+        line-height: 1.5;
+    }
+'''
+
+
+def minute_sheet_html(minute):
+    """
+    Renders the sheet's HTML: the minute, its approvers' progress and every remark.
+    """
+    approvers_status = []
+    if minute.approval_chain_id:
+        for approver in minute.approval_chain.approvers.order_by("order").select_related("user"):
+            approvers_status.append({
+                "approver": approver.user.get_full_name(),
+                "status": approver.status,
+                "is_current": approver.is_current,
+            })
+
+    # ✅ The sheet is the full record, so every remark is printed; only the columns it shows are loaded
+    remarks = Remark.objects.filter(minute=minute).select_related("user").only(
+        "text", "timestamp", "user__first_name", "user__last_name"
+    ).order_by("-timestamp", "-pk")
+
+    return get_template("minute/minutesheet_pdf.html").render({
+        "minute": minute,
+        "approvers_status": approvers_status,
+        "remarks": remarks,
+        "sheet_no": "DYNAMIC_SHEET_NO",  # This will be replaced dynamically
+    })
+
+
+def spooled_file():
+    """
+    Scratch file kept in memory up to MINUTE_PDF_SPOOL_MAX_BYTES and moved to disk past that.
+    """
+    return tempfile.SpooledTemporaryFile(max_size=settings.MINUTE_PDF_SPOOL_MAX_BYTES, suffix=".pdf")
+
+
+def read_excel_attachment(path):
+    """
+    Reads the first sheet of an .xls or .xlsx file into a DataFrame.
+    """
+    return pd.read_excel(path, engine="xlrd" if path.lower().endswith(".xls") else "openpyxl")
+
+
+def write_attachment_pdf(path, output, frame=None):
+    """
+    Writes an image or Excel attachment to `output` as PDF pages; an Excel sheet that was
+    already read can be passed as `frame`. Returns False for types that are not converted.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension in IMAGE_EXTENSIONS:
+        with Image.open(path) as image:
+            image.convert("RGB").save(output, format="PDF")
+    elif extension in EXCEL_EXTENSIONS:
+        frame = read_excel_attachment(path) if frame is None else frame
+        weasyprint.HTML(string=f"<h3>Excel Attachment</h3>{frame.to_html(index=False, border=1)}").write_pdf(output)
+    else:
+        return False
+    return True
+
+
+def open_attachment_pdf(minute, stack):
+    """
+    Opens the PDF pages to append for the minute's attachment (closed with `stack`), or returns None:
+    - a PDF attachment is appended as it is;
+    - an image or Excel sheet uses the rendition made when it was uploaded (`apps.minute.attachments`),
+      and is only converted here if that has not run yet for the current file.
+    """
+    path = minute.attachment.path
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".pdf":
+        return stack.enter_context(open(path, "rb"))
+    if extension not in IMAGE_EXTENSIONS + EXCEL_EXTENSIONS:
+        return None
+
+    rendition = AttachmentRendition.objects.filter(minute_id=minute.pk, sha256=attachment_digest(minute)).first()
+    if rendition and rendition.pdf:
+        try:
+            return stack.enter_context(rendition.pdf.open("rb"))
+        except FileNotFoundError:
+            logger.warning(f"⚠ Rendition of Minute {minute.pk}'s attachment is missing; converting it again.")
+
+    converted = stack.enter_context(spooled_file())
+    try:
+        write_attachment_pdf(path, converted)
+    except Exception as e:
+        logger.error(f"❌ ERROR: Could not convert attachment of Minute {minute.pk}: {e}")
+        return None
+    converted.seek(0)
+    return converted
+
+
+def render_minute_pdf(minute, html, on_progress=None):
+    """
+    Lays out the sheet HTML and appends the attachment's pages (see `open_attachment_pdf()`).
+    Returns the PDF as a spooled temporary file positioned at the start; the caller closes it.
+    `on_progress(percent)` is called as each stage finishes.
+    Every intermediate PDF is spooled the same way, so a large attachment lands on disk
+    instead of being held several times over in memory.
+    """
+    on_progress = on_progress or (lambda percent: None)
+    with ExitStack() as stack:
+        pdf_writer = PdfWriter()
+        main_pdf = stack.enter_context(spooled_file())
+        weasyprint.HTML(string=html).write_pdf(main_pdf, stylesheets=[weasyprint.CSS(string=PDF_STYLESHEET)])
+        main_pdf.seek(0)
+        pdf_writer.append(PdfReader(main_pdf))  # ✅ Add the main minute PDF first
+        on_progress(60)
+
+        if minute.attachment:
+            attachment_pdf = open_attachment_pdf(minute, stack)
+            if attachment_pdf:
+                # ✅ Kept open until the output is written: pages are read from the file as they are copied
+                for page in PdfReader(attachment_pdf).pages:
+                    pdf_writer.add_page(page)
+            on_progress(85)
+
+        output = spooled_file()
+        try:
+            pdf_writer.write(output)
+        except BaseException:
+            output.close()
+            raise
+    output.seek(0)
+    return output
+
+
+def attachment_digest(minute):
+    """
+    SHA-256 of the attachment's bytes ("" without one). The digest is memoized in the
+    cache by path, size and modification time, so the file is read once per version.
+    """
+    if not minute.attachment:
+        return ""
+    try:
+        stat = os.stat(minute.attachment.path)
+    except FileNotFoundError:
+        return "missing"
+
+    key = f"attachment-digest:{hashlib.sha256(minute.attachment.path.encode()).hexdigest()}"
+    cached = cache.get(key)
+    if cached and cached[0] == (stat.st_size, stat.st_mtime_ns):
+        return cached[1]
+
+    digest = hashlib.sha256()
+    with open(minute.attachment.path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    cache.set(key, ((stat.st_size, stat.st_mtime_ns), digest.hexdigest()), None)
+    return digest.hexdigest()
+
+
+def minute_pdf_key(html, attachment_sha):
+    """
+    The cache key of a rendered sheet: a hash of everything the PDF is built from.
+    """
+    content = f"{PDF_RENDER_VERSION}\0{PDF_STYLESHEET}\0{attachment_sha}\0{html}"
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+class PdfCache:
+    """
+    Directory of rendered PDFs named by content key, bounded by `max_bytes`.
+    - A hit refreshes the file's modification time, so eviction drops the least recently served.
+    - Files are written to a temporary name and renamed, so readers never see a partial PDF.
+    - Concurrent misses for one key render once: the first request takes a lock in the
+      (shared) cache and the others wait for its file instead of rendering themselves.
+    Hits and writes return open file objects; an open file stays readable if it is evicted meanwhile.
+    """
+
+    lock_timeout = 120  # Seconds a render may hold the lock before others give up waiting
+    poll_interval = 0.2
+
+    def __init__(self, directory=None, max_bytes=None):
+        self._directory = directory
+        self._max_bytes = max_bytes
+
+    @property
+    def directory(self):
+        return Path(self._directory or settings.MINUTE_PDF_CACHE_DIR)
+
+    @property
+    def max_bytes(self):
+        return self._max_bytes if self._max_bytes is not None else settings.MINUTE_PDF_CACHE_MAX_BYTES
+
+    def path_for(self, key):
+        return self.directory / f"{key}.pdf"
+
+    def get(self, key):
+        """
+        Returns the cached PDF opened for reading, or None.
+        """
+        path = self.path_for(key)
+        try:
+            pdf = open(path, "rb")
+        except FileNotFoundError:
+            return None
+        try:
+            os.utime(path)  # ✅ Recently used
+        except FileNotFoundError:
+            pass  # Evicted since we opened it; the open file is still complete
+        return pdf
+
+    def put(self, key, data):
+        """
+        Stores a rendered PDF (bytes or a readable file, copied in chunks), evicts least
+        recently used files over the size limit and returns the new file opened for reading.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                if hasattr(data, "read"):
+                    shutil.copyfileobj(data, f)
+                else:
+                    f.write(data)
+            os.replace(temp_path, self.path_for(key))
+        except PermissionError:
+            # Windows will not replace a file someone is reading; it already holds these bytes
+            Path(temp_path).unlink(missing_ok=True)
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+
+        pdf = open(self.path_for(key), "rb")
+        self.evict(keep=key)
+        return pdf
+
+    def evict(self, keep=None):
+        """
+        Deletes the least recently used PDFs until the directory fits in `max_bytes`.
+        """
+        entries = []
+        for path in self.directory.glob("*.pdf"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if path.stem == keep:
+                continue
+            try:
+                path.unlink(missing_ok=True)
+            except PermissionError:  # Open for reading on Windows; try again next time
+                continue
+            total -= size
+
+    def get_or_render(self, key, render):
+        """
+        Returns the cached PDF for `key`, calling `render()` (which returns bytes or a file,
+        closed once stored) at most once across concurrent requests when it is missing.
+        """
+        pdf = self.get(key)
+        if pdf:
+            return pdf
+
+        lock_key = f"minute-pdf:{key}:lock"
+        deadline = time.monotonic() + self.lock_timeout
+        while not cache.add(lock_key, True, self.lock_timeout):
+            time.sleep(self.poll_interval)
+            pdf = self.get(key)
+            if pdf:
+                return pdf  # ✅ Rendered by the request holding the lock
+            if time.monotonic() > deadline:
+                return self._render_into(key, render)  # The holder stalled; do not wait forever
+
+        try:
+            return self.get(key) or self._render_into(key, render)
+        finally:
+            cache.delete(lock_key)
+
+    def _render_into(self, key, render):
+        rendered = render()
+        try:
+            return self.put(key, rendered)
+        finally:
+            if hasattr(rendered, "close"):
+                rendered.close()
+
+
+minute_pdf_cache = PdfCache()
+
+
+def cached_minute_pdf(minute):
+    """
+    Returns the minute's sheet PDF as an open file, rendering it only when its content changed.
+    """
+    html = minute_sheet_html(minute)
+    return minute_pdf_cache.get_or_render(
+        minute_pdf_key(html, attachment_digest(minute)), lambda: render_minute_pdf(minute, html)
+    )
@@ -1,27 +1,14 @@
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.conf import settings
 from django.dispatch import receiver
-from django.apps import apps
-from .models import Minute
-from django.db.models.signals import post_delete
-from django.dispatch import receiver
-from django.db import connection
-from apps.minute.models import Minute
-
-@receiver(post_save, sender=Minute)
-def create_approval_chain(sender, instance, created, **kwargs):
-    """
-    Auto-create an Approval Chain when a new Minute is created.
-    """
-    if created and not instance.approval_chain:
-        ApprovalChain = apps.get_model("approval_chain", "ApprovalChain")
-        approval_chain = ApprovalChain.objects.create(
-            name=f"Approval Chain for {instance.unique_id}",
-            created_by=instance.created_by,
-            minute=instance
-        )
-        instance.approval_chain = approval_chain
-        instance.save(update_fields=["approval_chain"])
-
+from django.db import connection, transaction
+from apps.approval_chain.models import Approver
+from apps.approval_chain.transitions import transitions_applied
+from apps.departments.models import Department
+from apps.minute.cache import adjust_inbox_counts_on_commit, bump_minute_versions_on_commit
+from apps.minute.models import INBOX_COPIED_FIELDS, SEARCH_FIELDS, InboxEntry, Minute, MinuteRollup, MinuteSearchDocument
+from apps.minute.tasks import ingest_minute_attachment
+from apps.remarks.models import Remark
 
 @receiver(post_delete, sender=Minute)
 def reset_minute_id_sequence(sender, **kwargs):
@@ -31,4 +18,139 @@ def reset_minute_id_sequence(sender, **kwargs):
     """
     if not Minute.objects.exists():  # ✅ If no Minutes exist, reset ID
         with connection.cursor() as cursor:
-            cursor.execute("SELECT setval(pg_get_serial_sequence('minute_minute', 'id'), 1, false);")
\ No newline at end of file
+            cursor.execute("SELECT setval(pg_get_serial_sequence('minute_minute', 'id'), 1, false);")
+
+
+@receiver(transitions_applied)
+def refresh_inbox(sender, transitions, **kwargs):
+    """
+    Moves inbox rows to the new current approvers, in the same transaction as the transitions.
+    """
+    InboxEntry.objects.sync(transition.minute.pk for transition in transitions)
+
+
+@receiver(post_delete, sender=InboxEntry)
+def release_inbox_count(sender, instance, **kwargs):
+    """
+    Takes deleted inbox rows out of the cached counts, whether `InboxEntryManager.sync`
+    removed them or they went with their minute or approver (CASCADE).
+    """
+    adjust_inbox_counts_on_commit({instance.user_id: -1})
+
+
+@receiver(transitions_applied)
+def record_completed_minutes(sender, transitions, **kwargs):
+    """
+    Moves completed minutes from Pending to their final status in the dashboard rollups.
+    """
+    MinuteRollup.objects.record(
+        (transition.minute, "Pending", transition.minute.status) for transition in transitions if transition.final_status
+    )
+
+
+@receiver(pre_delete, sender=Minute)
+def remove_deleted_minute_from_rollups(sender, instance, **kwargs):
+    """
+    Deleted minutes stop counting towards their creator's and department's totals.
+    Runs before the delete, while the remarks that date a completed minute's turnaround still exist.
+    """
+    MinuteRollup.objects.record([(instance, instance.status, None)])
+
+
+@receiver(transitions_applied)
+def bump_status_versions(sender, transitions, **kwargs):
+    """
+    Invalidates ETags of the minutes whose approval state changed.
+    """
+    bump_minute_versions_on_commit(transition.minute.pk for transition in transitions)
+
+
+@receiver([post_save, post_delete], sender=Approver)
+def bump_status_version_for_approver(sender, instance, **kwargs):
+    """
+    Same for approvers added, edited or removed outside the transition engine (chain views, admin).
+    """
+    bump_minute_versions_on_commit(
+        Minute.objects.filter(approval_chain_id=instance.approval_chain_id).values_list("pk", flat=True)
+    )
+
+
+@receiver(post_save, sender=Minute)
+def bump_version_on_edit(sender, instance, **kwargs):
+    """
+    Edited minutes drop their cached detail and tracking pages.
+    """
+    bump_minute_versions_on_commit([instance.pk])
+
+
+@receiver([post_save, post_delete], sender=Remark)
+def bump_version_on_remark(sender, instance, **kwargs):
+    """
+    Remarks saved outside the transition engine (which bumps the version itself).
+    """
+    bump_minute_versions_on_commit([instance.minute_id])
+
+
+@receiver(post_save, sender=Minute)
+def refresh_inbox_copies_of_minute(sender, instance, created=False, update_fields=None, **kwargs):
+    """
+    Inbox rows copy the subject, unique ID, department and creator; edits from anywhere
+    (admin, API, forms) are copied over. New minutes get their rows from `create_minute`.
+    """
+    if not created and (update_fields is None or set(update_fields) & set(INBOX_COPIED_FIELDS)):
+        InboxEntry.objects.refresh_copies(minute=instance)
+
+
+@receiver(post_save, sender=Department)
+def refresh_inbox_copies_of_department(sender, instance, created=False, update_fields=None, **kwargs):
+    """
+    Renamed departments are renamed in the inbox rows of their minutes too.
+    """
+    if not created and (update_fields is None or "name" in update_fields):
+        InboxEntry.objects.refresh_copies(department=instance)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def refresh_inbox_copies_of_creator(sender, instance, created=False, update_fields=None, **kwargs):
+    """
+    Same for renamed users, in the inbox rows of the minutes they created.
+    """
+    if not created and (update_fields is None or set(update_fields) & {"first_name", "last_name"}):
+        InboxEntry.objects.refresh_copies(minute__created_by=instance)
+
+
+@receiver(post_save, sender=Minute)
+def index_minute(sender, instance, update_fields=None, **kwargs):
+    """
+    Reindexes new minutes and edits to their searchable fields (status-only saves are skipped).
+    """
+    if update_fields is None or set(update_fields) & set(SEARCH_FIELDS):
+        MinuteSearchDocument.objects.sync_on_commit([instance.pk])
+
+
+@receiver(post_save, sender=Minute)
+def ingest_uploaded_attachment(sender, instance, update_fields=None, **kwargs):
+    """
+    Queues conversion of a newly uploaded attachment once the save commits.
+    Saves that leave the attachment as it was do not queue anything.
+    """
+    if (update_fields is None or "attachment" in update_fields) and instance.attachment and instance.attachment_changed():
+        transaction.on_commit(lambda: ingest_minute_attachment.delay(instance.pk))
+
+
+@receiver(transitions_applied)
+def index_transition_remarks(sender, transitions, **kwargs):
+    """
+    Adds the text of remarks left with approval actions to the search index.
+    """
+    MinuteSearchDocument.objects.sync_on_commit(
+        transition.minute.pk for transition in transitions if transition.remark and transition.remark.text
+    )
+
+
+@receiver([post_save, post_delete], sender=Remark)
+def index_remark(sender, instance, **kwargs):
+    """
+    Same for remarks saved or deleted outside the transition engine.
+    """
+    MinuteSearchDocument.objects.sync_on_commit([instance.minute_id])
@@ -0,0 +1,133 @@
+# apps/minute/tasks.py
+"""
+Background minute sheet PDF renders and attachment ingestion.
+
+A download request starts a job and gets its ID back at once; the render runs on a
+Celery worker (the "pdf" queue) and the browser polls the job's status until it can
+download the file. Job state lives in the cache for PDF_JOB_TIMEOUT seconds:
+    {"minute_id", "user_id", "filename", "state", "progress", "key", "error"}
+The PDF itself goes to the content-addressed render cache, so a job for an unchanged
+minute finishes without rendering and repeated jobs never render the same content twice.
+"""
+import logging
+import threading
+import uuid
+
+from celery import shared_task
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.minute.attachments import ingest_attachment
+from apps.minute.models import Minute
+from apps.minute.pdf import attachment_digest, minute_pdf_cache, minute_pdf_key, minute_sheet_html, render_minute_pdf
+
+logger = logging.getLogger(__name__)
+
+PDF_JOB_KEY = "minute-pdf-job:{}"
+PDF_JOB_TIMEOUT = 60 * 60
+
+QUEUED = "queued"
+RENDERING = "rendering"
+DONE = "done"
+FAILED = "failed"
+
+_render_slots = None
+_render_slots_lock = threading.Lock()
+
+
+def pdf_job(job_id):
+    """
+    Returns the job's state dict, or None once it expired (or never existed).
+    """
+    return cache.get(PDF_JOB_KEY.format(job_id))
+
+
+def update_pdf_job(job_id, **changes):
+    """
+    Merges `changes` into the job's state. Only the worker running the job writes to it after it is queued.
+    """
+    job = {**(pdf_job(job_id) or {}), **changes}
+    cache.set(PDF_JOB_KEY.format(job_id), job, PDF_JOB_TIMEOUT)
+    return job
+
+
+def start_pdf_job(minute, user):
+    """
+    Creates a PDF job for the minute on behalf of `user` and queues its render.
+    When the sheet is already in the render cache the job is done straight away.
+    Returns (job_id, job).
+    """
+    job_id = uuid.uuid4().hex
+    key = minute_pdf_key(minute_sheet_html(minute), attachment_digest(minute))
+    job = update_pdf_job(
+        job_id,
+        minute_id=minute.pk,
+        user_id=user.pk,
+        filename=f"Minute_{minute.unique_id}.pdf",
+        state=QUEUED,
+        progress=0,
+        key=None,
+        error=None,
+    )
+
+    pdf = minute_pdf_cache.get(key)
+    if pdf:
+        pdf.close()
+        return job_id, update_pdf_job(job_id, state=DONE, progress=100, key=key)
+
+    render_minute_pdf_job.delay(job_id, minute.pk)
+    return job_id, pdf_job(job_id) or job
+
+
+def render_slots():
+    """
+    Per-process semaphore capping simultaneous renders at MINUTE_PDF_RENDER_CONCURRENCY,
+    so a threaded worker pool cannot run more WeasyPrint layouts than the machine has room for.
+    """
+    global _render_slots
+    with _render_slots_lock:
+        if _render_slots is None:
+            _render_slots = threading.BoundedSemaphore(settings.MINUTE_PDF_RENDER_CONCURRENCY)
+    return _render_slots
+
+
+@shared_task
+def render_minute_pdf_job(job_id, minute_id):
+    """
+    Renders the minute's sheet into the render cache, reporting progress on the job.
+    The sheet is rebuilt here, so the PDF matches the minute as it is when the worker gets to it.
+    """
+    update_pdf_job(job_id, state=RENDERING, progress=10)
+    try:
+        minute = Minute.objects.select_related("created_by__department", "approval_chain").get(pk=minute_id)
+        html = minute_sheet_html(minute)
+        key = minute_pdf_key(html, attachment_digest(minute))
+        update_pdf_job(job_id, progress=20)
+
+        def render():
+            # ✅ Only the render itself takes a slot; waiting on another worker's render of the same key does not
+            with render_slots():
+                return render_minute_pdf(minute, html, on_progress=lambda percent: update_pdf_job(job_id, progress=percent))
+
+        minute_pdf_cache.get_or_render(key, render).close()
+    except Minute.DoesNotExist:
+        update_pdf_job(job_id, state=FAILED, error="The minute no longer exists.")
+    except Exception:
+        logger.exception(f"❌ ERROR: PDF job {job_id} for Minute {minute_id} failed")
+        update_pdf_job(job_id, state=FAILED, error="The PDF could not be generated.")
+    else:
+        update_pdf_job(job_id, state=DONE, progress=100, key=key)
+
+
+@shared_task
+def ingest_minute_attachment(minute_id):
+    """
+    Converts a minute's newly uploaded attachment once; see `apps.minute.attachments`.
+    If it fails, sheet downloads keep converting the attachment themselves.
+    """
+    try:
+        ingest_attachment(Minute.objects.get(pk=minute_id))
+    except Minute.DoesNotExist:
+        pass
+    except Exception:
+        logger.exception(f"❌ ERROR: Could not ingest the attachment of Minute {minute_id}")
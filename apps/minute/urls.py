@@ -2,20 +2,44 @@
 from django.urls import path
 from .views import (
     CreateMinuteView,
+    bulk_create_minutes_view,
     view_minute_detail,
+    description_page_view,
+    remarks_timeline_view,
     minute_action_view,
     pending_approvals,
+    batch_action_view,
+    search_minutes,
     tracking_minute_view,
+    approval_status_view,
+    approval_status_stream,
+    approval_status_wait,
     generate_minute_pdf,  # ✅ Import the new PDF view
+    start_pdf_job_view,
+    pdf_job_status_view,
+    pdf_job_download_view,
+    export_minute_pdfs,
 )
 
 app_name = "minute"
 
 urlpatterns = [
     path("create/", CreateMinuteView.as_view(), name="create"),  # ✅ Create a new minute
+    path("bulk/", bulk_create_minutes_view, name="bulk_create"),  # ✅ Import many minutes at once (JSON)
     path("<int:minute_id>/", view_minute_detail, name="detail"),  # ✅ View an existing minute
+    path("<int:minute_id>/description/<int:page>/", description_page_view, name="description_page"),  # ✅ One page (JSON)
+    path("<int:minute_id>/remarks/", remarks_timeline_view, name="remarks_timeline"),  # ✅ Older remarks (JSON, keyset)
     path("<int:minute_id>/action/", minute_action_view, name="action"),  # ✅ Approvers take actions
     path("pending/", pending_approvals, name="pending_approvals"),  # ✅ View pending approvals
+    path("pending/batch/", batch_action_view, name="batch_action"),  # ✅ Approve or reject many at once
+    path("search/", search_minutes, name="search"),  # ✅ Ranked full-text search
     path("<int:minute_id>/tracking/", tracking_minute_view, name="tracking"),  # ✅ View tracking details
+    path("api/approval_status/<int:minute_id>/", approval_status_view, name="approval_status"),  # ✅ Polled JSON status
+    path("api/approval_status/<int:minute_id>/stream/", approval_status_stream, name="approval_status_stream"),  # ✅ SSE
+    path("api/approval_status/<int:minute_id>/wait/", approval_status_wait, name="approval_status_wait"),  # ✅ Long-poll
     path("<int:minute_id>/pdf/", generate_minute_pdf, name="generate_pdf"),  # ✅ New: Generate and download PDF
+    path("<int:minute_id>/pdf/jobs/", start_pdf_job_view, name="pdf_job_start"),  # ✅ Render in the background
+    path("pdf/jobs/<str:job_id>/", pdf_job_status_view, name="pdf_job_status"),  # ✅ Polled job status (JSON)
+    path("pdf/jobs/<str:job_id>/download/", pdf_job_download_view, name="pdf_job_download"),
+    path("export/pdf/", export_minute_pdfs, name="export_pdfs"),  # ✅ ZIP of many sheets (filters in the query)
 ]
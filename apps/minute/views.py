@@ -9,21 +9,33 @@ from .models import Minute
 from .forms import MinuteForm
 from django.shortcuts import render, get_object_or_404
 from django.contrib.auth.decorators import login_required
-from django.http import JsonResponse, HttpResponseForbidden
+from django.http import Http404, JsonResponse, HttpResponseForbidden, HttpResponseNotModified, StreamingHttpResponse
 from django.utils.decorators import method_decorator
+from django.views.decorators.http import require_GET, require_POST
 from django.views.generic import DetailView
-from apps.minute.models import Minute
+from django.utils.http import parse_etags
+from django.template.defaultfilters import date as date_filter, linebreaks_filter
+from django.utils.timezone import localtime
+from asgiref.sync import sync_to_async
+from apps.minute.cache import cached_for_version, minute_version, wait_for_version_change
+from apps.minute.pdf import cached_minute_pdf, minute_pdf_cache
+from apps.minute.tasks import DONE, pdf_job, start_pdf_job
+from apps.minute.models import DEFAULT_INBOX_SORT, INBOX_SORTS, InboxEntry, Minute, MinuteSearchDocument
+from apps.departments.models import Department
 from apps.approval_chain.models import ApprovalChain
 from apps.approval_chain.models import Approver
-from apps.minute.forms import MarkToForm, ReturnToForm
+from apps.approval_chain.transitions import APPROVE, MARK_TO, REJECT, RETURN_TO, apply_transition, apply_transitions
+from apps.minute.forms import MarkToForm, MinuteExportForm, ReturnToForm
+from apps.minute.export import iter_minutes_zip
 from django.core.exceptions import ValidationError
 from django.db import transaction
-from django.db.models import F, Max
+import json
+from pathlib import Path
+from django.conf import settings
+from urllib.parse import urlencode
+from utils.http import ranged_file_response
 import logging
 logger = logging.getLogger(__name__)
-import weasyprint
-from django.http import HttpResponse
-from django.template.loader import get_template
 from django.shortcuts import get_object_or_404
 from apps.remarks.forms import RemarkForm
 
@@ -46,7 +58,7 @@ class CreateMinuteView(LoginRequiredMixin, CreateView):
     def form_valid(self, form):
         """
         Automatically assigns the department from the logged-in user before saving.
-        Then redirects to create an approval chain for this minute.
+        Then redirects to add approvers to the minute's approval chain.
         """
         user = self.request.user
 
@@ -58,12 +70,12 @@ class CreateMinuteView(LoginRequiredMixin, CreateView):
         # ✅ Auto-assign department from the user
         form.instance.department = user.department
         form.instance.created_by = user
-        self.object = form.save()
+        self.object = form.save()  # ✅ Creates the Minute and its Approval Chain together
 
-        messages.success(self.request, "Minute created successfully. Now create the Approval Chain.")
+        messages.success(self.request, "Minute created successfully. Now add approvers to its Approval Chain.")
 
-        # ✅ Redirect to Approval Chain Creation, passing the Minute ID
-        return redirect(reverse("approval_chain:create") + f"?minute_id={self.object.id}")
+        # ✅ Redirect straight to adding approvers on the chain created with the Minute
+        return redirect(reverse("approval_chain:add_approver", kwargs={"chain_id": self.object.approval_chain_id}))
 
     def form_invalid(self, form):
         """
@@ -73,6 +85,37 @@ class CreateMinuteView(LoginRequiredMixin, CreateView):
         return self.render_to_response(self.get_context_data(form=form))
 
 
+@login_required
+@require_POST
+def bulk_create_minutes_view(request):
+    """
+    API Endpoint: Creates many minutes at once from a JSON payload.
+    - Body: a list of minutes, or {"minutes": [...]}; see `MinuteManager.bulk_create_minutes`.
+    - Accessible only to Admins and superusers (e.g. the registrar office).
+    - Reports success or errors for every row.
+    """
+    if not (request.user.is_superuser or request.user.role in ("Admin", "Superuser")):
+        return HttpResponseForbidden("You are not authorized to import minutes.")
+
+    try:
+        payload = json.loads(request.body)
+    except ValueError:
+        return JsonResponse({"error": "Request body must be valid JSON."}, status=400)
+
+    if isinstance(payload, dict):
+        payload = payload.get("minutes")
+    if not isinstance(payload, list):
+        return JsonResponse({"error": "Expected a list of minutes."}, status=400)
+
+    results = Minute.objects.bulk_create_minutes(payload, created_by=request.user)
+    created = sum(1 for result in results if "id" in result)
+
+    return JsonResponse(
+        {"created": created, "failed": len(results) - created, "results": results},
+        status=201 if created else 400,
+    )
+
+
 @login_required
 def view_minute_detail(request, minute_id):
     """
@@ -82,15 +125,11 @@ def view_minute_detail(request, minute_id):
     - Implements pagination for long descriptions.
     """
 
-    # ✅ Fetch Minute
-    minute = get_object_or_404(Minute, pk=minute_id)
-    approval_chain = getattr(minute, 'approval_chain', None)
+    # ✅ Everything below is cached per minute version; a repeat view is one cache read
+    context = cached_for_version(minute_id, "detail", lambda: _minute_detail_context(minute_id))
 
     # ✅ Ensure only the Minute Creator or an Approver can view it
-    is_creator = minute.created_by == request.user
-    is_approver = approval_chain and approval_chain.approvers.filter(user=request.user).exists()
-
-    if not (is_creator or is_approver):
+    if request.user.pk not in context["viewer_ids"]:
         return HttpResponseForbidden("You are not authorized to view this minute.")
 
     # ✅ Read Current Page from GET request
@@ -99,56 +138,127 @@ def view_minute_detail(request, minute_id):
     except ValueError:
         page = 1  # Fallback to prevent errors
 
-    # ✅ Define Words Per Page
-    MAX_WORDS_PER_PAGE = 200
-
-    # ✅ Paginate Description
-    description_pages = split_description_into_pages(minute.description, MAX_WORDS_PER_PAGE)
-    total_pages = len(description_pages)
-
     # ✅ Ensure Page is Within Range
+    minute = context["minute"]
+    total_pages = minute.description_page_count
     page = max(1, min(page, total_pages))
 
-    # ✅ Get Content for Current Page
-    current_description = description_pages[page - 1] if description_pages else "No content available."
-
-    # ✅ Fetch Approval Chain & Approvers
-    approvers_status = []
-    if approval_chain:
-        for approver in approval_chain.approvers.order_by('order'):
-            approvers_status.append({
-                'approver': approver.user.get_full_name(),
-                'status': approver.status,
-                'is_current': approver.is_current,
-            })
-
-    # ✅ Fetch Remarks for this minute
-    remarks = Remark.objects.filter(minute=minute).order_by("-timestamp")  # Latest remarks first
-    print(f"✅ DEBUG: Loaded {remarks.count()} remarks for Minute ID {minute_id}")  # 🔥 Debugging
+    # ✅ Get Content for Current Page (a slice at the offsets stored on save)
+    current_description = minute.description_page(page)
 
     # ✅ Render Page with `minutesheet.html`
     return render(request, "minute/view_minute.html", {
         'minute': minute,
-        'approval_chain': approval_chain,
-        'approvers_status': approvers_status,
+        'approval_chain': context["approval_chain"],
+        'approvers_status': context["approvers_status"],
         'current_description': current_description,
         'total_pages': total_pages,
         'current_page': page,
-        'remarks': remarks,
+        'remarks': context["remarks"],
+        'remarks_next_cursor': context["remarks_next_cursor"],
     })
 
 
-def split_description_into_pages(description, words_per_page=200):
+@login_required
+@require_GET
+def description_page_view(request, minute_id, page):
     """
-    Automatically splits long descriptions into multiple pages, keeping sentences intact.
+    Returns one page of a minute's description as JSON, so the detail page can
+    flip pages without re-rendering the sheet.
     """
-    if not description or not isinstance(description, str):
-        return ["No description available."]
+    context = cached_for_version(minute_id, "detail", lambda: _minute_detail_context(minute_id))
+    if request.user.pk not in context["viewer_ids"]:
+        return JsonResponse({"error": "You are not authorized to view this minute."}, status=403)
 
-    words = description.split()
-    pages = [" ".join(words[i:i + words_per_page]) for i in range(0, len(words), words_per_page)]
+    minute = context["minute"]
+    total_pages = minute.description_page_count
+    if not 1 <= page <= total_pages:
+        return JsonResponse({"error": "Page out of range.", "total_pages": total_pages}, status=404)
+
+    text = minute.description_page(page)
+    return JsonResponse({"page": page, "total_pages": total_pages, "text": text, "html": linebreaks_filter(text)})
+
+
+def _approvers_status(approval_chain):
+    """
+    Approver names and statuses in chain order (one query).
+    """
+    if not approval_chain:
+        return []
+    return [
+        {
+            "approver": f"{approver['user__first_name']} {approver['user__last_name']}".strip(),
+            "status": approver["status"],
+            "is_current": approver["is_current"],
+        }
+        for approver in approval_chain.approvers.order_by("order").values(
+            "user__first_name", "user__last_name", "status", "is_current"
+        )
+    ]
+
+
+def _minute_detail_context(minute_id):
+    """
+    Assembles what `view_minute_detail` renders, in a fixed number of queries.
+    Raises Http404 for unknown minutes.
+    """
+    minute = get_object_or_404(
+        Minute.objects.select_related("created_by__department", "approval_chain", "attachment_rendition"), pk=minute_id
+    )
+    approval_chain = minute.approval_chain
+
+    viewer_ids = {minute.created_by_id}
+    if approval_chain:
+        viewer_ids.update(approval_chain.approvers.values_list("user_id", flat=True))
+
+    return {
+        "minute": minute,
+        "approval_chain": approval_chain,
+        "viewer_ids": viewer_ids,
+        "approvers_status": _approvers_status(approval_chain),
+        **_first_remarks_page(minute.pk),
+    }
+
+
+def _first_remarks_page(minute_id):
+    """
+    The newest page of the remarks timeline, embedded in the page; the rest loads on demand.
+    """
+    remarks, next_cursor = Remark.objects.timeline(minute_id)
+    return {"remarks": remarks, "remarks_next_cursor": next_cursor}
+
+
+@login_required
+@require_GET
+def remarks_timeline_view(request, minute_id):
+    """
+    Returns the next page of a minute's remarks (newest first) as JSON.
+    `?cursor=` is the `next_cursor` of the previous page.
+    """
+    context = cached_for_version(minute_id, "detail", lambda: _minute_detail_context(minute_id))
+    if request.user.pk not in context["viewer_ids"]:
+        return JsonResponse({"error": "You are not authorized to view this minute."}, status=403)
+
+    try:
+        remarks, next_cursor = Remark.objects.timeline(minute_id, cursor=request.GET.get("cursor"))
+    except ValueError:
+        return JsonResponse({"error": "Invalid cursor."}, status=400)
+
+    return JsonResponse({
+        "remarks": [
+            {
+                "id": remark.pk,
+                "user": remark.user.get_full_name(),
+                "action": remark.action,
+                "text": remark.text,
+                "timestamp": remark.timestamp.isoformat(),
+                "timestamp_display": date_filter(localtime(remark.timestamp), "jS F, Y H:i"),
+            }
+            for remark in remarks
+        ],
+        "next_cursor": next_cursor,
+    })
 
-    return pages
 
 @login_required
 def minute_action_view(request, minute_id):
@@ -161,7 +271,9 @@ def minute_action_view(request, minute_id):
     """
     logger.info(f"🔍 DEBUG: Accessing minute_action_view for Minute ID: {minute_id}")
 
-    minute = get_object_or_404(Minute, pk=minute_id)
+    minute = get_object_or_404(
+        Minute.objects.select_related("approval_chain__current_approver__user"), pk=minute_id
+    )
     approval_chain = minute.approval_chain
 
     if not approval_chain:
@@ -169,9 +281,9 @@ def minute_action_view(request, minute_id):
         logger.warning(f"⚠️ WARNING: Minute {minute_id} has no approval chain.")
         return redirect("minute:tracking", minute_id=minute.id)
 
-    # ✅ Ensure at least one active approver exists
-    current_approver = approval_chain.approvers.filter(user=request.user, is_current=True).first()
-    if not current_approver:
+    # ✅ The chain's current-approver pointer answers this without touching the approvers table
+    current_approver = approval_chain.current_approver
+    if approval_chain.current_user_id != request.user.pk or not current_approver:
         messages.warning(request, "You are not the current approver for this minute.")
         logger.warning(f"⚠️ WARNING: User {request.user} is not the current approver for Minute {minute_id}.")
         return redirect("minute:tracking", minute_id=minute.id)
@@ -189,36 +301,38 @@ def minute_action_view(request, minute_id):
         logger.info(f"✅ DEBUG: Request POST Data - {request.POST}")
 
         # ✅ Extract remark_text directly from request.POST
-        remark_text = request.POST.get("remark_text", "").strip()
+        remark_text = request.POST.get("remark_text", "").strip()  # ✅ Saved by the transition engine
         logger.info(f"✅ DEBUG: Extracted Remark Text - '{remark_text}'")
 
         try:
             with transaction.atomic():
-                if action == "approve":
-                    logger.info("✅ DEBUG: Processing 'approve' action...")
-                    response_message = approve_minute(current_approver, approval_chain, minute, remark_text)
-
-                elif action == "reject":
-                    logger.info("✅ DEBUG: Processing 'reject' action...")
-                    response_message = reject_minute(current_approver, minute, remark_text)
+                if action in (APPROVE, REJECT):
+                    logger.info(f"✅ DEBUG: Processing '{action}' action...")
+                    transition = apply_transition(minute, request.user, action, remark_text=remark_text)
 
-                elif action == "mark_to":
+                elif action == MARK_TO:
                     logger.info("✅ DEBUG: Processing 'mark_to' action...")
-                    mark_form = MarkToForm(request.POST, approval_chain=approval_chain)
-
-                    if mark_form.is_valid():
-                        response_message = mark_to_new_approver(
-                            request, mark_form, current_approver, approval_chain, remark_text
-                        )
-                    else:
+                    if not mark_form.is_valid():
                         messages.error(request, "Invalid selection for Mark-To action.")
                         logger.warning(f"⚠️ WARNING: Invalid Mark-To form! Errors: {mark_form.errors}")
                         return redirect("minute:tracking", minute_id=minute.id)
 
-                elif action == "return_to":
+                    transition = apply_transition(
+                        minute, request.user, MARK_TO,
+                        target_user=mark_form.cleaned_data["user"],
+                        target_order=mark_form.cleaned_data["order"],
+                        remark_text=remark_text,
+                    )
+
+                elif action == RETURN_TO:
                     logger.info("✅ DEBUG: Processing 'return_to' action...")
-                    response_message = return_to_previous_approver(
-                        request, return_form, current_approver, approval_chain, remark_text
+                    if not return_form.is_valid():
+                        raise ValidationError("Invalid selection for Return-To action.")
+
+                    transition = apply_transition(
+                        minute, request.user, RETURN_TO,
+                        target_user=return_form.cleaned_data["user"],
+                        remark_text=remark_text,
                     )
 
                 else:
@@ -226,12 +340,11 @@ def minute_action_view(request, minute_id):
                     raise ValidationError("Invalid action selected.")
 
         except ValidationError as e:
-            messages.error(request, str(e))
+            messages.error(request, " ".join(e.messages))
             logger.error(f"❌ ERROR: ValidationError occurred - {str(e)}")
             return redirect("minute:tracking", minute_id=minute.id)
 
-        # ✅ Save Remark
-
+        response_message = transition.message
         logger.info(f"✅ DEBUG: Remark Saved Successfully - User: {request.user.get_full_name()}, Action: {action}, Text: {remark_text}")
 
         # ✅ Always Redirect to Prevent Errors
@@ -243,349 +356,406 @@ def minute_action_view(request, minute_id):
         "minute": minute,
         "approval_chain": approval_chain,
         "current_approver": current_approver,
+        "current_position": approval_chain.approvers.filter(order__lte=current_approver.order).count(),
         "mark_form": mark_form,
         "return_form": return_form,
         "remark_form": remark_form,  # ✅ Include Remark Form in the template
     })
 
 
-### **✅ Updated Helper Functions to Save Remarks**
 from apps.remarks.models import Remark
 
+from django.db.models import Q
+
+INBOX_PAGE_SIZE = 25
+
 
-def save_remark(user, minute, action, text):
+@login_required
+def pending_approvals(request):
     """
-    Saves a remark for the given action taken on a minute.
-    Ensures that the action is valid and prevents duplicate remarks.
+    View for approvers to see all minutes awaiting their approval.
+    Reads the materialized inbox one keyset page at a time (`?after=<cursor>`), sorted by
+    `?sort=` (age, department or subject; "-" for descending) and filtered by `?department=`.
     """
+    sort = request.GET.get("sort") or DEFAULT_INBOX_SORT
+    department = request.GET.get("department") or None
+    if sort.removeprefix("-") not in INBOX_SORTS or (department and not department.isdigit()):
+        return redirect("minute:pending_approvals")
 
-    # ✅ Ensure action is correctly formatted
-    valid_actions = {
-        "approve": "Approve",
-        "reject": "Reject",
-        "mark_to": "Mark-To",
-        "return_to": "Return-To",
-    }
-
-    formatted_action = valid_actions.get(action.lower())
+    try:
+        entries, next_cursor = InboxEntry.objects.page(
+            request.user, cursor=request.GET.get("after"), limit=INBOX_PAGE_SIZE, sort=sort, department=department
+        )
+    except ValueError:
+        return redirect("minute:pending_approvals")  # ✅ Garbled cursor: start from the first page
+
+    # ✅ The chains shown on this page, in one query, with only the columns the list shows
+    chain_approvers = {}
+    for approver in Approver.objects.filter(
+        approval_chain_id__in=[entry.approval_chain_id for entry in entries]
+    ).select_related("user").only(
+        "approval_chain_id", "is_current", "user__first_name", "user__last_name"
+    ).order_by("order"):
+        chain_approvers.setdefault(approver.approval_chain_id, []).append(approver)
+    for entry in entries:
+        entry.chain_approvers = chain_approvers.get(entry.approval_chain_id, [])
 
-    if not formatted_action:
-        print(f"❌ ERROR: Invalid action '{action}' passed to save_remark()")
-        return
+    return render(request, "minute/pending_approvals.html", {
+        "pending_approvals": entries,
+        "next_cursor": next_cursor,
+        "is_first_page": not request.GET.get("after"),
+        "total_count": InboxEntry.objects.count_for(request.user),  # ✅ Cached counter, no COUNT(*) per page
+        "sort": sort,
+        "department": int(department) if department else None,
+        "departments": Department.objects.only("id", "name").order_by("name"),
+        "list_query": urlencode({key: value for key, value in (("sort", sort), ("department", department)) if value}),
+    })
 
-    # ✅ Retrieve the correct approver instance
-    approver = Approver.objects.filter(user=user, approval_chain=minute.approval_chain).first()
 
-    if not approver:
-        print(f"❌ ERROR: Approver not found for User: {user.get_full_name()} on Minute: {minute.unique_id}")
-        return
+@login_required
+def search_minutes(request):
+    """
+    Ranked full-text search over the minutes the user may read (`?q=`, `?page=`).
+    Matches reference numbers, subjects, descriptions and remarks; see `MinuteSearchDocumentManager.search`.
+    """
+    query = request.GET.get("q", "").strip()
+    page = request.GET.get("page", "1")
+    page = int(page) if page.isdigit() and int(page) > 0 else 1  # ✅ Pages past SEARCH_MAX_PAGE come back empty
+
+    results, has_next = MinuteSearchDocument.objects.search(request.user, query, page=page) if query else ([], False)
+
+    return render(request, "minute/search.html", {
+        "query": query,
+        "results": results,
+        "page": page,
+        "has_next": has_next,
+        "query_string": urlencode({"q": query}),
+    })
 
-    # ✅ Prevent duplicate remarks for the same action
-    existing_remark = Remark.objects.filter(
-        user=user, minute=minute, action=formatted_action, text=text
-    ).exists()
 
-    if existing_remark:
-        print(
-            f"⚠️ WARNING: Duplicate Remark Detected! Skipping save for User: {user.get_full_name()} on Minute: {minute.unique_id}")
-        return
+@login_required
+@require_POST
+def batch_action_view(request):
+    """
+    Approves or rejects many minutes in one request, with one optional remark shared by all.
+    - JSON body {"minute_ids": [...], "action": "approve" | "reject", "remark_text": "..."} gets a JSON report.
+    - The pending list's form posts the same fields and is redirected back with a summary.
+    Every minute succeeds or fails on its own; the report lists each one.
+    """
+    wants_json = request.content_type == "application/json"
+    if wants_json:
+        try:
+            payload = json.loads(request.body)
+        except ValueError:
+            return JsonResponse({"error": "Request body must be valid JSON."}, status=400)
+        if not isinstance(payload, dict):
+            return JsonResponse({"error": "Expected a JSON object."}, status=400)
+        minute_ids, action, remark_text = payload.get("minute_ids"), payload.get("action"), payload.get("remark_text")
+    else:
+        minute_ids = request.POST.getlist("minute_ids")
+        action, remark_text = request.POST.get("action"), request.POST.get("remark_text")
 
-    # ✅ Save the remark properly
-    remark = Remark.objects.create(
-        user=user,
-        minute=minute,
-        approver=approver,
-        action=formatted_action,
-        text=text.strip() if text else None
-    )
+    try:
+        if not isinstance(minute_ids, list) or not minute_ids:
+            raise ValidationError("Select at least one minute.")
+        try:
+            minute_ids = [int(minute_id) for minute_id in minute_ids]
+        except (TypeError, ValueError):
+            raise ValidationError("Minute IDs must be integers.")
+        if remark_text is not None and not isinstance(remark_text, str):
+            raise ValidationError("Remark text must be a string.")
+        transitions, errors = apply_transitions(minute_ids, request.user, action, remark_text=remark_text)
+    except ValidationError as e:
+        if wants_json:
+            return JsonResponse({"error": " ".join(e.messages)}, status=400)
+        messages.error(request, " ".join(e.messages))
+        return redirect("minute:pending_approvals")
+
+    done = {transition.minute.pk: transition for transition in transitions}
+    results = [
+        {"minute_id": minute_id, "unique_id": done[minute_id].minute.unique_id, "message": done[minute_id].message}
+        if minute_id in done else {"minute_id": minute_id, "error": errors[minute_id]}
+        for minute_id in dict.fromkeys(minute_ids)
+    ]
 
-    print(f"✅ DEBUG: Remark saved successfully! ID: {remark.id}, Action: {formatted_action}, Text: {remark.text}")
+    if wants_json:
+        return JsonResponse(
+            {"succeeded": len(done), "failed": len(errors), "results": results}, status=200 if done else 400
+        )
 
+    verb = "Approved" if action == APPROVE else "Rejected"
+    if done:
+        messages.success(request, f"{verb} {len(done)} minute(s).")
+    for result in results:
+        if "error" in result:
+            messages.error(request, f"Minute {result['minute_id']}: {result['error']}")
+    return redirect("minute:pending_approvals")
 
-def approve_minute(current_approver, approval_chain, minute, remark_text):
+# apps/minute/views.py
+@login_required
+def tracking_minute_view(request, minute_id):
     """
-    Handles minute approval by moving to the next approver or finalizing it.
+    View to track a minute's approval process.
+    Shows real-time status of approvers and actions taken.
     """
-    current_approver.status = "Approved"
-    current_approver.is_current = False
-    current_approver.save()
+    # ✅ Cached per minute version; a repeat view is one cache read
+    return render(request, "minute/tracking.html", cached_for_version(
+        minute_id, "tracking", lambda: _tracking_context(minute_id)
+    ))
+
 
-    save_remark(current_approver.user, minute, "approve", remark_text)  # ✅ Save remark
+def _tracking_context(minute_id):
+    """
+    Assembles what `tracking_minute_view` renders, in a fixed number of queries.
+    """
+    minute = get_object_or_404(
+        Minute.objects.select_related("created_by__department", "approval_chain"), pk=minute_id
+    )
 
-    # ✅ Move to the next approver
-    next_approver = approval_chain.approvers.filter(order=current_approver.order + 1, status="Pending").first()
+    return {
+        "minute": minute,
+        "approval_chain": minute.approval_chain,
+        "approvers_status": _approvers_status(minute.approval_chain),
+        **_first_remarks_page(minute.pk),
+        "is_finalized": minute.status in ["Approved", "Rejected"],  # ✅ Minute is Completed (Approved or Rejected)
+    }
 
-    if next_approver:
-        next_approver.is_current = True
-        next_approver.save()
-        return f"You approved the minute. Next Approver: {next_approver.user.get_full_name()}."
 
-    # ✅ Finalize minute if no more approvers
-    minute.finalize_minute("Approved")
-    return "Minute has been fully approved and archived."
+def approval_status_payload(minute_id):
+    """
+    Compact summary of a minute's approval chain, shared by the status endpoint and its streams.
+    """
+    minute = get_object_or_404(Minute.objects.select_related("approval_chain__current_approver__user"), pk=minute_id)
+    approval_chain = minute.approval_chain
+    current_approver = approval_chain.current_approver if approval_chain else None
+
+    last_remark_at = Remark.objects.filter(minute=minute).order_by("-timestamp").values_list(
+        "timestamp", flat=True
+    ).first()
+
+    return {
+        "minute_id": minute.pk,
+        "unique_id": minute.unique_id,
+        "status": minute.status,
+        "chain_status": approval_chain.status if approval_chain else None,
+        "current_approver": {
+            "id": current_approver.user_id,
+            "name": current_approver.user.get_full_name(),
+        } if current_approver else None,
+        "approval_chain": _approvers_status(approval_chain),
+        "last_remark_at": last_remark_at.isoformat() if last_remark_at else None,
+    }
 
 
-def reject_minute(current_approver, minute, remark_text):
+def can_view_minute(user, minute_id):
     """
-    Handles minute rejection and finalizes it.
+    Whether `user` may read the minute, as `Minute.objects.visible_to` decides.
+    The creator and approver IDs are cached with the minute's version (approver
+    changes bump it), so repeated checks cost one cache read. Unknown minutes are not viewable.
     """
-    current_approver.status = "Rejected"
-    current_approver.is_current = False
-    current_approver.save()
+    def viewer_ids():
+        minute = Minute.objects.filter(pk=minute_id).values("created_by_id", "approval_chain_id").first()
+        if not minute:
+            return set()
+        return {minute["created_by_id"]} | set(
+            Approver.objects.filter(approval_chain_id=minute["approval_chain_id"]).values_list("user_id", flat=True)
+        )
 
-    save_remark(current_approver.user, minute, "reject", remark_text)  # ✅ Save remark
+    viewers = cached_for_version(minute_id, "viewers", viewer_ids)
+    return user.pk in viewers or (user.is_superuser and bool(viewers))
 
-    minute.finalize_minute("Rejected")
-    return "Minute has been rejected and archived."
 
+def _status_response(response, minute_id, version):
+    response["ETag"] = f'"{minute_id}-{version}"'
+    response["Cache-Control"] = "private, no-cache"  # ✅ Browsers revalidate with If-None-Match on every poll
+    return response
 
 
-def mark_to_new_approver(request, mark_form, current_approver, approval_chain, remark_text):
+@login_required
+@require_GET
+def approval_status_view(request, minute_id):
     """
-    Handles forwarding the minute to a new approver.
+    Compact JSON summary of a minute's approval chain for polling clients.
+    The strong ETag comes from the minute's cached version counter, and who may read the
+    minute is cached with that version, so an unchanged poll is answered with 304 before
+    any minute, chain or remark query runs.
     """
-    if not mark_form.is_valid():
-        raise ValidationError("Invalid selection for Mark-To action.")
-
-    target_user = mark_form.cleaned_data["user"]
-    target_order = mark_form.cleaned_data["order"] or \
-                   (approval_chain.approvers.aggregate(Max("order"))["order__max"] or 0) + 1
-
-    if approval_chain.approvers.filter(user=target_user).exists():
-        raise ValidationError(f"{target_user.get_full_name()} is already an approver.")
+    if not can_view_minute(request.user, minute_id):
+        raise Http404("Minute not found.")
 
-    # ✅ Get the minute linked to the approval chain
-    minute = approval_chain.minute  # 🔥 FIX: Ensure minute is properly retrieved
+    version = minute_version(minute_id)
+    if f'"{minute_id}-{version}"' in parse_etags(request.headers.get("If-None-Match", "")):
+        return _status_response(HttpResponseNotModified(), minute_id, version)
 
-    # ✅ Shift existing approvers down by 1
-    approval_chain.approvers.filter(order__gte=target_order).update(order=F("order") + 1)
+    return _status_response(JsonResponse(approval_status_payload(minute_id)), minute_id, version)
 
-    # ✅ Create new approver at the specified order
-    new_approver = Approver.objects.create(
-        approval_chain=approval_chain,
-        user=target_user,
-        order=target_order,
-        status="Pending",
-        is_current=True
-    )
 
-    # ✅ Mark the current approver as "Marked" and deactivate
-    current_approver.status = "Marked"
-    current_approver.is_current = False
-    current_approver.save()
+SSE_KEEPALIVE = 15  # Seconds between keep-alive comments on an idle event stream
+LONG_POLL_TIMEOUT = 25  # Seconds a long-poll request is held open before answering 304
 
-    save_remark(current_approver.user, minute, "mark_to", remark_text)  # ✅ FIXED: minute is now properly passed
 
-    return f"Minute assigned to {target_user.get_full_name()} at position {target_order}."
+@login_required
+@require_GET
+async def approval_status_stream(request, minute_id):
+    """
+    Server-Sent Events fallback for networks without WebSockets (ASGI only).
+    Sends the approval status on connect (unless `Last-Event-ID` is already current) and after
+    every version bump. Idle streams wait on the shared cache watcher, not on the database.
+    """
+    if not await Minute.objects.visible_to(await request.auser()).filter(pk=minute_id).aexists():
+        raise Http404("Minute not found.")
+
+    async def events():
+        seen = request.headers.get("Last-Event-ID")
+        yield "retry: 5000\n\n"
+        while True:
+            version = await sync_to_async(minute_version)(minute_id)
+            if str(version) != seen:
+                seen = str(version)
+                try:
+                    payload = await sync_to_async(approval_status_payload)(minute_id)
+                except Http404:
+                    return  # ✅ Minute deleted: end the stream
+                yield f"id: {version}\nevent: status\ndata: {json.dumps(payload)}\n\n"
+
+            if not await wait_for_version_change(minute_id, version, SSE_KEEPALIVE):
+                yield ": keep-alive\n\n"
+
+    response = StreamingHttpResponse(events(), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"  # ✅ Stop nginx from buffering the stream
+    return response
 
 
-def return_to_previous_approver(request, return_form, current_approver, approval_chain, remark_text):
+@login_required
+@require_GET
+async def approval_status_wait(request, minute_id):
     """
-    Handles returning the minute to a previous approver.
+    Long-poll variant of `approval_status_view` for browsers without EventSource.
+    An If-None-Match naming the current version is held open until the version moves
+    (then answered with the new status) or LONG_POLL_TIMEOUT passes (then 304).
     """
-    if not return_form.is_valid():
-        raise ValidationError("Invalid selection for Return-To action.")
+    if not await Minute.objects.visible_to(await request.auser()).filter(pk=minute_id).aexists():
+        raise Http404("Minute not found.")
+
+    version = await sync_to_async(minute_version)(minute_id)
+    if f'"{minute_id}-{version}"' in parse_etags(request.headers.get("If-None-Match", "")):
+        if not await wait_for_version_change(minute_id, version, LONG_POLL_TIMEOUT):
+            return _status_response(HttpResponseNotModified(), minute_id, version)
+        version = await sync_to_async(minute_version)(minute_id)
 
-    target_user = return_form.cleaned_data["user"]
-    previous_approver = approval_chain.approvers.filter(user=target_user, order__lt=current_approver.order).first()
+    payload = await sync_to_async(approval_status_payload)(minute_id)
+    return _status_response(JsonResponse(payload), minute_id, version)
 
-    if not previous_approver:
-        raise ValidationError("Invalid selection for Return-To action.")
+@login_required
+def generate_minute_pdf(request, minute_id):
+    """
+    Downloads the official Minute Sheet as a PDF with its attachment (PDF, image, Excel) appended.
+    Served from the content-addressed render cache; only a changed minute is laid out again.
+    Byte ranges are honored, so a large sheet can resume or be read page by page.
+    """
+    minute = get_object_or_404(
+        Minute.objects.visible_to(request.user).select_related("created_by__department", "approval_chain"), id=minute_id
+    )
 
-    # ✅ Get the minute linked to the approval chain
-    minute = approval_chain.minute  # 🔥 FIX: Ensure minute is properly retrieved
+    pdf = cached_minute_pdf(minute)
+    return ranged_file_response(
+        request, pdf, "application/pdf", f"Minute_{minute.unique_id}.pdf", etag=f'"{Path(pdf.name).stem}"'
+    )
 
-    # ✅ Deactivate current approver
-    current_approver.is_current = False
-    current_approver.status = "Returned"
-    current_approver.save()
 
-    previous_approver.is_current = True
-    previous_approver.status = "Pending"
-    previous_approver.save()
+def _pdf_job_payload(job_id, job):
+    payload = {
+        "job_id": job_id,
+        "state": job["state"],
+        "progress": job["progress"],
+        "status_url": reverse("minute:pdf_job_status", args=[job_id]),
+    }
+    if job["state"] == DONE:
+        payload["download_url"] = reverse("minute:pdf_job_download", args=[job_id])
+    if job.get("error"):
+        payload["error"] = job["error"]
+    return payload
 
-    save_remark(current_approver.user, minute, "return_to", remark_text)  # ✅ FIXED: minute is now properly passed
 
-    return f"Minute returned to {target_user.get_full_name()}."
+def _own_pdf_job(request, job_id):
+    """
+    The job's state if it belongs to the requesting user; anyone else gets a 404.
+    """
+    job = pdf_job(job_id)
+    if not job or job["user_id"] != request.user.pk:
+        raise Http404("PDF job not found.")
+    return job
 
-from django.db.models import Prefetch, Q
 
 @login_required
-def pending_approvals(request):
+@require_POST
+def start_pdf_job_view(request, minute_id):
     """
-    View for approvers to see all minutes awaiting their approval.
+    Queues a background render of the Minute Sheet PDF and answers 202 with the job's status URL.
+    An unchanged minute is already in the render cache, so its job comes back done.
     """
-    # ✅ Fetch all minutes where the user is a current approver
-    pending_approvals = Minute.objects.filter(
-        approval_chain__approvers__user=request.user,
-        approval_chain__approvers__is_current=True,
-        approval_chain__approvers__status="Pending"
-    ).distinct().prefetch_related(
-        Prefetch("approval_chain__approvers", queryset=Approver.objects.order_by("order"))
+    minute = get_object_or_404(
+        Minute.objects.visible_to(request.user).select_related("created_by__department", "approval_chain"),
+        id=minute_id,
     )
+    job_id, job = start_pdf_job(minute, request.user)
+    response = JsonResponse(_pdf_job_payload(job_id, job), status=202)
+    response["Location"] = reverse("minute:pdf_job_status", args=[job_id])
+    return response
 
-    return render(request, "minute/pending_approvals.html", {
-        "pending_approvals": pending_approvals,
-    })
 
-# apps/minute/views.py
 @login_required
-def tracking_minute_view(request, minute_id):
+@require_GET
+def pdf_job_status_view(request, job_id):
     """
-    View to track a minute's approval process.
-    Shows real-time status of approvers and actions taken.
+    Polled JSON status of a PDF job: state, progress and, once done, the download URL.
     """
-    minute = get_object_or_404(Minute, pk=minute_id)
-    approval_chain = minute.approval_chain
-
-    # ✅ Fetch Approvers & Ensure Names Are Available
-    approvers_status = approval_chain.approvers.order_by("order").select_related("user").values(
-        "user__first_name", "user__last_name", "status", "is_current"
-    )
+    response = JsonResponse(_pdf_job_payload(job_id, _own_pdf_job(request, job_id)))
+    response["Cache-Control"] = "no-store"
+    return response
 
-    # ✅ Properly Format Approver Names
-    formatted_approvers = [
-        {
-            "approver": f"{approver['user__first_name']} {approver['user__last_name']}".strip(),
-            "status": approver["status"],
-            "is_current": approver["is_current"],
-        }
-        for approver in approvers_status
-    ]
 
-    # ✅ Fetch all remarks related to this minute
-    remarks = Remark.objects.filter(minute=minute).select_related("user").order_by("-timestamp")
+@login_required
+@require_GET
+def pdf_job_download_view(request, job_id):
+    """
+    Serves a finished job's PDF from the render cache (410 if it was evicted since; start a new job).
+    """
+    job = _own_pdf_job(request, job_id)
+    if job["state"] != DONE:
+        return JsonResponse({"error": "The PDF is not ready yet."}, status=409)
 
-    # ✅ Check if Minute is Completed (Approved or Rejected)
-    is_finalized = minute.status in ["Approved", "Rejected"]
+    pdf = minute_pdf_cache.get(job["key"])
+    if not pdf:
+        return JsonResponse({"error": "The PDF is no longer available. Please generate it again."}, status=410)
 
-    return render(request, "minute/tracking.html", {
-        "minute": minute,
-        "approval_chain": approval_chain,
-        "approvers_status": formatted_approvers,  # ✅ Fixed
-        "remarks": remarks,  # ✅ Added this
-        "is_finalized": is_finalized
-    })
+    return ranged_file_response(request, pdf, "application/pdf", job["filename"], etag=f'"{job["key"]}"')
 
-from PyPDF2 import PdfReader, PdfWriter
-import os
-from PIL import Image
-import pandas as pd
-import io
 
 @login_required
-def generate_minute_pdf(request, minute_id):
+@require_GET
+def export_minute_pdfs(request):
     """
-    Generates a PDF of the official Minute Sheet and appends attachments (PDF, images, Excel).
+    Streams a ZIP of the sheet PDFs of every minute the user may read that matches
+    `?department=<code>&status=&date_from=&date_to=` (YYYY-MM-DD, inclusive).
+    Sheets render in a process pool through the render cache; see `apps.minute.export`.
     """
-    # ✅ Fetch the specific minute entry
-    minute = get_object_or_404(Minute, id=minute_id)
-
-    # ✅ Fetch Approval Chain and Approvers
-    approval_chain = getattr(minute, 'approval_chain', None)
-    approvers_status = []
-
-    if approval_chain:
-        approvers = approval_chain.approvers.order_by('order').select_related("user")
-        for approver in approvers:
-            approvers_status.append({
-                'approver': approver.user.get_full_name(),
-                'status': approver.status,
-                'is_current': approver.is_current,
-            })
-
-    # ✅ Fetch all remarks related to this minute
-    remarks = Remark.objects.filter(minute=minute).select_related("user").order_by("-timestamp")
-
-    # ✅ Load the PDF template
-    template = get_template('minute/minutesheet_pdf.html')
-
-    # ✅ Context to pass into the template
-    context = {
-        'minute': minute,
-        'approvers_status': approvers_status,
-        'remarks': remarks,  # ✅ Pass remarks to template
-        'sheet_no': "DYNAMIC_SHEET_NO",  # This will be replaced dynamically
-    }
-    html_content = template.render(context)
-
-    # ✅ Generate PDF from HTML with proper pagination
-    main_pdf_bytes = weasyprint.HTML(string=html_content).write_pdf(
-        stylesheets=[weasyprint.CSS(string='''  
-            @page {
-                size: A4 portrait;
-                margin: 1in;
-
-                /* ✅ Dynamic Page Numbering */
-                @bottom-center {
-                    content: "Page " counter(page) " of " counter(pages);
-                    font-size: 10pt;
-                    font-family: "Times New Roman", serif;
-                }
-
-                /* ✅ Dynamic Sheet Number */
-                @top-right {
-                    content: "Sheet: " counter(page);
-                    font-weight: bold;
-                    font-size: 12pt;
-                    font-family: "Times New Roman", serif;
-                }
-            }
+    form = MinuteExportForm(request.GET)
+    if not form.is_valid():
+        return JsonResponse({"errors": form.errors}, status=400)
 
-            body {
-                font-family: 'Times New Roman', serif;
-                font-size: 12pt;
-                line-height: 1.5;
-            }
-        ''')]
+    minute_ids = list(
+        form.filter(Minute.objects.visible_to(request.user)).values_list("pk", flat=True)[: settings.MINUTE_PDF_EXPORT_LIMIT + 1]
     )
-
-    # ✅ Convert `bytes` to `BytesIO` file-like object
-    main_pdf_io = io.BytesIO(main_pdf_bytes)
-    pdf_writer = PdfWriter()
-    pdf_writer.append(PdfReader(main_pdf_io))  # ✅ Add the main minute PDF first
-
-    # ✅ Handle attachments
-    if minute.attachment:
-        attachment_path = minute.attachment.path
-        attachment_ext = os.path.splitext(attachment_path)[1].lower()
-
-        if attachment_ext == ".pdf":
-            # ✅ Append PDF directly
-            with open(attachment_path, "rb") as f:
-                attachment_reader = PdfReader(f)
-                for page in attachment_reader.pages:
-                    pdf_writer.add_page(page)
-
-        elif attachment_ext in [".png", ".jpg", ".jpeg"]:
-            # ✅ Convert image to PDF and append
-            image = Image.open(attachment_path)
-            img_pdf_io = io.BytesIO()
-            image.convert("RGB").save(img_pdf_io, format="PDF")
-            img_pdf_io.seek(0)
-            img_reader = PdfReader(img_pdf_io)
-            pdf_writer.append(img_reader)
-
-        elif attachment_ext in [".xls", ".xlsx"]:
-            # ✅ Convert Excel to PDF Table & Append
-            try:
-                if attachment_ext == ".xls":
-                    df = pd.read_excel(attachment_path, engine="xlrd")  # ✅ Ensure xlrd for .xls
-                else:
-                    df = pd.read_excel(attachment_path, engine="openpyxl")  # ✅ Ensure openpyxl for .xlsx
-
-                table_html = df.to_html(index=False, border=1)
-                excel_pdf_bytes = weasyprint.HTML(string=f"<h3>Excel Attachment</h3>{table_html}").write_pdf()
-                excel_pdf_io = io.BytesIO(excel_pdf_bytes)
-                excel_reader = PdfReader(excel_pdf_io)
-                pdf_writer.append(excel_reader)
-
-            except Exception as e:
-                print(f"Error processing Excel file: {e}")  # ✅ Log errors for debugging
-
-    # ✅ Write final PDF file
-    response = HttpResponse(content_type="application/pdf")
-    response["Content-Disposition"] = f'attachment; filename="Minute_{minute.unique_id}.pdf"'
-    pdf_writer.write(response)
+    if not minute_ids:
+        return JsonResponse({"error": "No minutes match these filters."}, status=404)
+    if len(minute_ids) > settings.MINUTE_PDF_EXPORT_LIMIT:
+        return JsonResponse(
+            {"error": f"At most {settings.MINUTE_PDF_EXPORT_LIMIT} minutes can be exported at once. Narrow the filters."},
+            status=400,
+        )
+
+    response = StreamingHttpResponse(iter_minutes_zip(minute_ids), content_type="application/zip")
+    response["Content-Disposition"] = f'attachment; filename="{form.archive_name()}"'
     return response
-
@@ -0,0 +1,63 @@
+# apps/notifications/consumers.py
+from channels.generic.websocket import AsyncJsonWebsocketConsumer
+
+from apps.minute.models import Minute
+from apps.notifications.events import inbox_group, minute_group
+
+
+class NotificationConsumer(AsyncJsonWebsocketConsumer):
+    """
+    Pushes approval events to a logged-in user.
+    - Always subscribed to the user's own inbox group.
+    - `ws/minutes/<minute_id>/` also subscribes to that minute's group; more minutes can be
+      followed with {"action": "subscribe", "minute_id": ...} / {"action": "unsubscribe", ...}.
+    - Minute groups are only joined for minutes the user can read (`Minute.objects.visible_to`).
+    """
+
+    async def connect(self):
+        user = self.scope.get("user")
+        if not user or not user.is_authenticated:
+            await self.close()
+            return
+
+        self.groups = [inbox_group(user.pk)]
+        minute_id = self.scope.get("url_route", {}).get("kwargs", {}).get("minute_id")
+        if minute_id:
+            if not await self.can_view(user, minute_id):
+                await self.close()
+                return
+            self.groups.append(minute_group(minute_id))
+
+        for group in self.groups:
+            await self.channel_layer.group_add(group, self.channel_name)
+        await self.accept()
+
+    async def disconnect(self, code):
+        for group in getattr(self, "groups", []):
+            await self.channel_layer.group_discard(group, self.channel_name)
+
+    async def receive_json(self, content, **kwargs):
+        minute_id = content.get("minute_id") if isinstance(content, dict) else None
+        if not isinstance(minute_id, int):
+            await self.send_json({"error": "minute_id must be an integer."})
+            return
+
+        group = minute_group(minute_id)
+        if content.get("action") == "subscribe" and group not in self.groups:
+            if not await self.can_view(self.scope["user"], minute_id):
+                await self.send_json({"error": "Minute not found.", "minute_id": minute_id})
+                return
+            await self.channel_layer.group_add(group, self.channel_name)
+            self.groups.append(group)
+        elif content.get("action") == "unsubscribe" and group in self.groups[1:]:
+            await self.channel_layer.group_discard(group, self.channel_name)
+            self.groups.remove(group)
+        else:
+            return
+        await self.send_json({"event": f"{content['action']}d", "minute_id": minute_id})
+
+    async def can_view(self, user, minute_id):
+        return await Minute.objects.visible_to(user).filter(pk=minute_id).aexists()
+
+    async def approval_event(self, event):
+        await self.send_json(event["payload"])
@@ -0,0 +1,65 @@
+# apps/notifications/events.py
+"""
+Channel-layer groups and the approval events published to them.
+- `inbox.<user_id>`: minutes arriving in / leaving a user's inbox.
+- `minute.<minute_id>`: status changes of one minute, for tracking pages.
+Consumers forward each event's `payload` to the browser as JSON.
+"""
+import logging
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+
+logger = logging.getLogger(__name__)
+
+EVENT_TYPE = "approval.event"  # ✅ Dispatched to `NotificationConsumer.approval_event`
+
+
+def inbox_group(user_id):
+    return f"inbox.{user_id}"
+
+
+def minute_group(minute_id):
+    return f"minute.{minute_id}"
+
+
+def transition_events(transition):
+    """
+    Returns [(group, payload), ...] describing one applied transition.
+    """
+    minute = transition.minute
+    next_user_id = transition.next_approver.user_id if transition.next_approver else None
+
+    events = [(
+        minute_group(minute.pk),
+        {
+            "event": "approval_status",
+            "minute_id": minute.pk,
+            "action": transition.action,
+            "status": minute.status,
+            "current_approver": next_user_id,
+        },
+    )]
+    events.append((inbox_group(transition.actor.pk), {"event": "inbox_removed", "minute_id": minute.pk}))
+    if next_user_id:
+        events.append((
+            inbox_group(next_user_id),
+            {"event": "inbox_added", "minute_id": minute.pk, "unique_id": minute.unique_id, "subject": minute.subject},
+        ))
+    return events
+
+
+def publish(events):
+    """
+    Sends (group, payload) events through the default channel layer.
+    Failures are logged, never raised: the transitions are already committed.
+    """
+    channel_layer = get_channel_layer()
+    if channel_layer is None:
+        return
+
+    for group, payload in events:
+        try:
+            async_to_sync(channel_layer.group_send)(group, {"type": EVENT_TYPE, "payload": payload})
+        except Exception:
+            logger.exception(f"❌ ERROR: Could not publish {payload.get('event')} to {group}")
@@ -0,0 +1,9 @@
+# apps/notifications/routing.py
+from django.urls import path
+
+from apps.notifications.consumers import NotificationConsumer
+
+websocket_urlpatterns = [
+    path("ws/notifications/", NotificationConsumer.as_asgi()),  # ✅ The user's inbox events
+    path("ws/minutes/<int:minute_id>/", NotificationConsumer.as_asgi()),  # ✅ Inbox + one minute's status events
+]
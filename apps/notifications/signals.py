@@ -0,0 +1,14 @@
+from django.db import transaction
+from django.dispatch import receiver
+
+from apps.approval_chain.transitions import transitions_applied
+from apps.notifications.events import publish, transition_events
+
+
+@receiver(transitions_applied)
+def publish_transition_events(sender, transitions, **kwargs):
+    """
+    Pushes approval events to the affected inboxes and tracking pages once the transitions commit.
+    """
+    events = [event for transition in transitions for event in transition_events(transition)]
+    transaction.on_commit(lambda: publish(events))
@@ -0,0 +1,119 @@
+from asgiref.sync import async_to_sync
+from channels.db import database_sync_to_async
+from channels.routing import URLRouter
+from channels.testing import WebsocketCommunicator
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.test import TestCase, override_settings
+
+from apps.departments.models import Department
+from apps.minute.models import Minute
+from apps.notifications.routing import websocket_urlpatterns
+
+User = get_user_model()
+
+IN_MEMORY_LAYER = {"default": {"BACKEND": "channels.layers.InMemoryChannelLayer"}}
+
+
+@override_settings(CHANNEL_LAYERS=IN_MEMORY_LAYER)
+class NotificationConsumerTests(TestCase):
+    """
+    Approval events reach inbox and minute groups after the transition commits.
+    """
+
+    def setUp(self):
+        department = Department.objects.create(name="Computer Science", code="CS")
+        self.creator, *self.approvers = [
+            User.objects.create_user(username, f"{username}@example.com", "password", department=department)
+            for username in ("creator", "approver0", "approver1")
+        ]
+        self.minute = Minute.objects.create_minute(
+            subject="Subject", description="Text", created_by=self.creator, approvers=self.approvers
+        )
+
+    def communicator(self, user, path):
+        communicator = WebsocketCommunicator(URLRouter(websocket_urlpatterns), path)
+        communicator.scope["user"] = user
+        return communicator
+
+    def approve(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.minute.approve(self.approvers[0])
+
+    def test_transition_is_pushed_to_minute_and_inboxes(self):
+        async def scenario():
+            tracker = self.communicator(self.creator, f"/ws/minutes/{self.minute.pk}/")
+            actor = self.communicator(self.approvers[0], "/ws/notifications/")
+            next_approver = self.communicator(self.approvers[1], "/ws/notifications/")
+            for communicator in (tracker, actor, next_approver):
+                connected, _ = await communicator.connect()
+                self.assertTrue(connected)
+
+            await database_sync_to_async(self.approve)()
+
+            self.assertEqual(await tracker.receive_json_from(), {
+                "event": "approval_status", "minute_id": self.minute.pk, "action": "approve",
+                "status": "Pending", "current_approver": self.approvers[1].pk,
+            })
+            self.assertEqual(await actor.receive_json_from(), {"event": "inbox_removed", "minute_id": self.minute.pk})
+            added = await next_approver.receive_json_from()
+            self.assertEqual((added["event"], added["unique_id"]), ("inbox_added", self.minute.unique_id))
+
+            for communicator in (tracker, actor, next_approver):
+                await communicator.disconnect()
+
+        async_to_sync(scenario)()
+
+    def test_subscribe_to_more_minutes(self):
+        async def scenario():
+            communicator = self.communicator(self.creator, "/ws/notifications/")
+            await communicator.connect()
+
+            await communicator.send_json_to({"action": "subscribe", "minute_id": self.minute.pk})
+            self.assertEqual(await communicator.receive_json_from(), {"event": "subscribed", "minute_id": self.minute.pk})
+
+            await database_sync_to_async(self.approve)()
+            self.assertEqual((await communicator.receive_json_from())["event"], "approval_status")
+            await communicator.disconnect()
+
+        async_to_sync(scenario)()
+
+    def test_anonymous_users_are_refused(self):
+        async def scenario():
+            communicator = self.communicator(AnonymousUser(), "/ws/notifications/")
+            connected, _ = await communicator.connect()
+            self.assertFalse(connected)
+
+        async_to_sync(scenario)()
+
+    def test_unreadable_minutes_are_refused(self):
+        outsider = User.objects.create_user("outsider", "outsider@example.com", "password")
+
+        async def scenario():
+            communicator = self.communicator(outsider, f"/ws/minutes/{self.minute.pk}/")
+            connected, _ = await communicator.connect()
+            self.assertFalse(connected)
+
+            communicator = self.communicator(outsider, "/ws/notifications/")
+            await communicator.connect()
+            await communicator.send_json_to({"action": "subscribe", "minute_id": self.minute.pk})
+            self.assertEqual(
+                await communicator.receive_json_from(), {"error": "Minute not found.", "minute_id": self.minute.pk}
+            )
+
+            await database_sync_to_async(self.approve)()
+            self.assertTrue(await communicator.receive_nothing())
+            await communicator.disconnect()
+
+        async_to_sync(scenario)()
+
+    def test_non_object_messages_get_an_error(self):
+        async def scenario():
+            communicator = self.communicator(self.creator, "/ws/notifications/")
+            await communicator.connect()
+
+            await communicator.send_json_to([self.minute.pk])
+            self.assertEqual(await communicator.receive_json_from(), {"error": "minute_id must be an integer."})
+            await communicator.disconnect()
+
+        async_to_sync(scenario)()
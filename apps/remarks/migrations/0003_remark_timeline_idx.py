@@ -0,0 +1,32 @@
+# Generated by Django 5.1.4 on 2026-10-18 14:14
+
+from django.conf import settings
+from django.db import migrations, models
+
+from utils.migrations import AddIndexConcurrently, RemoveIndexConcurrently
+
+
+class Migration(migrations.Migration):
+
+    atomic = False  # ✅ CREATE/DROP INDEX CONCURRENTLY cannot run in a transaction
+
+    dependencies = [
+        ("approval_chain", "0007_approver_approver_current_user_idx"),
+        ("minute", "0007_minute_description_page_offsets"),
+        ("remarks", "0002_remark_remark_minute_timestamp_idx"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # ✅ The new index is built before the old one is dropped, so timelines stay indexed
+        AddIndexConcurrently(
+            model_name="remark",
+            index=models.Index(
+                fields=["minute", "-timestamp", "-id"], name="remark_timeline_idx"
+            ),
+        ),
+        RemoveIndexConcurrently(
+            model_name="remark",
+            name="remark_minute_timestamp_idx",
+        ),
+    ]
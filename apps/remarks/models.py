@@ -4,9 +4,35 @@ from django.utils.timezone import now
 from django.contrib.auth import get_user_model
 from apps.minute.models import Minute
 from apps.approval_chain.models import Approver
+from utils.pagination import decode_keyset_cursor, encode_keyset_cursor
 
 User = get_user_model()
 
+REMARKS_PAGE_SIZE = 20
+
+
+class RemarkManager(models.Manager):
+    """
+    Manager for Remark with the keyset-paginated minute timeline.
+    """
+
+    def timeline(self, minute_id, cursor=None, limit=REMARKS_PAGE_SIZE):
+        """
+        Returns one page of a minute's remarks, newest first, as (remarks, next_cursor).
+        Pages are keyed on (timestamp, id), so page N costs the same as page 1;
+        `next_cursor` is None on the last page. Raises ValueError for a malformed cursor.
+        """
+        remarks = self.filter(minute_id=minute_id).select_related("user").order_by("-timestamp", "-pk")
+        if cursor:
+            timestamp, pk = decode_keyset_cursor(cursor)
+            remarks = remarks.filter(models.Q(timestamp__lt=timestamp) | models.Q(timestamp=timestamp, pk__lt=pk))
+
+        remarks = list(remarks[:limit + 1])
+        if len(remarks) <= limit:
+            return remarks, None
+        last = remarks[limit - 1]
+        return remarks[:limit], encode_keyset_cursor(last.timestamp, last.pk)
+
 
 class Remark(models.Model):
     """
@@ -56,8 +82,13 @@ class Remark(models.Model):
         help_text="Timestamp of when the remark was added."
     )
 
+    objects = RemarkManager()
+
     class Meta:
         ordering = ["-timestamp"]
+        indexes = [
+            models.Index(fields=["minute", "-timestamp", "-id"], name="remark_timeline_idx"),  # ✅ Keyset timelines
+        ]
 
     def __str__(self):
         return f"{self.approver.user.get_full_name()} - {self.action} on {self.minute.unique_id}"
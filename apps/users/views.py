@@ -8,11 +8,13 @@ from django.contrib.auth.views import LoginView as BaseLoginView, LogoutView as
 from django.views.generic import TemplateView
 from django.shortcuts import render, redirect
 from django.urls import reverse
+from django.core.cache import cache
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
 from apps.users.forms import ProfileUpdateForm
 from apps.departments.models import Department
+from apps.minute.models import InboxEntry, MinuteRollup
 
 logger = logging.getLogger(__name__)
 
@@ -59,19 +61,59 @@ class LogoutView(BaseLogoutView):
 
 
 # DASHBOARDS BASED ON ROLE
-class FacultyDashboardView(LoginRequiredMixin, TemplateView):
+DASHBOARD_CACHE_TIMEOUT = 30  # Seconds; the counters behind it are kept current by the rollups
+
+
+class DashboardSummaryMixin:
+    """
+    Adds workload counters to a dashboard: the user's pending approvals and oldest waiting item,
+    the minutes they created by status, and department totals with average turnaround.
+    Everything is read from the inbox and rollup tables (a fixed number of queries) and
+    cached briefly per user; the pending count comes from its own always-current counter.
+    """
+
+    all_departments = False  # Superusers see every department; others see their own
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        user = self.request.user
+        context["inbox_count"] = InboxEntry.objects.count_for(user)
+        context.update(cache.get_or_set(
+            f"dashboard:{user.pk}:{'all' if self.all_departments else 'own'}",
+            lambda: self.get_summary(user),
+            DASHBOARD_CACHE_TIMEOUT,
+        ))
+        return context
+
+    def get_summary(self, user):
+        department_ids = None if self.all_departments else [user.department_id] if user.department_id else []
+        department_rollups = list(MinuteRollup.objects.for_departments(department_ids))
+
+        oldest = InboxEntry.objects.only("minute_id", "subject", "unique_id", "department_name", "waiting_since")
+        department_oldest = oldest if department_ids is None else oldest.filter(department_id__in=department_ids)
+        return {
+            "my_rollup": MinuteRollup.objects.for_user(user),
+            "my_oldest": oldest.filter(user=user).order_by("waiting_since").first(),
+            "department_rollups": department_rollups,
+            "department_total": MinuteRollup.combined(department_rollups),
+            "department_oldest": department_oldest.order_by("waiting_since").first(),
+        }
+
+
+class FacultyDashboardView(LoginRequiredMixin, DashboardSummaryMixin, TemplateView):
     """ Faculty Dashboard """
     template_name = "users/dashboard_faculty.html"
 
 
-class AdminDashboardView(LoginRequiredMixin, TemplateView):
+class AdminDashboardView(LoginRequiredMixin, DashboardSummaryMixin, TemplateView):
     """ Admin Dashboard """
     template_name = "users/dashboard_admin.html"
 
 
-class SuperuserDashboardView(LoginRequiredMixin, TemplateView):
+class SuperuserDashboardView(LoginRequiredMixin, DashboardSummaryMixin, TemplateView):
     """ Superuser Dashboard """
     template_name = "users/dashboard_superuser.html"
+    all_departments = True
 
 
 @login_required
@@ -0,0 +1,11 @@
+# config/celery.py
+import os
+
+from celery import Celery
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.development")
+
+# ✅ Settings prefixed with CELERY_ configure the app; tasks are found in each app's tasks.py
+app = Celery("config")
+app.config_from_object("django.conf:settings", namespace="CELERY")
+app.autodiscover_tasks()
@@ -79,6 +79,8 @@ INSTALLED_APPS = [
     "corsheaders",
     "axes",
     'apps.approval_chain',
+    "apps.notifications",
+    "apps.api",
     "django_extensions",
     "django_ckeditor_5",
 ]
@@ -112,6 +114,17 @@ CHANNEL_LAYERS = {
     },
 }
 
+# ✅ *Celery Background Jobs (Runs Tasks In-Process Without Redis)*
+CELERY_BROKER_URL = env("CELERY_BROKER_URL", default=REDIS_URL)
+CELERY_TASK_ALWAYS_EAGER = env.bool("CELERY_TASK_ALWAYS_EAGER", default=not USE_REDIS)
+CELERY_TASK_IGNORE_RESULT = True  # Job progress is kept in the cache
+CELERY_TASK_ACKS_LATE = True
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1  # ✅ A worker only takes the renders it can start
+CELERY_TASK_ROUTES = {"apps.minute.tasks.*": {"queue": "pdf"}}  # celery -A config worker -Q pdf
+
+# ✅ Renders one worker process runs at once (threaded pools; prefork uses its process count)
+MINUTE_PDF_RENDER_CONCURRENCY = env.int("MINUTE_PDF_RENDER_CONCURRENCY", default=2)
+
 # ✅ *Templates & Static Files*
 TEMPLATES = [
     {
@@ -136,6 +149,15 @@ STATIC_ROOT = os.path.join(BASE_DIR, "staticfiles")
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
+# ✅ *Rendered minute PDFs* (content-addressed; least recently served files go first)
+MINUTE_PDF_CACHE_DIR = Path(env("MINUTE_PDF_CACHE_DIR", default=str(BASE_DIR / "cache" / "minute_pdfs")))
+MINUTE_PDF_CACHE_MAX_BYTES = env.int("MINUTE_PDF_CACHE_MAX_BYTES", default=512 * 1024 * 1024)
+# ✅ Bulk ZIP exports: render processes per export, and the most minutes one web request may export
+MINUTE_PDF_EXPORT_WORKERS = env.int("MINUTE_PDF_EXPORT_WORKERS", default=min(4, os.cpu_count() or 1))
+MINUTE_PDF_EXPORT_LIMIT = env.int("MINUTE_PDF_EXPORT_LIMIT", default=1000)
+# ✅ Intermediate PDFs stay in memory up to this size while a sheet is assembled, then spill to a temp file
+MINUTE_PDF_SPOOL_MAX_BYTES = env.int("MINUTE_PDF_SPOOL_MAX_BYTES", default=8 * 1024 * 1024)
+
 # ✅ *Authentication & Authorization*
 AUTH_USER_MODEL = "users.CustomUser"
 AUTHENTICATION_BACKENDS = [
@@ -3,6 +3,7 @@ from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
+from apps.minute.views import approval_status_view
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -15,6 +16,10 @@ urlpatterns = [
     path('minute/', include('apps.minute.urls', namespace='minute')),
     path('departments/', include('apps.departments.urls', namespace='departments')),
     path("approval-chain/", include("apps.approval_chain.urls", namespace="approval_chain")),
+    path("api/", include("apps.api.urls", namespace="api")),
+
+    # ✅ Legacy path still polled by older tracking pages
+    path("minutes/api/approval_status/<int:minute_id>/", approval_status_view),
 ]
 
 # ✅ Serve media files during development
@@ -0,0 +1,90 @@
+# utils/http.py
+import os
+import re
+
+from django.http import FileResponse, HttpResponse
+from django.utils.http import parse_etags
+
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class FileRange:
+    """
+    Read-only view of `length` bytes of an open file starting at `start`; closing it closes the file.
+    """
+
+    def __init__(self, file, start, length):
+        self.file = file
+        self.remaining = length
+        file.seek(start)
+
+    def read(self, size=-1):
+        if self.remaining <= 0:
+            return b""
+        data = self.file.read(self.remaining if size < 0 else min(size, self.remaining))
+        self.remaining -= len(data)
+        return data
+
+    def close(self):
+        self.file.close()
+
+
+def parse_byte_range(header, size):
+    """
+    Returns (start, end) inclusive for a single "bytes=" range of a `size`-byte file,
+    None when the header should be ignored (absent, malformed or several ranges),
+    or False when it cannot be satisfied.
+    """
+    match = RANGE_RE.match(header or "")
+    if not match or match.group(1) == match.group(2) == "":
+        return None
+
+    first, last = match.groups()
+    if first == "":  # ✅ Suffix range: the last N bytes
+        if int(last) == 0 or size == 0:
+            return False
+        return max(size - int(last), 0), size - 1
+
+    start = int(first)
+    end = size - 1 if last == "" else min(int(last), size - 1)
+    if last != "" and int(last) < start:
+        return None
+    if start >= size:
+        return False
+    return start, end
+
+
+def ranged_file_response(request, file, content_type, filename=None, etag=None):
+    """
+    Streams an open file with its Content-Length, answering a single byte Range with 206
+    (so interrupted downloads resume and PDF viewers can fetch pages on demand).
+    An If-Range that does not match `etag` gets the whole file, as does any multi-range request.
+    """
+    size = os.fstat(file.fileno()).st_size
+    byte_range = None
+    if request.method in ("GET", "HEAD") and "Range" in request.headers:
+        if_range = request.headers.get("If-Range")
+        if not if_range or (etag and etag in parse_etags(if_range)):
+            byte_range = parse_byte_range(request.headers["Range"], size)
+
+    if byte_range is False:
+        file.close()
+        response = HttpResponse(status=416)
+        response["Content-Range"] = f"bytes */{size}"
+        return response
+
+    if byte_range:
+        start, end = byte_range
+        response = FileResponse(FileRange(file, start, end - start + 1), status=206, content_type=content_type)
+        response["Content-Range"] = f"bytes {start}-{end}/{size}"
+        response["Content-Length"] = end - start + 1
+    else:
+        response = FileResponse(file, content_type=content_type)
+        response["Content-Length"] = size
+
+    response["Accept-Ranges"] = "bytes"
+    if filename:
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    if etag:
+        response["ETag"] = etag
+    return response
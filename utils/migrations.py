@@ -0,0 +1,86 @@
+# utils/migrations.py
+from django.db import NotSupportedError
+from django.db.migrations.operations import AddIndex, RemoveIndex
+
+
+class AddIndexConcurrently(AddIndex):
+    """
+    AddIndex that builds the index with CREATE INDEX CONCURRENTLY on PostgreSQL,
+    so writes to the table are not blocked while it is built.
+    Other databases get a plain CREATE INDEX.
+    Migrations using it must set `atomic = False`.
+    """
+
+    def describe(self):
+        return f"Concurrently create index {self.index.name} on {self.model_name}"
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != "postgresql":
+            return super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+        self._ensure_not_in_transaction(schema_editor)
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            schema_editor.add_index(model, self.index, concurrently=True)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != "postgresql":
+            return super().database_backwards(app_label, schema_editor, from_state, to_state)
+
+        self._ensure_not_in_transaction(schema_editor)
+        model = from_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            schema_editor.remove_index(model, self.index, concurrently=True)
+
+    @staticmethod
+    def _ensure_not_in_transaction(schema_editor):
+        if schema_editor.connection.in_atomic_block:
+            raise NotSupportedError(
+                "AddIndexConcurrently cannot run inside a transaction; set `atomic = False` on the migration."
+            )
+
+
+class RemoveIndexConcurrently(RemoveIndex):
+    """
+    RemoveIndex that drops the index with DROP INDEX CONCURRENTLY on PostgreSQL.
+    Other databases get a plain DROP INDEX.
+    Migrations using it must set `atomic = False`.
+    """
+
+    def describe(self):
+        return f"Concurrently remove index {self.name} from {self.model_name}"
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != "postgresql":
+            return super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+        AddIndexConcurrently._ensure_not_in_transaction(schema_editor)
+        model = from_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            index = from_state.models[app_label, self.model_name_lower].get_index_by_name(self.name)
+            schema_editor.remove_index(model, index, concurrently=True)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != "postgresql":
+            return super().database_backwards(app_label, schema_editor, from_state, to_state)
+
+        AddIndexConcurrently._ensure_not_in_transaction(schema_editor)
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            index = to_state.models[app_label, self.model_name_lower].get_index_by_name(self.name)
+            schema_editor.add_index(model, index, concurrently=True)
+
+
+class AddPostgresIndexConcurrently(AddIndexConcurrently):
+    """
+    AddIndexConcurrently for PostgreSQL-only index types (GIN, GiST, ...).
+    Other databases skip it; they search through their own structures instead.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
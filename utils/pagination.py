@@ -0,0 +1,27 @@
+# utils/pagination.py
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from datetime import datetime
+
+
+def encode_keyset_cursor(value, pk):
+    """
+    Encodes a (sort value, pk) keyset position as an opaque, URL-safe cursor.
+    Datetimes are stored in ISO format, anything else as its string form.
+    """
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    return urlsafe_b64encode(f"{value}|{pk}".encode()).decode()
+
+
+def decode_keyset_cursor(cursor, parse=datetime.fromisoformat):
+    """
+    Decodes a cursor made by `encode_keyset_cursor()` back into (sort value, pk);
+    `parse` turns the stored string back into the sort value (a datetime by default).
+    Raises ValueError for a malformed cursor.
+    """
+    try:
+        value, pk = urlsafe_b64decode(cursor.encode()).decode().rsplit("|", 1)
+        return parse(value), int(pk)
+    except (BinasciiError, UnicodeError, ValueError):
+        raise ValueError("Invalid cursor.")